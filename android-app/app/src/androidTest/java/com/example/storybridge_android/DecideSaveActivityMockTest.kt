@@ -86,6 +86,8 @@ class DecideSaveActivityMockTest {
                 return Result.failure(Exception("unused"))
             }
 
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
             override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
                 return Result.failure(Exception("unused"))
             }
@@ -144,6 +146,8 @@ class DecideSaveActivityMockTest {
                 return Result.failure(Exception("unused"))
             }
 
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
             override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
                 return Result.success(DiscardSessionResponse("discarded"))
             }
@@ -202,6 +206,8 @@ class DecideSaveActivityMockTest {
                 return Result.failure(Exception("unused"))
             }
 
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
             override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
                 return Result.failure(Exception("DISCARD FAIL"))
             }
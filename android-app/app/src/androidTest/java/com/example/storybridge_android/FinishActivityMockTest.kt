@@ -50,6 +50,7 @@ class FinishActivityMockTest {
                 )
             )
             override suspend fun reloadAllSession(userId: String, startedAt: String) = Result.failure<ReloadAllSessionResponse>(Exception("unused"))
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
             override suspend fun discardSession(sessionId: String) = Result.failure<DiscardSessionResponse>(Exception("unused"))
 
             // 💡 WordPickerResponse 형태로 수정
@@ -142,6 +143,7 @@ class FinishActivityMockTest {
                 )
             )
             override suspend fun reloadAllSession(userId: String, startedAt: String) = Result.failure<ReloadAllSessionResponse>(Exception("unused"))
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
             override suspend fun discardSession(sessionId: String) = Result.failure<DiscardSessionResponse>(Exception("unused"))
             override suspend fun pickWords(
                 sessionId: String,
@@ -176,6 +178,7 @@ class FinishActivityMockTest {
                 )
             )
             override suspend fun reloadAllSession(userId: String, startedAt: String) = Result.failure<ReloadAllSessionResponse>(Exception("unused"))
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
             override suspend fun discardSession(sessionId: String) = Result.failure<DiscardSessionResponse>(Exception("unused"))
             override suspend fun pickWords(
                 sessionId: String,
@@ -210,6 +213,7 @@ class FinishActivityMockTest {
                 )
             )
             override suspend fun reloadAllSession(userId: String, startedAt: String) = Result.failure<ReloadAllSessionResponse>(Exception("unused"))
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
             override suspend fun discardSession(sessionId: String) = Result.failure<DiscardSessionResponse>(Exception("unused"))
             override suspend fun pickWords(
                 sessionId: String,
@@ -296,6 +300,7 @@ class FinishActivityMockTest {
             override suspend fun selectVoice(sessionId: String, voiceStyle: String) = Result.failure<SelectVoiceResponse>(Exception("unused"))
             override suspend fun endSession(sessionId: String) = Result.success(EndSessionResponse("S1", "2025-01-01", 5))
             override suspend fun reloadAllSession(userId: String, startedAt: String) = Result.failure<ReloadAllSessionResponse>(Exception("unused"))
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
             override suspend fun discardSession(sessionId: String) = Result.failure<DiscardSessionResponse>(Exception("unused"))
         }
         ServiceLocator.sessionRepository = mockSessionRepo
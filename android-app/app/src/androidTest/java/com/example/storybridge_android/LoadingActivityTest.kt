@@ -43,6 +43,7 @@ class LoadingActivityTest {
         coEvery { mockProcessRepo.checkTtsStatus(any(), any()) } returns Result.failure(Exception("Mock"))
         coEvery { mockUserRepo.getUserInfo(any()) } returns Response.success(emptyList())
         coEvery { mockSessionRepo.reloadAllSession(any(), any()) } returns Result.failure(Exception("Mock"))
+        coEvery { mockSessionRepo.syncSession(any(), any(), any()) } returns Result.failure(Exception("Mock"))
 
         // Mock ServiceLocator to return test repositories
         mockkObject(ServiceLocator)
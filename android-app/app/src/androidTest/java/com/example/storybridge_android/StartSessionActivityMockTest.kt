@@ -17,6 +17,7 @@ import com.example.storybridge_android.network.EndSessionResponse
 import com.example.storybridge_android.network.ReloadAllSessionResponse
 import com.example.storybridge_android.network.SelectVoiceResponse
 import com.example.storybridge_android.network.SessionStatsResponse
+import com.example.storybridge_android.network.SessionSyncResponse
 import com.example.storybridge_android.network.StartSessionResponse
 import com.example.storybridge_android.network.WordPickerResponse
 import com.example.storybridge_android.ui.session.start.StartSessionActivity
@@ -81,6 +82,8 @@ class StartSessionActivityMockTest {
                 return Result.failure(Exception("unused"))
             }
 
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
             override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
                 return Result.failure(Exception("unused"))
             }
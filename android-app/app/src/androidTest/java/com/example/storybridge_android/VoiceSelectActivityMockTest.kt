@@ -68,6 +68,8 @@ class VoiceSelectActivityTest {
             override suspend fun reloadAllSession(userId: String, startedAt: String) =
                 Result.failure<ReloadAllSessionResponse>(Exception("unused"))
 
+            override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
             override suspend fun discardSession(sessionId: String) =
                 Result.failure<DiscardSessionResponse>(Exception("unused"))
 
@@ -8,6 +8,11 @@ interface SessionRepository {
     suspend fun endSession(sessionId: String): Result<EndSessionResponse>
     suspend fun getSessionStats(sessionId: String): Result<SessionStatsResponse>
     suspend fun reloadAllSession(userId: String, startedAt: String): Result<ReloadAllSessionResponse>
+    suspend fun syncSession(
+        sessionId: String,
+        since: String?,
+        resume: Boolean = false
+    ): Result<SessionSyncResponse>
     suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse>
     suspend fun pickWords(sessionId: String, lang: String): Result<WordPickerResponse>
 }
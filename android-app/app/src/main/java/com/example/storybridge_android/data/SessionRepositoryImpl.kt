@@ -74,6 +74,23 @@ class SessionRepositoryImpl : SessionRepository {
             }
         }
 
+    override suspend fun syncSession(
+        sessionId: String,
+        since: String?,
+        resume: Boolean
+    ): Result<SessionSyncResponse> =
+        withContext(Dispatchers.IO) {
+            try {
+                val res = RetrofitClient.sessionApi.syncSession(sessionId, since, resume)
+                if (res.isSuccessful && res.body() != null)
+                    Result.success(res.body()!!)
+                else
+                    Result.failure(Exception("Sync session failed: ${res.code()}"))
+            } catch (e: Exception) {
+                Result.failure(e)
+            }
+        }
+
     override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> =
         withContext(Dispatchers.IO) {
             try {
@@ -0,0 +1,25 @@
+package com.example.storybridge_android.data
+
+import android.content.Context
+import android.content.SharedPreferences
+import androidx.core.content.edit
+
+// Last /session/sync token per session, sent back as `since` on resume
+object SessionSyncStore {
+
+    private const val PREFS_NAME = "SessionSync"
+
+    private fun prefs(context: Context): SharedPreferences? {
+        val ctx = context.applicationContext ?: context
+        return ctx.getSharedPreferences(PREFS_NAME, Context.MODE_PRIVATE)
+    }
+
+    fun getToken(context: Context, sessionId: String): String? =
+        prefs(context)?.getString(sessionId, null)
+
+    fun setToken(context: Context, sessionId: String, token: String) {
+        prefs(context)?.edit {
+            putString(sessionId, token)
+        }
+    }
+}
@@ -47,7 +47,8 @@ data class UploadImageResponse(
     val session_id: String,
     val page_index: Int,
     val status: String,
-    val submitted_at: String
+    val submitted_at: String,
+    val page_budget_seconds: Int? = null  // page is ready (or discarded) by then
 )
 
 data class UploadCoverResponse(
@@ -62,7 +63,7 @@ data class UploadCoverResponse(
 data class CheckOcrResponse(
     val session_id: String,
     val page_index: Int,
-    val status: String,           // "pending", "processing", "ready"
+    val status: String,           // "queued", "ocr", "translating", "ready", "failed"
     val progress: Int,            // 0-100
     val submitted_at: String,
     val processed_at: String?     // nullable, if not ready
@@ -34,6 +34,13 @@ interface SessionApi {
         @Query("started_at") startedAt: String
     ): Response<ReloadAllSessionResponse>
 
+    @GET("/session/sync")
+    suspend fun syncSession(
+        @Query("session_id") sessionId: String,
+        @Query("since") since: String?,
+        @Query("resume") resume: Boolean
+    ): Response<SessionSyncResponse>
+
     @POST("/session/discard")
     suspend fun discardSession(
         @Body request: DiscardSessionRequest
@@ -104,6 +111,25 @@ data class ReloadedPage(
     val ocr_results: List<OcrBox>?
 )
 
+// Pages whose hashes differ from the locally cached ones need refetching
+data class SessionSyncResponse(
+    val session_id: String,
+    val sync_token: String,
+    val full: Boolean,
+    val total_pages: Int,
+    val pages: List<SyncedPage>,
+    val removed: List<Int>
+)
+
+data class SyncedPage(
+    val page_index: Int,
+    val status: String,
+    val version: Int,
+    val image_url: String?,
+    val ocr_hash: String?,
+    val audio_hash: String?
+)
+
 data class DiscardSessionRequest(
     val session_id: String
 )
@@ -69,7 +69,11 @@ class LoadingActivity : BaseActivity() {
                     val sessions = response.body() ?: return@collectLatest
                     val match = sessions.find { it.started_at == startedAt }
                     if (match != null) {
-                        viewModel.reloadAllSession(match.started_at, this@LoadingActivity)
+                        viewModel.reloadAllSession(
+                            match.started_at,
+                            this@LoadingActivity,
+                            match.session_id
+                        )
                     } else {
                         showError(getString(R.string.error_session_not_found))
                     }
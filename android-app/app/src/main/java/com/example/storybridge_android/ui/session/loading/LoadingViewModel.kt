@@ -31,6 +31,15 @@ class LoadingViewModel(
     private val dispatcher: CoroutineDispatcher = Dispatchers.Main
 ) : ViewModel() {
 
+    companion object {
+        private const val OCR_POLL_INTERVAL_MS = 300L
+        // Server page budget (UPLOAD_DEADLINE_SECONDS - UPLOAD_TTS_RESERVE),
+        // used when the upload response does not report it
+        private const val DEFAULT_PAGE_BUDGET_S = 75
+        // Slack for the last status write and network latency
+        private const val OCR_POLL_MARGIN_MS = 5000L
+    }
+
     private val scope = viewModelScope + dispatcher
 
     // ========================================
@@ -67,11 +76,27 @@ class LoadingViewModel(
     }
 
     @SuppressLint("HardwareIds")
-    fun reloadAllSession(startedAt: String, context: Context) {
+    fun reloadAllSession(startedAt: String, context: Context, sessionId: String? = null) {
         scope.launch {
             _status.value = "reloading"
             startRampTo(100, 1000L)
 
+            // The sync manifest only carries page hashes, and nothing at all
+            // when the session is unchanged since the stored token
+            if (sessionId != null) {
+                val since = SessionSyncStore.getToken(context, sessionId)
+                val synced = sessionRepo.syncSession(sessionId, since, resume = true).getOrNull()
+                if (synced != null) {
+                    SessionSyncStore.setToken(context, sessionId, synced.sync_token)
+                    stopRamp()
+                    _progress.value = 100
+                    _navigateToReading.emit(
+                        SessionResumeResult(synced.session_id, 0, synced.total_pages)
+                    )
+                    return@launch
+                }
+            }
+
             val deviceInfo = Settings.Secure.getString(
                 context.contentResolver,
                 Settings.Secure.ANDROID_ID
@@ -141,7 +166,7 @@ class LoadingViewModel(
             val req = UploadImageRequest(sessionId, pageIndex, lang, base64)
             processRepo.uploadImage(req).fold(
                 onSuccess = {
-                    pollOcr(sessionId, it.page_index)
+                    pollOcr(sessionId, it.page_index, it.page_budget_seconds)
                 },
                 onFailure = {
                     _error.value = it.message
@@ -150,10 +175,14 @@ class LoadingViewModel(
         }
     }
 
-    private suspend fun pollOcr(sessionId: String, pageIndex: Int) {
+    private suspend fun pollOcr(sessionId: String, pageIndex: Int, pageBudgetSeconds: Int?) {
         _status.value = "polling"
 
-        repeat(60) { i ->
+        // Poll for as long as the server may take to publish the page
+        val budgetMs = ((pageBudgetSeconds ?: 0).takeIf { it > 0 } ?: DEFAULT_PAGE_BUDGET_S) * 1000L
+        val attempts = ((budgetMs + OCR_POLL_MARGIN_MS) / OCR_POLL_INTERVAL_MS).toInt()
+
+        repeat(attempts) { i ->
             val res = processRepo.checkOcrStatus(sessionId, pageIndex)
             var done = false
 
@@ -165,6 +194,9 @@ class LoadingViewModel(
                         }
                         _status.value = "ready"
                         done = true
+                    } else if (it.status == "failed") {
+                        _error.value = "Failed to process image"
+                        return@pollOcr
                     }
                 },
                 onFailure = {
@@ -174,7 +206,7 @@ class LoadingViewModel(
             )
             if (done) return
 
-            delay(300)
+            delay(OCR_POLL_INTERVAL_MS)
         }
 
         _error.value = "Timeout while waiting for OCR"
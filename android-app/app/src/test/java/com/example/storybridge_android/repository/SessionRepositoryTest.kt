@@ -180,6 +180,40 @@ class SessionRepositoryTest {
     }
 
 
+    @Test
+    fun syncSession_returnsDelta() = runBlocking {
+        val json = """
+            {
+                "session_id":"s123","sync_token":"0123456789abcdef","full":false,
+                "total_pages":2,
+                "pages":[
+                    {
+                        "page_index":1,"status":"ready","version":2,"image_url":"/page/get_image/?session_id=s123&page_index=1",
+                        "ocr_hash":"aaaaaaaaaaaaaaaa","audio_hash":null
+                    }
+                ],
+                "removed":[]
+            }
+        """
+        server.enqueue(MockResponse().setResponseCode(200).setBody(json))
+
+        val result = repository.syncSession("s123", "fedcba9876543210", resume = true)
+
+        assertTrue(result.isSuccess)
+        assertEquals(1, result.getOrNull()?.pages?.size)
+        assertEquals(
+            "/session/sync?session_id=s123&since=fedcba9876543210&resume=true",
+            server.takeRequest().path
+        )
+    }
+
+    @Test
+    fun syncSession_returnsFailureOnHttpError() = runBlocking {
+        server.enqueue(MockResponse().setResponseCode(404))
+        val result = repository.syncSession("s1", null)
+        assertTrue(result.isFailure)
+    }
+
     @Test
     fun discardSession_returnsParsedResponse() = runBlocking {
         val json = """{"message":"Session discarded successfully"}"""
@@ -8,6 +8,7 @@ import com.example.storybridge_android.network.EndSessionResponse
 import com.example.storybridge_android.network.ReloadAllSessionResponse
 import com.example.storybridge_android.network.SelectVoiceResponse
 import com.example.storybridge_android.network.SessionStatsResponse
+import com.example.storybridge_android.network.SessionSyncResponse
 import com.example.storybridge_android.network.StartSessionResponse
 import com.example.storybridge_android.data.ProcessRepository
 import com.example.storybridge_android.network.CheckOcrResponse
@@ -82,6 +83,8 @@ class CameraSessionViewModelTest {
             startedAt: String
         ) = Result.failure<ReloadAllSessionResponse>(NotImplementedError())
 
+        override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
         override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
             return Result.success(
                 DiscardSessionResponse(
@@ -314,6 +314,51 @@ class LoadingViewModelTest {
         unmockkStatic(android.util.Base64::class)
     }
 
+    @Test
+    fun `pollOcr stops with error when page processing failed`() = runTest {
+        // Given
+        mockkStatic(android.util.Base64::class)
+        mockkStatic(BitmapFactory::class)
+        mockkStatic(Bitmap::class)
+
+        val mockBitmap = mockk<Bitmap>(relaxed = true)
+        every { BitmapFactory.decodeFile(any()) } returns mockBitmap
+        every { Bitmap.createScaledBitmap(any(), any(), any(), any()) } returns mockBitmap
+        every { mockBitmap.width } returns 100
+        every { mockBitmap.height } returns 100
+        every { mockBitmap.recycle() } just Runs
+        every { mockBitmap.compress(any(), any(), any()) } returns true
+        every { android.util.Base64.encodeToString(any(), any()) } returns "base64string"
+
+        val uploadResponse = UploadImageResponse(
+            session_id = "session_123",
+            page_index = 1,
+            status = "queued",
+            submitted_at = "2023-01-01T00:00:00"
+        )
+        whenever(mockProcessRepo.uploadImage(any())).thenReturn(Result.success(uploadResponse))
+
+        val ocrResponse = CheckOcrResponse(
+            session_id = "session_123",
+            page_index = 1,
+            status = "failed",
+            progress = 100,
+            submitted_at = "2023-01-01T00:00:00",
+            processed_at = "2023-01-01T00:00:05"
+        )
+        whenever(mockProcessRepo.checkOcrStatus(any(), any())).thenReturn(Result.success(ocrResponse))
+
+        // When
+        viewModel.uploadImage("session_123", 1, "en", testImageFile.absolutePath)
+        advanceUntilIdle()
+
+        // Then
+        assertEquals("Failed to process image", viewModel.error.value)
+        verify(mockProcessRepo, times(1)).checkOcrStatus("session_123", 1)
+
+        unmockkStatic(android.util.Base64::class)
+    }
+
     @Test
     fun `pollOcr processes multiple attempts before ready`() = runTest {
         // Given
@@ -410,6 +455,66 @@ class LoadingViewModelTest {
         unmockkStatic(Settings.Secure::class)
     }
 
+    @Test
+    fun `reloadAllSession resumes from the sync manifest`() = runTest {
+        // Given
+        val startedAt = "2023-01-01T00:00:00"
+        val syncResponse = SessionSyncResponse(
+            session_id = "session_456",
+            sync_token = "0123456789abcdef",
+            full = false,
+            total_pages = 4,
+            pages = emptyList(),
+            removed = emptyList()
+        )
+
+        whenever(mockSessionRepo.syncSession(eq("session_456"), isNull(), eq(true)))
+            .thenReturn(Result.success(syncResponse))
+
+        // When
+        viewModel.reloadAllSession(startedAt, mockContext, "session_456")
+        advanceUntilIdle()
+
+        // Then
+        val result = viewModel.navigateToReading.value
+        assertNotNull(result)
+        assertEquals("session_456", result.session_id)
+        assertEquals(4, result.total_pages)
+        assertEquals(100, viewModel.progress.value)
+        verify(mockSessionRepo, never()).reloadAllSession(any(), any())
+    }
+
+    @Test
+    fun `reloadAllSession falls back when sync fails`() = runTest {
+        // Given
+        mockkStatic(Settings.Secure::class)
+        every {
+            Settings.Secure.getString(any(), Settings.Secure.ANDROID_ID)
+        } returns "test_device_id"
+
+        val startedAt = "2023-01-01T00:00:00"
+        val reloadResponse = ReloadAllSessionResponse(
+            session_id = "session_456",
+            started_at = startedAt,
+            pages = listOf(ReloadedPage(0, "img1.jpg", "text1", "audio1.mp3", null))
+        )
+
+        whenever(mockSessionRepo.syncSession(any(), anyOrNull(), any()))
+            .thenReturn(Result.failure(Exception("Network error")))
+        whenever(mockSessionRepo.reloadAllSession(any(), eq(startedAt)))
+            .thenReturn(Result.success(reloadResponse))
+
+        // When
+        viewModel.reloadAllSession(startedAt, mockContext, "session_456")
+        advanceUntilIdle()
+
+        // Then
+        assertEquals(1, viewModel.navigateToReading.value?.total_pages)
+        verify(mockSessionRepo).reloadAllSession(any(), eq(startedAt))
+
+        unmockkStatic(Settings.Secure::class)
+    }
+
     @Test
     fun `reloadAllSession handles failure`() = runTest {
         // Given
@@ -436,7 +541,7 @@ class LoadingViewModelTest {
     }
 
     @Test
-    fun `pollOcr timeout after 60 attempts sets error`() = runTest {
+    fun `pollOcr timeout follows the server page budget`() = runTest {
         // Given
         mockkStatic(android.util.Base64::class)
         mockkStatic(BitmapFactory::class)
@@ -454,8 +559,9 @@ class LoadingViewModelTest {
         val uploadResponse = UploadImageResponse(
             session_id = "session_123",
             page_index = 1,
-            status = "pending",
-            submitted_at = "2023-01-01T00:00:00"
+            status = "queued",
+            submitted_at = "2023-01-01T00:00:00",
+            page_budget_seconds = 13
         )
         whenever(mockProcessRepo.uploadImage(any())).thenReturn(Result.success(uploadResponse))
 
@@ -476,6 +582,7 @@ class LoadingViewModelTest {
 
         // Then
         assertEquals("Timeout while waiting for OCR", viewModel.error.value)
+        // (13 s budget + 5 s margin) / 300 ms
         verify(mockProcessRepo, times(60)).checkOcrStatus("session_123", 1)
 
         unmockkStatic(android.util.Base64::class)
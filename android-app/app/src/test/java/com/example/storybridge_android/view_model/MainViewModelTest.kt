@@ -142,6 +142,8 @@ class MainViewModelTest {
             )
         }
 
+        override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
+
         override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
             return if (discardSuccess) {
                 Result.success(DiscardSessionResponse("deleted"))
@@ -189,6 +191,7 @@ class MainViewModelTest {
         ): Result<ReloadAllSessionResponse> {
             throw RuntimeException("boom")
         }
+        override suspend fun syncSession(sessionId: String, since: String?, resume: Boolean) = Result.failure<SessionSyncResponse>(Exception("unused"))
         override suspend fun discardSession(sessionId: String): Result<DiscardSessionResponse> {
             throw RuntimeException("boom")
         }
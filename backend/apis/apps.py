@@ -10,7 +10,10 @@ class ApisConfig(AppConfig):
         Load profanity lists when Django app is ready.
         This ensures profanity lists are loaded for all Django contexts
         (runserver, shell, tests, etc.)
+        The compiled snapshot is mapped instead when it is up to date.
         """
+        from django.conf import settings
+
         from .modules.profanity_check import load_profanity_lists
 
-        load_profanity_lists()
+        load_profanity_lists(index_path=settings.PROFANITY_INDEX_PATH)
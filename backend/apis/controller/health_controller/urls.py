@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import ReadinessView
+
+urlpatterns = [
+    path("ready", ReadinessView.as_view()),
+]
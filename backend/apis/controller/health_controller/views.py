@@ -0,0 +1,50 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from apis.modules import startup
+
+
+class ReadinessView(APIView):
+    """
+    Whether this worker finished its warm-up (apis.modules.startup)
+
+    [GET] /healthz/ready
+
+    Starts the warm-up when no gunicorn hook ran it (runserver) and retries
+    a failed one. boot_id / booted_at identify the worker process, so a
+    deploy can wait for a worker that booted after its reload.
+
+    Response (200 OK, or 503 Service Unavailable until every step succeeded):
+        {
+            "status": "ready" | "warming_up" | "failed",
+            "boot_id": "3f2b...",
+            "booted_at": 1767225600.12,
+            "steps": {
+                "imports": {"seconds": 1.52, "error": null},
+                "connections": {"seconds": 0.21, "error": "ConnectError: ..."}
+            }
+        }
+    """
+
+    def get(self, request):
+        startup.ensure_warm_up()
+        state = startup.status()
+        if state["ready"]:
+            label = "ready"
+        elif state["running"]:
+            label = "warming_up"
+        else:
+            label = "failed"
+        return Response(
+            {
+                "status": label,
+                "boot_id": state["boot_id"],
+                "booted_at": state["booted_at"],
+                "steps": state["steps"],
+            },
+            status=(
+                status.HTTP_200_OK
+                if state["ready"]
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
+        )
@@ -1,8 +1,18 @@
 from django.urls import path
-from .views import PageGetImageView, PageGetOCRView, PageGetTTSView
+from .views import (
+    PageGetImageView,
+    PageGetOCRView,
+    PageGetTTSView,
+    PageImageView,
+    PageAudioView,
+    PageCacheStatsView,
+)
 
 urlpatterns = [
     path("get_image/", PageGetImageView.as_view()),
     path("get_ocr/", PageGetOCRView.as_view()),
     path("get_tts/", PageGetTTSView.as_view()),
+    path("image/", PageImageView.as_view()),
+    path("audio/", PageAudioView.as_view()),
+    path("cache_stats/", PageCacheStatsView.as_view()),
 ]
@@ -1,13 +1,17 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
 from apis.models.page_model import Page
+from apis.modules.file_serving import audio_clip_path, serve_file
+from apis.modules import page_payloads, response_cache
+from apis.modules.response_cache import CachedPageReadMixin
 import base64
 import os
 import json
 
 
-class PageGetImageView(APIView):
+class PageGetImageView(CachedPageReadMixin, APIView):
     """
     Retrieve page image as base64
 
@@ -24,8 +28,13 @@ class PageGetImageView(APIView):
             "image_base64": "string",
             "stored_at": "datetime"
         }
+
+    With Accept: application/msgpack, image_base64 carries raw bytes.
     """
 
+    binary_fields = ("image_base64",)
+    cache_endpoint = "get_image"
+
     def get(self, request):
         session_id = request.query_params.get("session_id")
         page_index = request.query_params.get("page_index")
@@ -33,9 +42,13 @@ class PageGetImageView(APIView):
         if not session_id or page_index is None:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
+        cached = self.cached_response(request)
+        if cached is not None:
+            return cached
+
         try:
             pages = Page.objects.filter(session__id=session_id)
-            page = pages.order_by("id")[int(page_index)]
+            page = pages.get(page_index=int(page_index))
             img_path = page.img_url
 
             if not img_path or not os.path.exists(img_path):
@@ -45,6 +58,9 @@ class PageGetImageView(APIView):
                 encoded = base64.b64encode(img_file.read())
                 img_base64 = encoded.decode("utf-8")
 
+            # The stored image never changes once uploaded
+            self.cache_response = True
+
             return Response(
                 {
                     "session_id": session_id,
@@ -63,7 +79,7 @@ class PageGetImageView(APIView):
             )
 
 
-class PageGetOCRView(APIView):
+class PageGetOCRView(CachedPageReadMixin, APIView):
     """
     Retrieve OCR results with bounding boxes and translations
 
@@ -88,26 +104,27 @@ class PageGetOCRView(APIView):
         }
     """
 
+    cache_endpoint = "get_ocr"
+
     def get(self, request):
         session_id = request.query_params.get("session_id")
         page_index = request.query_params.get("page_index")
         if not session_id or page_index is None:
             return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        cached = self.cached_response(request)
+        if cached is not None:
+            return cached
         try:
             pages = Page.objects.filter(session_id=session_id)
-            page = pages.order_by("id")[int(page_index)]
+            page = pages.get(page_index=int(page_index))
 
-            bbs = page.getBBs()
-
-            ocr_results = []
-            for bb in bbs:
-                ocr_results.append(
-                    {
-                        "bbox": bb.coordinates,
-                        "original_txt": bb.original_text,
-                        "translation_txt": bb.translated_text,
-                    }
-                )
+            ocr_results = page_payloads.ocr_results(page)
+            # A ready page may still get translations from its TTS job
+            self.cache_response = (
+                page.status == "ready"
+                and not page_payloads.has_pending_translations(page)
+            )
 
             return Response(
                 {
@@ -127,7 +144,7 @@ class PageGetOCRView(APIView):
             )
 
 
-class PageGetTTSView(APIView):
+class PageGetTTSView(CachedPageReadMixin, APIView):
     """
     Retrieve TTS audio data for a page
 
@@ -149,8 +166,13 @@ class PageGetTTSView(APIView):
             ],
             "generated_at": "datetime"
         }
+
+    With Accept: application/msgpack, audio_base64_list carries raw bytes.
     """
 
+    binary_fields = ("audio_base64_list",)
+    cache_endpoint = "get_tts"
+
     def get(self, request):
         session_id = request.query_params.get("session_id")
         page_index = request.query_params.get("page_index")
@@ -158,24 +180,15 @@ class PageGetTTSView(APIView):
         if not session_id or page_index is None:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
+        cached = self.cached_response(request)
+        if cached is not None:
+            return cached
+
         try:
             pages = Page.objects.filter(session__id=session_id)
-            page = pages.order_by("id")[int(page_index)]
-            bbs = page.getBBs()
-
-            audio_results = []
-            for i, bb in enumerate(bbs):
-                audio_list = (
-                    json.loads(bb.audio_base64)
-                    if isinstance(bb.audio_base64, str)
-                    else bb.audio_base64
-                )
-
-                # Only include boxes that have audio
-                if audio_list and len(audio_list) > 0:
-                    audio_results.append(
-                        {"bbox_index": i, "audio_base64_list": audio_list}
-                    )
+            page = pages.get(page_index=int(page_index))
+            audio_results, tts_final = page_payloads.audio_results(page)
+            self.cache_response = tts_final
 
             return Response(
                 {
@@ -193,3 +206,149 @@ class PageGetTTSView(APIView):
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class _BinaryFileView(APIView):
+    """
+    Base class for endpoints that return raw bytes instead of JSON.
+    Content negotiation is forced so that Accept headers such as
+    "image/*" or "audio/*" do not trigger 406 responses.
+    """
+
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+
+class PageImageView(_BinaryFileView):
+    """
+    Stream page image as binary (no base64 / JSON wrapping)
+
+    [GET] /page/image?session_id={session_id}&page_index={page_index}
+
+    Query Parameters:
+        session_id: Session identifier
+        page_index: Page number
+
+    Request Headers (optional):
+        If-None-Match: ETag from a previous response
+        Range: bytes={start}-{end}
+
+    Response:
+        200 OK: image/jpeg body with ETag and Accept-Ranges
+        206 Partial Content: requested byte range
+        304 Not Modified: ETag matched
+    """
+
+    def get(self, request):
+        session_id = request.query_params.get("session_id")
+        page_index = request.query_params.get("page_index")
+
+        if not session_id or page_index is None:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page_index = int(page_index)
+        except ValueError:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        if page_index < 0:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            pages = Page.objects.filter(session__id=session_id)
+            page = pages.get(page_index=page_index)
+            img_path = page.img_url
+
+            if not img_path or not os.path.exists(img_path):
+                return Response(status=status.HTTP_404_NOT_FOUND)
+
+            return serve_file(request, img_path, "image/jpeg")
+
+        except (Page.DoesNotExist, IndexError):
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class PageAudioView(_BinaryFileView):
+    """
+    Stream a single sentence audio clip as binary mp3
+
+    [GET] /page/audio?session_id={session_id}&page_index={page_index}
+        &bbox_index={bbox_index}&clip_index={clip_index}
+
+    Query Parameters:
+        session_id: Session identifier
+        page_index: Page number
+        bbox_index: Bounding box index within the page
+        clip_index: Sentence clip index within the bounding box
+
+    Request Headers (optional):
+        If-None-Match: ETag from a previous response
+        Range: bytes={start}-{end}
+
+    Response:
+        200 OK: audio/mpeg body with ETag and Accept-Ranges
+        206 Partial Content: requested byte range
+        304 Not Modified: ETag matched
+    """
+
+    def get(self, request):
+        session_id = request.query_params.get("session_id")
+        page_index = request.query_params.get("page_index")
+        bbox_index = request.query_params.get("bbox_index")
+        clip_index = request.query_params.get("clip_index")
+
+        if not session_id or None in (page_index, bbox_index, clip_index):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            pages = Page.objects.filter(session__id=session_id)
+            page = pages.get(page_index=int(page_index))
+            bb = page.getBBs().order_by("id")[int(bbox_index)]
+
+            audio_list = (
+                json.loads(bb.audio_base64)
+                if isinstance(bb.audio_base64, str)
+                else bb.audio_base64
+            )
+            clip = audio_list[int(clip_index)] if audio_list else None
+            if not clip or int(clip_index) < 0:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+
+            clip_path, etag = audio_clip_path(clip)
+            return serve_file(request, clip_path, "audio/mpeg", etag=etag)
+
+        except (Page.DoesNotExist, IndexError):
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        except ValueError:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class PageCacheStatsView(APIView):
+    """
+    Response cache hit ratios of this worker process
+
+    [GET] /page/cache_stats
+
+    Response (200 OK):
+        {
+            "backend": "file",
+            "endpoints": {
+                "get_ocr": {"hits": 0, "misses": 0, "hit_ratio": 0.0}
+            }
+        }
+    """
+
+    def get(self, request):
+        return Response(
+            {
+                "backend": settings.RESPONSE_CACHE_BACKEND,
+                "endpoints": response_cache.stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,477 @@
+"""
+Native async counterparts of the process controller upload views.
+
+Under ASGI (uvicorn workers) these await Clova and OpenAI directly on the
+worker's event loop, so one worker holds many in-flight requests instead
+of one per thread. Page uploads are the exception: like the sync view,
+they store the image and hand OCR and translation to a background job.
+Provider clients are shared per loop (see
+apis.modules.provider_clients). ORM work goes through the async ORM or
+sync_to_async; file I/O runs in the default thread pool.
+
+They also work under WSGI, where Django runs each request on its own
+short-lived event loop; the loop's provider clients are closed when the
+request ends. The progress stream is the exception: it needs an ASGI
+worker to stay open without holding a thread, and answers 501 under WSGI.
+"""
+
+import asyncio
+import binascii
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.files import File
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views import View
+
+from apis.models.session_model import Session
+from apis.models.page_model import Page
+from apis.models.bb_model import BB
+from apis.modules.ocr_processor import OCRModule
+from apis.modules.provider_clients import (
+    aclose_clients,
+    get_tts_module,
+    get_word_picker,
+)
+from apis.modules.image_store import save_image_base64, save_image_file
+from apis.modules import progress_events
+from apis.controller.process_controller.views import (
+    _create_page_and_bbs,
+    _enqueue_page,
+)
+
+LANG_MAP = {"en": "English", "zh": "Chinese", "vi": "Vietnamese"}
+
+
+def _read_upload(request):
+    """
+    Extract upload fields from any supported encoding
+    (same contract as the sync views).
+
+    Returns:
+        (session_id, lang, image_base64, image_file) or None for a
+        malformed JSON body
+    """
+    content_type = request.content_type or ""
+    session_id = request.GET.get("session_id")
+    lang = request.GET.get("lang")
+    image_base64, image_file = None, None
+
+    if content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        session_id = data.get("session_id") or session_id
+        lang = data.get("lang") or lang
+        image_base64 = data.get("image_base64")
+    elif content_type.startswith("multipart/") or content_type.startswith(
+        "application/x-www-form-urlencoded"
+    ):
+        session_id = request.POST.get("session_id") or session_id
+        lang = request.POST.get("lang") or lang
+        image_base64 = request.POST.get("image_base64")
+        image_file = request.FILES.get("image") or request.FILES.get("file")
+    elif content_type.startswith("image/") or content_type == (
+        "application/octet-stream"
+    ):
+        # Stream the raw body to disk instead of materializing it
+        image_file = File(request, name="upload")
+
+    return session_id, lang, image_base64, image_file
+
+
+async def _save_image(image_base64, image_file, session_id, page_index) -> str:
+    """Write the uploaded image to disk off the event loop."""
+    if image_file is not None:
+        image_path, _ = await asyncio.to_thread(
+            save_image_file, image_file, session_id, page_index
+        )
+    else:
+        image_path, _ = await asyncio.to_thread(
+            save_image_base64, image_base64, session_id, page_index
+        )
+    return image_path
+
+
+async def _get_session(session_id):
+    try:
+        return await Session.objects.aget(id=session_id)
+    except Session.DoesNotExist:
+        return None
+
+
+def _unprocessable_image():
+    return JsonResponse(
+        {"error_code": 422, "message": "PROCESS__UNABLE_TO_PROCESS_IMAGE"},
+        status=422,
+    )
+
+
+class _AsyncView(View):
+    """
+    Base class of the async views. Under WSGI the request's event loop is
+    discarded with the response, so the provider clients cached for it
+    are closed first.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        finally:
+            if not isinstance(request, ASGIRequest):
+                await aclose_clients()
+
+
+class AsyncProcessUploadView(_AsyncView):
+    """
+    Async version of ProcessUploadView
+
+    [POST] /process/async/upload
+
+    Request / Response: same as [POST] /process/upload. The image is
+    stored without blocking the loop; OCR and translation run in the same
+    background job, under the same upload deadline, as the sync view.
+    """
+
+    async def post(self, request):
+        # Validate request
+        upload = _read_upload(request)
+        if upload is None:
+            return HttpResponse(status=400)
+        session_id, lang, image_base64, image_file = upload
+
+        if not all([session_id, lang]) or not (image_base64 or image_file):
+            return HttpResponse(status=400)
+
+        session = await _get_session(session_id)
+        if session is None:
+            return HttpResponse(status=404)
+
+        page_index = await sync_to_async(session.nextPageIndex)()
+
+        # Save image and reserve the page index right away
+        try:
+            image_path = await _save_image(
+                image_base64, image_file, session_id, page_index
+            )
+        except binascii.Error:
+            return HttpResponse(status=400)
+        page, deadline = await sync_to_async(_enqueue_page)(
+            session, image_path, page_index, lang
+        )
+
+        return JsonResponse(
+            {
+                "session_id": session_id,
+                "page_index": page.page_index,
+                "status": page.status,
+                "submitted_at": page.created_at,
+                "page_budget_seconds": round(deadline.page_budget().seconds),
+            },
+            status=202,
+        )
+
+
+class AsyncProcessUploadCoverView(_AsyncView):
+    """
+    Async version of ProcessUploadCoverView
+
+    [POST] /process/async/upload_cover
+
+    Request / Response: same as [POST] /process/upload_cover
+    """
+
+    async def post(self, request):
+        upload = _read_upload(request)
+        if upload is None:
+            return HttpResponse(status=400)
+        session_id, lang, image_base64, image_file = upload
+
+        if not all([session_id, lang]) or not (image_base64 or image_file):
+            return HttpResponse(status=400)
+
+        session = await _get_session(session_id)
+        if session is None:
+            return HttpResponse(status=404)
+
+        page_index = 0
+
+        # Save cover image
+        try:
+            image_path = await _save_image(
+                image_base64, image_file, session_id, page_index
+            )
+        except binascii.Error:
+            return HttpResponse(status=400)
+
+        # Run OCR to get title
+        title = await OCRModule().aprocess_cover_page(image_path)
+        print(f"[DEBUG] OCR Result for cover: {title}")
+        if not title:
+            return _unprocessable_image()
+
+        target_lang = LANG_MAP.get(lang, "English")
+        try:
+            translated_text = await get_tts_module(target_lang).translate_cover(
+                title, session_id, page_index
+            )
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+            translated_text = ""
+
+        await sync_to_async(_create_page_and_bbs)(
+            session,
+            image_path,
+            [{"text": title}],
+            [{"status": "ok", "sentences": [{"translation": translated_text}]}],
+        )
+
+        session.title = title
+        session.translated_title = translated_text
+        session.totalPages += 1
+        await session.asave(update_fields=["title", "translated_title", "totalPages"])
+
+        return JsonResponse(
+            {
+                "session_id": session_id,
+                "page_index": page_index,
+                "status": "ready",
+                "submitted_at": timezone.now().isoformat(),
+                "title": session.title,
+                "translated_title": session.translated_title,
+            }
+        )
+
+
+class AsyncProcessWordPickerView(_AsyncView):
+    """
+    Async version of ProcessWordPickerView
+
+    [POST] /process/async/word_picker
+
+    Request / Response: same as [POST] /process/word_picker
+    """
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            data = {}
+        session_id = data.get("session_id") if isinstance(data, dict) else None
+        if not session_id:
+            return JsonResponse({"error": "session_id_required"}, status=400)
+
+        session = await _get_session(session_id)
+        if session is None:
+            return JsonResponse({"error": "session_not_found"}, status=404)
+
+        cover_id = (
+            await Page.objects.filter(session=session)
+            .exclude(page_index=None)
+            .order_by("page_index")
+            .values_list("id", flat=True)
+            .afirst()
+        )
+        if cover_id is None:
+            return JsonResponse(
+                {"session_id": session_id, "status": "no_pages", "items": []}
+            )
+
+        # Translated text of every page except the cover, in reading order
+        texts = (
+            BB.objects.filter(page__session=session)
+            .exclude(page_id=cover_id)
+            .order_by("page__page_index", "id")
+            .values_list("translated_text", flat=True)
+        )
+        full_text = " ".join(
+            [txt.strip() async for txt in texts if txt and txt.strip()]
+        ).strip()
+
+        # If less than 20 words, return no_words
+        if len(full_text.split()) <= 20:
+            return JsonResponse(
+                {"session_id": session_id, "status": "no_words", "items": []}
+            )
+
+        result = await get_word_picker().apick_words(full_text)
+
+        return JsonResponse(
+            {
+                "session_id": session_id,
+                "status": result.get("status"),
+                "items": result.get("items", []),
+            }
+        )
+
+
+TERMINAL_STATUSES = ("ready", "failed")
+
+
+def _progress_snapshot(session_id) -> list:
+    """
+    Stage of every page and TTS status of every BB in a session, in page
+    order. Only status columns are read, never audio.
+    """
+    pages = list(
+        Page.objects.filter(session_id=session_id)
+        .exclude(page_index=None)
+        .order_by("page_index")
+        .values_list("id", "page_index", "status", "progress")
+    )
+    bbs_by_page = {}
+    bb_rows = (
+        BB.objects.filter(page__session_id=session_id)
+        .order_by("page_id", "id")
+        .values_list("page_id", "tts_status")
+    )
+    for page_id, tts_status in bb_rows:
+        bbs_by_page.setdefault(page_id, []).append(tts_status)
+
+    return [
+        {
+            "page_index": page_index,
+            "status": page_status,
+            "progress": progress,
+            "bbs": bbs_by_page.get(page_id, []),
+        }
+        for page_id, page_index, page_status, progress in pages
+    ]
+
+
+def _progress_changes(old: list, new: list) -> list:
+    """Events for every page stage and BB status that differs from old."""
+    events = []
+    old_pages = {page["page_index"]: page for page in old}
+    for page in new:
+        i = page["page_index"]
+        before = old_pages.get(i)
+        if before is None or (before["status"], before["progress"]) != (
+            page["status"],
+            page["progress"],
+        ):
+            events.append(
+                (
+                    "page",
+                    {
+                        "page_index": i,
+                        "status": page["status"],
+                        "progress": page["progress"],
+                    },
+                )
+            )
+        old_bbs = before["bbs"] if before else []
+        for j, tts_status in enumerate(page["bbs"]):
+            if j >= len(old_bbs) or old_bbs[j] != tts_status:
+                events.append(
+                    ("bb", {"page_index": i, "bbox_index": j, "tts_status": tts_status})
+                )
+    return events
+
+
+def _is_finished(snapshot: list) -> bool:
+    """
+    True once every page is processed and every BB has its audio (or
+    failed). The cover (page 0) never gets TTS, so its BBs are ignored.
+    """
+    if not snapshot:
+        return False
+    return all(
+        page["status"] in TERMINAL_STATUSES
+        and (
+            page["page_index"] == 0
+            or all(bb in TERMINAL_STATUSES for bb in page["bbs"])
+        )
+        for page in snapshot
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _progress_stream(session_id: str):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.PROGRESS_STREAM_MAX_SECONDS
+
+    # Read the version before the snapshot so no change can slip between
+    seen = progress_events.version(session_id)
+    state = await sync_to_async(_progress_snapshot)(session_id)
+    yield _sse("snapshot", {"session_id": session_id, "pages": state})
+    last_sent = loop.time()
+
+    while not _is_finished(state) and loop.time() < deadline:
+        seen = await progress_events.async_wait_for_change(
+            session_id,
+            seen,
+            min(settings.PROGRESS_RECONCILE_SECONDS, deadline - loop.time()),
+        )
+        # Woken by this process's pipeline, or timed out: either way the
+        # DB decides what changed (another worker may have done the work)
+        new_state = await sync_to_async(_progress_snapshot)(session_id)
+        events = _progress_changes(state, new_state)
+        state = new_state
+
+        for event, data in events:
+            yield _sse(event, data)
+        if events:
+            last_sent = loop.time()
+        elif loop.time() - last_sent >= settings.PROGRESS_KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_sent = loop.time()
+
+    if _is_finished(state):
+        yield _sse("done", {"session_id": session_id})
+
+
+class ProgressStreamView(View):
+    """
+    Push page processing progress for a session (Server-Sent Events)
+
+    [GET] /process/stream?session_id={session_id}
+
+    Events (text/event-stream):
+        event: snapshot  data: {"session_id", "pages": [
+                             {"page_index", "status", "progress",
+                              "bbs": ["pending" | "processing" | "ready" | "failed"]}]}
+        event: page      data: {"page_index", "status", "progress"}
+        event: bb        data: {"page_index", "bbox_index", "tts_status"}
+        event: done      data: {"session_id"}   (all pages and audio finished)
+
+    A snapshot is sent on every (re)connect, so clients never need to
+    replay missed events. /process/check_ocr and /process/check_tts stay
+    available for clients that poll.
+
+    Response (501 Not Implemented): the server runs under WSGI, which
+    would buffer the whole stream on a worker thread
+    """
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"error": "progress stream requires an ASGI worker"}, status=501
+            )
+
+        session_id = request.GET.get("session_id")
+        if not session_id:
+            return HttpResponse(status=400)
+
+        session = await _get_session(session_id)
+        if session is None:
+            return HttpResponse(status=404)
+
+        response = StreamingHttpResponse(
+            _progress_stream(str(session.id)), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # Tell nginx not to buffer the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
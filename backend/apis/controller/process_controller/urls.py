@@ -1,10 +1,18 @@
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+from .async_views import (
+    AsyncProcessUploadCoverView,
+    AsyncProcessUploadView,
+    AsyncProcessWordPickerView,
+    ProgressStreamView,
+)
 from .views import (
     ProcessUploadCoverView,
     ProcessUploadView,
     CheckOCRStatusView,
     CheckTTSStatusView,
     ProcessWordPickerView,
+    ProcessTTSStatsView,
 )
 
 urlpatterns = [
@@ -13,4 +21,10 @@ urlpatterns = [
     path("check_ocr/", CheckOCRStatusView.as_view()),
     path("check_tts/", CheckTTSStatusView.as_view()),
     path("word_picker/", ProcessWordPickerView.as_view()),
+    path("tts_stats/", ProcessTTSStatsView.as_view()),
+    path("stream/", ProgressStreamView.as_view()),
+    # Native async variants, for ASGI workers
+    path("async/upload_cover/", csrf_exempt(AsyncProcessUploadCoverView.as_view())),
+    path("async/upload/", csrf_exempt(AsyncProcessUploadView.as_view())),
+    path("async/word_picker/", csrf_exempt(AsyncProcessWordPickerView.as_view())),
 ]
@@ -1,6 +1,10 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.settings import api_settings
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.utils import timezone
 from apis.models.session_model import Session
 from apis.models.page_model import Page
@@ -8,262 +12,608 @@ from apis.models.bb_model import BB
 from apis.modules.ocr_processor import OCRModule
 from apis.modules.tts_processor import TTSModule
 from apis.modules.word_picker import StoryWordPicker
-import base64
+from apis.modules.image_store import save_image_base64, save_image_file
+from apis.modules import (
+    adaptive_concurrency,
+    background_jobs,
+    deadlines,
+    hedging,
+    page_payloads,
+    progress_events,
+    response_cache,
+    retry_policy,
+    segmentation,
+    tts_routing,
+)
+from apis.parsers import RawImageUploadParser, RawBinaryUploadParser
+import binascii
 import json
-import uuid
-import os
 import asyncio
-import threading
+import functools
+import math
+import time
+
+# check_ocr progress at the start of each processing stage
+PAGE_STAGE_PROGRESS = {
+    "queued": 0,
+    "ocr": 10,
+    "translating": 40,
+    "ready": 100,
+    "failed": 100,
+}
+
+# Tries at reserving a page index against concurrent uploads
+PAGE_INDEX_ATTEMPTS = 3
+
+# Paragraphs whose translation missed the page deadline; the background
+# TTS job translates them before synthesizing
+TRANSLATION_PENDING = {"status": "pending", "sentences": []}
+
+# JSON (base64), multipart/form-data and raw image bodies
+UPLOAD_PARSER_CLASSES = list(api_settings.DEFAULT_PARSER_CLASSES) + [
+    RawImageUploadParser,
+    RawBinaryUploadParser,
+]
+
+
+def _read_upload(request):
+    """
+    Extract upload fields from any supported encoding.
 
+    - JSON: {"session_id", "lang", "image_base64"}
+    - multipart/form-data: session_id, lang fields and an "image" file
+    - raw image body: session_id and lang as query parameters
 
-class ProcessUploadView(APIView):
+    Returns:
+        (session_id, lang, image_base64, image_file)
+    """
+    session_id = request.data.get("session_id") or request.query_params.get(
+        "session_id"
+    )
+    lang = request.data.get("lang") or request.query_params.get("lang")
+    image_base64 = request.data.get("image_base64")
+    image_file = request.FILES.get("image") or request.FILES.get("file")
+    return session_id, lang, image_base64, image_file
+
+
+def _create_page_and_bbs(
+    session: Session,
+    image_path: str,
+    ocr_result: list,
+    translation_data: list,
+) -> tuple:
     """
-    Upload and process a page image with OCR, translation, and TTS
+    Create Page and BoundingBox objects with translations.
+    All BBs are inserted with a single bulk INSERT inside one transaction,
+    so the SQLite write lock is taken once per page instead of per BB.
 
-    [POST] /process/upload
+    Returns:
+        (page, bb_ids) where bb_ids[i] is the id of paragraph i's BB
+    """
+    with transaction.atomic():
+        page = Page.objects.create(
+            session=session,
+            img_url=image_path,
+            bbox_json=json.dumps(ocr_result),
+            created_at=timezone.now(),
+        )
+        bb_ids = _create_bbs(page, ocr_result, translation_data)
+        page_payloads.materialize_ocr(page)
 
-    Request Body:
-        {
-            "session_id": "string",
-            "lang": "string",
-            "image_base64": "string"
-        }
+    return page, bb_ids
 
-    Response (200 OK):
-        {
-            "session_id": "string",
-            "page_index": 0,
-            "status": "ready",
-            "submitted_at": "datetime"
-        }
+
+def _create_bbs(page: Page, ocr_result: list, translation_data: list) -> list:
     """
+    Bulk create one BB per OCR paragraph with its translation (no audio yet).
 
-    def post(self, request):
-        # Validate request
-        session_id = request.data.get("session_id")
-        lang = request.data.get("lang")
-        image_base64 = request.data.get("image_base64")
+    Returns:
+        bb_ids where bb_ids[i] is the id of paragraph i's BB
+    """
+    bbs = []
+    for i, para in enumerate(ocr_result):
+        # Extract translation text
+        data = translation_data[i] if i < len(translation_data) else None
+        if data is not None and data["status"] == "ok":
+            sentences = data["sentences"]
+            translated_text = " ".join([s["translation"] for s in sentences])
+        elif data is not None and data["status"] == TRANSLATION_PENDING["status"]:
+            # NULL until the TTS job translates it (see _translate_pending)
+            translated_text = None
+        else:
+            translated_text = ""
+
+        bbs.append(
+            BB(
+                page=page,
+                original_text=para.get("text", ""),
+                audio_base64=[],
+                translated_text=translated_text,
+                coordinates=para.get("bbox", {}),
+            )
+        )
+    BB.objects.bulk_create(bbs)
 
-        if not all([session_id, lang, image_base64]):
-            return Response(status=status.HTTP_400_BAD_REQUEST)
+    bb_ids = [bb.pk for bb in bbs]
+    if None in bb_ids:
+        # Backends without RETURNING support do not set pks on bulk_create
+        bb_ids = list(page.bbs.order_by("id").values_list("id", flat=True))
+    return bb_ids
+
+
+def _publish_page_change(session_id: str):
+    """Drop cached page responses of the session and wake progress listeners."""
+    response_cache.invalidate_session(session_id)
+    progress_events.publish(session_id)
+
+
+def _set_page_status(
+    session_id: str, page_id: int, page_status: str, progress: int = None
+):
+    """
+    Persist the processing stage of a page (read by check_ocr) and notify
+    progress listeners once it is committed.
+    """
+    fields = {"status": page_status, "progress": PAGE_STAGE_PROGRESS[page_status]}
+    if progress is not None:
+        fields["progress"] = progress
+    if page_status in ("ready", "failed"):
+        fields["processed_at"] = timezone.now()
+    Page.objects.filter(pk=page_id).update(**fields)
+    transaction.on_commit(lambda: _publish_page_change(session_id))
 
+
+def _enqueue_page(session: Session, image_path: str, page_index: int, lang: str):
+    """
+    Reserve the page index of a stored upload and start _process_page for
+    it in a background job. When a concurrent upload took page_index
+    first, the page gets the next free index.
+
+    Returns:
+        (page, deadline): the queued Page and the upload's deadline
+    """
+    for attempt in range(PAGE_INDEX_ATTEMPTS):
         try:
-            session = Session.objects.get(id=session_id)
-        except Session.DoesNotExist:
-            return Response(status=status.HTTP_404_NOT_FOUND)
+            with transaction.atomic():
+                page = Page.objects.create(
+                    session=session,
+                    page_index=page_index,
+                    img_url=image_path,
+                    created_at=timezone.now(),
+                    status="queued",
+                    progress=PAGE_STAGE_PROGRESS["queued"],
+                )
+            break
+        except IntegrityError:
+            if attempt == PAGE_INDEX_ATTEMPTS - 1:
+                raise
+            page_index = session.nextPageIndex()
+    progress_events.publish(session.id)
+
+    # Map language codes to full names for TTS
+    lang_map = {"en": "English", "zh": "Chinese", "vi": "Vietnamese"}
+    target_lang = lang_map.get(lang, "English")
+
+    # Time budget of the whole upload, from here to the last audio clip
+    deadline = deadlines.for_upload()
+    background_jobs.start(
+        functools.partial(
+            _process_page, page.id, page_index, target_lang, deadline=deadline
+        ),
+        name=f"page-{session.id}-{page_index}",
+    )
+    return page, deadline
+
+
+def _translate_paragraphs(
+    tts_module: TTSModule,
+    ocr_result: list,
+    session_id: str,
+    page_index: int,
+    page_id: int = None,
+    deadline: deadlines.Deadline = None,
+) -> list:
+    """
+    Get translations and sentiment for all paragraphs (no TTS yet).
+    Runs ALL paragraphs in parallel; when page_id is given, the page's
+    progress is advanced as each paragraph finishes. Paragraphs still
+    running at the deadline are cancelled and returned as
+    TRANSLATION_PENDING.
+    Returns list of translation data per paragraph.
+    """
+
+    # Segment every paragraph of the page in one call
+    sentences = segmentation.split_paragraphs(
+        para.get("text", "") for para in ocr_result
+    )
+
+    async def get_para_translation(i: int, para: dict):
+        page_data = {
+            "fileName": f"{session_id}_{page_index}_{i}.jpg",
+            "text": para.get("text", ""),
+            "sentences": sentences[i],
+        }
+        return await tts_module.get_translations_only(page_data, deadline=deadline)
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        tasks = [
+            loop.create_task(get_para_translation(i, para))
+            for i, para in enumerate(ocr_result)
+        ]
+        pending = set(tasks)
+        start = PAGE_STAGE_PROGRESS["translating"]
+        span = PAGE_STAGE_PROGRESS["ready"] - start
+        while pending:
+            done, pending = loop.run_until_complete(
+                asyncio.wait(
+                    pending,
+                    timeout=deadline.remaining() if deadline else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            )
+            if not done:
+                print(
+                    f"[DEBUG] Page {page_index}: {len(pending)} paragraph "
+                    f"translations left pending at the deadline"
+                )
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+                break
+            # The loop is idle here, so the ORM can be used directly
+            if page_id is not None and pending:
+                done_count = len(tasks) - len(pending)
+                _set_page_status(
+                    session_id,
+                    page_id,
+                    "translating",
+                    progress=start + span * done_count // (len(tasks) + 1),
+                )
+        return [
+            dict(TRANSLATION_PENDING) if task.cancelled() else task.result()
+            for task in tasks
+        ]
+    finally:
+        # Properly cleanup async resources before closing the loop
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
 
-        page_index = session.getPages().count()
 
-        # Save image
-        image_path = self._save_image(image_base64, session_id, page_index)
+def _process_page(
+    page_id: int,
+    page_index: int,
+    target_lang: str,
+    deadline: deadlines.Deadline = None,
+):
+    """
+    Background job for an accepted upload: OCR, translation, BB creation,
+    then hand off to background TTS. Every stage is persisted on the page
+    so check_ocr can report it. OCR and translation share the page budget
+    of the upload's deadline; TTS gets the rest of it. A page that fails
+    before it is ready is marked failed and keeps its page index.
+    """
+    deadline = deadline or deadlines.for_upload()
+    page_deadline = deadline.page_budget()
+    page = Page.objects.select_related("session").get(pk=page_id)
+    session = page.session
+    session_id = str(session.id)
 
+    try:
         # Run OCR
-        ocr_result = OCRModule().process_page(image_path)
-
+        _set_page_status(session_id, page_id, "ocr")
+        ocr_result = OCRModule().process_page(page.img_url, deadline=page_deadline)
         if not ocr_result:
-            return Response(
-                {"error_code": 422, "message": "PROCESS__UNABLE_TO_PROCESS_IMAGE"},
-                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            )
+            print(f"[DEBUG] OCR found no text in page {page_index}")
+            _set_page_status(session_id, page_id, "failed")
+            return
 
         # Count words from OCR and add to session.totalWords
         total_words = sum(
             len((para.get("text", "") or "").split()) for para in ocr_result
         )
-        session.totalWords = session.totalWords + total_words
         print(f"[DEBUG] OCR words in page {page_index}: {total_words}")
 
-        # Map language codes to full names for TTS
-        lang_map = {"en": "English", "zh": "Chinese", "vi": "Vietnamese"}
-        target_lang = lang_map.get(lang, "English")
-
-        # Run translation synchronously (fast, ~2-3s per paragraph)
+        # Run translation (~2-3s per paragraph, all in parallel)
+        _set_page_status(session_id, page_id, "translating")
         tts_module = TTSModule(target_lang=target_lang)
-        translation_data = self._get_all_translations(
-            tts_module, ocr_result, session_id, page_index
-        )
-
-        # Create page and bounding boxes
-        page = self._create_page_and_bbs(
-            session, image_path, ocr_result, translation_data
-        )
-
-        # Get voice preference with fallback to default
-        para_voice = session.voicePreference if session.voicePreference else "shimmer"
-        print(
-            "[DEBUG] voice preference:", session.voicePreference, "→ using:", para_voice
-        )
-
-        # Start background TTS
-        self._start_background_tts(
+        translation_data = _translate_paragraphs(
             tts_module,
             ocr_result,
-            translation_data,
-            page,
             session_id,
             page_index,
-            para_voice=para_voice,
+            page_id=page_id,
+            deadline=page_deadline,
         )
 
-        # Update session (only update specific fields to avoid race condition)
-        session.totalPages += 1
-        session.save(update_fields=["totalPages", "totalWords"])
-        print("[DEBUG] Page index after upload:", page_index)
-        return Response(
-            {
-                "session_id": session_id,
-                "page_index": page_index,
-                "status": "ready",
-                "submitted_at": timezone.now(),
-            },
-            status=status.HTTP_200_OK,
-        )
-
-    def _save_image(self, image_base64: str, session_id: str, page_index: int) -> str:
-        """Decode and save uploaded image."""
-        image_bytes = base64.b64decode(image_base64)
-        image_filename = f"{uuid.uuid4().hex}.jpg"
-        fname = f"{session_id}_{page_index}_{image_filename}"
-        image_path = f"media/images/{fname}"
-
-        os.makedirs(os.path.dirname(image_path), exist_ok=True)
-        with open(image_path, "wb") as f:
-            f.write(image_bytes)
-
-        return image_path
-
-    def _get_all_translations(
-        self, tts_module: TTSModule, ocr_result: list, session_id: str, page_index: int
-    ) -> list:
-        """
-        Get translations and sentiment for all paragraphs (no TTS yet).
-        Runs ALL paragraphs in parallel.
-        Returns list of translation data per paragraph.
-        """
-
-        async def get_para_translation(i: int, para: dict):
-            page_data = {
-                "fileName": f"{session_id}_{page_index}_{i}.jpg",
-                "text": para.get("text", ""),
-            }
-            return await tts_module.get_translations_only(page_data)
+        # Create bounding boxes and publish the page in one transaction
+        with transaction.atomic():
+            bb_ids = _create_bbs(page, ocr_result, translation_data)
+            Page.objects.filter(pk=page_id).update(bbox_json=json.dumps(ocr_result))
+            _set_page_status(session_id, page_id, "ready")
+            page.status = "ready"
+            page_payloads.materialize_ocr(page)
+            # F() expressions: other pages of the session may finish concurrently
+            Session.objects.filter(pk=session.pk).update(
+                totalPages=F("totalPages") + 1,
+                totalWords=F("totalWords") + total_words,
+            )
+    except Exception as e:
+        print(f"[Page Background] Error in page {page_index}: {e}")
+        import traceback
+
+        traceback.print_exc()
+        _set_page_status(session_id, page_id, "failed")
+        return
+
+    # Get voice preference with fallback to default
+    para_voice = session.voicePreference if session.voicePreference else "shimmer"
+    print("[DEBUG] voice preference:", session.voicePreference, "→ using:", para_voice)
+
+    _start_background_tts(
+        tts_module,
+        ocr_result,
+        translation_data,
+        bb_ids,
+        session_id,
+        page_index,
+        para_voice=para_voice,
+        page_id=page_id,
+        deadline=deadline,
+    )
+
+
+def _translate_pending(
+    tts_module: TTSModule,
+    ocr_result: list,
+    translation_data: list,
+    bb_ids: list,
+    session_id: str,
+    page_index: int,
+    page_id: int,
+    deadline: deadlines.Deadline = None,
+):
+    """
+    Translate the paragraphs left TRANSLATION_PENDING when the page was
+    published, updating translation_data and their BBs in place.
+    """
+    pending = [
+        i
+        for i, data in enumerate(translation_data)
+        if data["status"] == TRANSLATION_PENDING["status"]
+    ]
+    if not pending:
+        return
+
+    results = _translate_paragraphs(
+        tts_module,
+        [ocr_result[i] for i in pending],
+        session_id,
+        page_index,
+        deadline=deadline,
+    )
+    for i, data in zip(pending, results):
+        translation_data[i] = data
+        translated_text = ""
+        if data["status"] == "ok":
+            translated_text = " ".join(s["translation"] for s in data["sentences"])
+        BB.objects.filter(pk=bb_ids[i]).update(translated_text=translated_text)
+    page_payloads.materialize_ocr(Page.objects.get(pk=page_id))
+    _publish_page_change(session_id)
+    print(
+        f"[TTS Background] Translated {len(pending)} pending paragraphs "
+        f"of page {page_index}"
+    )
+
+
+def _start_background_tts(
+    tts_module: TTSModule,
+    ocr_result: list,
+    translation_data: list,
+    bb_ids: list,
+    session_id: str,
+    page_index: int,
+    para_voice: str,
+    page_id: int,
+    deadline: deadlines.Deadline = None,
+):
+    """
+    Start a background job to run TTS using pre-computed translations.
+    Each finished paragraph is written with a single UPDATE of its audio
+    columns, addressed by the BB id captured at creation time; the page's
+    audio payload is materialized once every paragraph is done.
+
+    Paragraphs left TRANSLATION_PENDING are translated first. Within the
+    deadline, the tier routing plans against the time left, and
+    paragraphs reached after it has passed are marked failed.
+    """
 
-        # Run ALL paragraphs in parallel
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    def run_tts():
+        print(f"[TTS Background] Starting TTS for page {page_index}")
+        print(f"[TTS Background] Using voice preference: {para_voice}")
         try:
-            translation_data = loop.run_until_complete(
-                asyncio.gather(
-                    *[
-                        get_para_translation(i, para)
-                        for i, para in enumerate(ocr_result)
+            _translate_pending(
+                tts_module,
+                ocr_result,
+                translation_data,
+                bb_ids,
+                session_id,
+                page_index,
+                page_id,
+                deadline,
+            )
+
+            # Mark every BB's TTS state up front with two bulk UPDATEs
+            ok_ids, failed_ids, page_sentences = [], [], []
+            for i, bb_id in enumerate(bb_ids):
+                is_ok = (
+                    i < len(translation_data) and translation_data[i]["status"] == "ok"
+                )
+                (ok_ids if is_ok else failed_ids).append(bb_id)
+                if is_ok:
+                    page_sentences += [
+                        sentence.get("translation", "")
+                        for sentence in translation_data[i]["sentences"]
                     ]
+            BB.objects.filter(pk__in=ok_ids).update(tts_status="processing")
+            BB.objects.filter(pk__in=failed_ids).update(tts_status="failed")
+            _publish_page_change(session_id)
+
+            # Model tier of each sentence, decided against the whole page
+            budget = settings.TTS_PAGE_LATENCY_BUDGET
+            if deadline is not None:
+                budget = min(budget, deadline.remaining())
+            routing = tts_routing.PageRouting(
+                page_sentences,
+                tts_module.lang_code,
+                paragraphs=len(ok_ids),
+                budget=budget,
+            )
+
+            for i, _ in enumerate(ocr_result):
+                not_ok = (
+                    i >= len(translation_data) or translation_data[i]["status"] != "ok"
                 )
+                if not_ok:
+                    continue
+                if deadline is not None and deadline.expired():
+                    print(f"[TTS Background] Deadline passed, BB {bb_ids[i]} failed")
+                    BB.objects.filter(pk=bb_ids[i]).update(tts_status="failed")
+                    _publish_page_change(session_id)
+                    continue
+
+                # Run TTS with pre-computed translations
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                try:
+                    audio_results = loop.run_until_complete(
+                        tts_module.run_tts_only(
+                            translation_data[i],
+                            session_id,
+                            page_index,
+                            i,
+                            para_voice,
+                            routing=routing,
+                            deadline=deadline,
+                        )
+                    )
+                finally:
+                    # Properly cleanup async resources before closing the loop
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    loop.close()
+                routing.paragraph_done()
+
+                # Update BB with audio
+                if audio_results:
+                    BB.objects.filter(pk=bb_ids[i]).update(
+                        audio_base64=audio_results, tts_status="ready"
+                    )
+                    print(
+                        f"[TTS Background] BB {bb_ids[i]} ready "
+                        f"({len(audio_results)} clips)"
+                    )
+                else:
+                    BB.objects.filter(pk=bb_ids[i]).update(tts_status="failed")
+                _publish_page_change(session_id)
+
+            page_payloads.materialize_audio(Page.objects.get(pk=page_id))
+            _publish_page_change(session_id)
+            print(
+                f"[TTS Background] Completed TTS for page {page_index}: "
+                f"{routing.summary()}"
             )
-            return translation_data
-        finally:
-            # Properly cleanup async resources before closing the loop
-            loop.run_until_complete(loop.shutdown_asyncgens())
-            loop.close()
 
-    def _create_page_and_bbs(
-        self,
-        session: Session,
-        image_path: str,
-        ocr_result: list,
-        translation_data: list,
-    ) -> Page:
-        """Create Page and BoundingBox objects with translations."""
-        page = Page.objects.create(
-            session=session,
-            img_url=image_path,
-            bbox_json=json.dumps(ocr_result),
-            created_at=timezone.now(),
-        )
+        except Exception as e:
+            print(f"[TTS Background] Error: {e}")
+            import traceback
 
-        for i, para in enumerate(ocr_result):
-            # Extract translation text
-            ok_status = (
-                i < len(translation_data) and translation_data[i]["status"] == "ok"
-            )
-            if ok_status:
-                sentences = translation_data[i]["sentences"]
-                translated_text = " ".join([s["translation"] for s in sentences])
-            else:
-                translated_text = ""
-
-            # Create BB with translation but no audio yet
-            BB.objects.create(
-                page=page,
-                original_text=para.get("text", ""),
-                audio_base64=[],
-                translated_text=translated_text,
-                coordinates=para.get("bbox", {}),
-            )
+            traceback.print_exc()
 
-        return page
-
-    def _start_background_tts(
-        self,
-        tts_module: TTSModule,
-        ocr_result: list,
-        translation_data: list,
-        page: Page,
-        session_id: str,
-        page_index: int,
-        para_voice: str,
-    ):
-        """Start background thread to run TTS using pre-computed translations."""
-
-        def run_tts():
-            print(f"[TTS Background] Starting TTS for page {page_index}")
-            print(f"[TTS Background] Using voice preference: {para_voice}")
-            try:
-                for i, _ in enumerate(ocr_result):
-                    not_ok = (
-                        i >= len(translation_data)
-                        or translation_data[i]["status"] != "ok"
-                    )
-                    if not_ok:
-                        continue
-
-                    # Run TTS with pre-computed translations
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        audio_results = loop.run_until_complete(
-                            tts_module.run_tts_only(
-                                translation_data[i],
-                                session_id,
-                                page_index,
-                                i,
-                                para_voice,
-                            )
-                        )
-                    finally:
-                        # Properly cleanup async resources before closing the loop
-                        loop.run_until_complete(loop.shutdown_asyncgens())
-                        loop.close()
-
-                    # Update BB with audio
-                    if audio_results:
-                        bb = page.getBBs()[i]
-                        bb.audio_base64 = audio_results
-                        bb.save()
-                        print(
-                            f"[TTS Background] BB {bb.id} ready ({len(audio_results)} clips)"
-                        )
+    background_jobs.start(run_tts, name=f"tts-{session_id}-{page_index}")
+
+
+class ProcessUploadView(APIView):
+    """
+    Accept a page image; OCR and translation run in the background
+
+    [POST] /process/upload
 
-                print(f"[TTS Background] Completed TTS for page {page_index}")
+    Request Body (application/json):
+        {
+            "session_id": "string",
+            "lang": "string",
+            "image_base64": "string"
+        }
+
+    Request Body (multipart/form-data):
+        session_id, lang, image (file)
+
+    Request Body (image/* or application/octet-stream):
+        raw image bytes, with ?session_id={session_id}&lang={lang}
+
+    Response (202 Accepted):
+        {
+            "session_id": "string",
+            "page_index": 0,
+            "status": "queued",
+            "submitted_at": "datetime",
+            "page_budget_seconds": 75
+        }
+
+    Poll /process/check_ocr for the page until its status is "ready" or
+    "failed" (no text found, OCR or translation error); either is reached
+    within page_budget_seconds. A failed page keeps its page_index.
+    """
+
+    parser_classes = UPLOAD_PARSER_CLASSES
+
+    def post(self, request):
+        # Validate request
+        session_id, lang, image_base64, image_file = _read_upload(request)
 
-            except Exception as e:
-                print(f"[TTS Background] Error: {e}")
-                import traceback
+        if not all([session_id, lang]) or not (image_base64 or image_file):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
 
-                traceback.print_exc()
+        try:
+            session = Session.objects.get(id=session_id)
+        except Session.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
 
-        thread = threading.Thread(target=run_tts, daemon=True)
-        thread.start()
+        page_index = session.nextPageIndex()
+
+        # Save image and reserve the page index right away
+        try:
+            image_path = self._save_image(
+                image_base64, image_file, session_id, page_index
+            )
+        except binascii.Error:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        page, deadline = _enqueue_page(session, image_path, page_index, lang)
+
+        print("[DEBUG] Page index after upload:", page.page_index)
+        return Response(
+            {
+                "session_id": session_id,
+                "page_index": page.page_index,
+                "status": page.status,
+                "submitted_at": page.created_at,
+                "page_budget_seconds": round(deadline.page_budget().seconds),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    def _save_image(
+        self, image_base64: str, image_file, session_id: str, page_index: int
+    ) -> str:
+        """Stream uploaded image to disk (file upload preferred over base64)."""
+        if image_file is not None:
+            image_path, _ = save_image_file(image_file, session_id, page_index)
+        else:
+            image_path, _ = save_image_base64(image_base64, session_id, page_index)
+        return image_path
 
 
 class CheckOCRStatusView(APIView):
@@ -280,10 +630,10 @@ class CheckOCRStatusView(APIView):
         {
             "session_id": "string",
             "page_index": 0,
-            "status": "ready",
+            "status": "queued" | "ocr" | "translating" | "ready" | "failed",
             "progress": 100,
             "submitted_at": "datetime",
-            "processed_at": "datetime"
+            "processed_at": "datetime or null"
         }
     """
 
@@ -297,21 +647,27 @@ class CheckOCRStatusView(APIView):
         try:
             session = Session.objects.get(id=session_id)
             pages = Page.objects.filter(session=session)
-            page = pages.order_by("id")[int(page_index)]
+            page = pages.get(page_index=int(page_index))
 
-            return Response(
-                {
-                    "session_id": session_id,
-                    "page_index": int(page_index),
-                    "status": "ready",
-                    "progress": 100,
-                    "submitted_at": page.created_at,
-                    "processed_at": page.created_at,
-                },
-                status=status.HTTP_200_OK,
-            )
+            processed_at = page.processed_at
+            if processed_at is None and page.status == "ready":
+                # Pages created in one step are done when they are created
+                processed_at = page.created_at
+
+            data = {
+                "session_id": session_id,
+                "page_index": int(page_index),
+                "status": page.status,
+                "progress": page.progress,
+                "submitted_at": page.created_at,
+                "processed_at": processed_at,
+            }
+            if page.status == "failed":
+                data["message"] = "PROCESS__UNABLE_TO_PROCESS_IMAGE"
 
-        except (Session.DoesNotExist, IndexError):
+            return Response(data, status=status.HTTP_200_OK)
+
+        except (Session.DoesNotExist, Page.DoesNotExist):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
 
@@ -324,12 +680,20 @@ class CheckTTSStatusView(APIView):
     Query Parameters:
         session_id: Session identifier
         page_index: Page number
+        wait: (optional) seconds to hold the request open, at most
+              PROGRESS_LONG_POLL_MAX_SECONDS
+        since_progress: (optional) progress the client already has
+
+    With wait and since_progress, the response is held until progress
+    differs from since_progress, the page is ready, or wait expires
+    (then the unchanged status is returned). The wait is released by
+    the TTS pipeline's change notifications, not by polling the DB.
 
     Response (200 OK):
         {
             "session_id": "string",
             "page_index": 0,
-            "status": "ready" or "processing",
+            "status": "ready" or "processing" (or "failed"),
             "progress": 75,
             "submitted_at": "datetime",
             "processed_at": "datetime or null"
@@ -343,48 +707,97 @@ class CheckTTSStatusView(APIView):
         if not session_id or page_index is None:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
+        try:
+            wait = float(request.query_params.get("wait", 0))
+            # nan would never let the wait below expire
+            if not math.isfinite(wait):
+                raise ValueError(wait)
+            wait = min(max(wait, 0.0), settings.PROGRESS_LONG_POLL_MAX_SECONDS)
+            since_progress = request.query_params.get("since_progress")
+            if since_progress is not None:
+                since_progress = int(since_progress)
+        except ValueError:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
         try:
             session = Session.objects.get(id=session_id)
-            pages = Page.objects.filter(session=session)
-            page = pages.order_by("id")[int(page_index)]
-            bbs = page.getBBs()
-
-            total_bbs = bbs.count()
-            if total_bbs == 0:
-                return Response(
-                    {
-                        "session_id": session_id,
-                        "page_index": int(page_index),
-                        "status": "ready",
-                        "progress": 100,
-                        "submitted_at": page.created_at,
-                        "processed_at": page.created_at,
-                    },
-                    status=status.HTTP_200_OK,
+            deadline = time.monotonic() + wait
+
+            while True:
+                # Read the version first so a change during the query
+                # still releases the wait below
+                seen = progress_events.version(session.id)
+                data = self._tts_status(session, session_id, int(page_index))
+
+                unchanged = (
+                    since_progress is not None
+                    and data["progress"] == since_progress
+                    and data["status"] == "processing"
+                )
+                remaining = deadline - time.monotonic()
+                if not unchanged or remaining <= 0:
+                    return Response(data, status=status.HTTP_200_OK)
+
+                # Wake early on a notification; re-check the DB at least
+                # every reconcile interval for work done by other workers
+                progress_events.wait_for_change(
+                    session.id,
+                    seen,
+                    min(remaining, settings.PROGRESS_RECONCILE_SECONDS),
                 )
 
-            # Count BBs with audio
-            completed_bbs = sum(1 for bb in bbs if self._has_audio(bb))
-            progress = int((completed_bbs / total_bbs) * 100)
-            is_ready = completed_bbs == total_bbs
-            status_str = "ready" if is_ready else "processing"
+        except (Session.DoesNotExist, Page.DoesNotExist):
+            return Response(status=status.HTTP_404_NOT_FOUND)
 
-            return Response(
-                {
-                    "session_id": session_id,
-                    "page_index": int(page_index),
-                    "status": status_str,
-                    "progress": progress,
-                    "submitted_at": page.created_at,
-                    "processed_at": (
-                        page.created_at if status_str == "ready" else None
-                    ),
-                },
-                status=status.HTTP_200_OK,
-            )
+    def _tts_status(self, session: Session, session_id: str, page_index: int) -> dict:
+        """TTS status of one page, without loading finished audio."""
+        page = Page.objects.get(session=session, page_index=page_index)
 
-        except (Session.DoesNotExist, IndexError):
-            return Response(status=status.HTTP_404_NOT_FOUND)
+        if page.status != "ready":
+            # OCR / translation has not produced the BBs yet
+            return {
+                "session_id": session_id,
+                "page_index": page_index,
+                "status": "failed" if page.status == "failed" else "processing",
+                "progress": 0,
+                "submitted_at": page.created_at,
+                "processed_at": None,
+            }
+
+        bbs = page.getBBs()
+
+        total_bbs = bbs.count()
+        if total_bbs == 0:
+            return {
+                "session_id": session_id,
+                "page_index": page_index,
+                "status": "ready",
+                "progress": 100,
+                "submitted_at": page.created_at,
+                "processed_at": page.created_at,
+            }
+
+        # Count BBs with audio. BBs marked ready are counted in SQL; only
+        # the rest (normally empty lists, or rows from before tts_status)
+        # have their audio column loaded
+        completed_bbs = bbs.filter(tts_status="ready").count()
+        completed_bbs += sum(
+            1
+            for bb in bbs.exclude(tts_status="ready").only("id", "audio_base64")
+            if self._has_audio(bb)
+        )
+        progress = int((completed_bbs / total_bbs) * 100)
+        is_ready = completed_bbs == total_bbs
+        status_str = "ready" if is_ready else "processing"
+
+        return {
+            "session_id": session_id,
+            "page_index": page_index,
+            "status": status_str,
+            "progress": progress,
+            "submitted_at": page.created_at,
+            "processed_at": page.created_at if status_str == "ready" else None,
+        }
 
     def _has_audio(self, bb) -> bool:
         """Check if a bounding box has audio."""
@@ -402,13 +815,19 @@ class ProcessUploadCoverView(APIView):
 
     [POST] /process/upload_cover
 
-    Request Body:
+    Request Body (application/json):
         {
             "session_id": "string",
             "lang": "string",
             "image_base64": "string"
         }
 
+    Request Body (multipart/form-data):
+        session_id, lang, image (file)
+
+    Request Body (image/* or application/octet-stream):
+        raw image bytes, with ?session_id={session_id}&lang={lang}
+
     Response (200 OK):
         {
             "session_id": "string",
@@ -420,13 +839,13 @@ class ProcessUploadCoverView(APIView):
         }
     """
 
+    parser_classes = UPLOAD_PARSER_CLASSES
+
     def post(self, request):
         # Validate request
-        session_id = request.data.get("session_id")
-        lang = request.data.get("lang")
-        image_base64 = request.data.get("image_base64")
+        session_id, lang, image_base64, image_file = _read_upload(request)
 
-        if not all([session_id, lang, image_base64]):
+        if not all([session_id, lang]) or not (image_base64 or image_file):
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
         try:
@@ -437,7 +856,12 @@ class ProcessUploadCoverView(APIView):
         page_index = 0
 
         # Save cover image
-        image_path = self._save_image(image_base64, session_id, page_index)
+        try:
+            image_path = self._save_image(
+                image_base64, image_file, session_id, page_index
+            )
+        except binascii.Error:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
 
         # Run OCR to get title
         title = OCRModule().process_cover_page(image_path)
@@ -460,7 +884,7 @@ class ProcessUploadCoverView(APIView):
         )
 
         # Create page and BB
-        page = self._create_page_and_bbs(
+        _create_page_and_bbs(
             session,
             image_path,
             [{"text": title}],
@@ -486,77 +910,14 @@ class ProcessUploadCoverView(APIView):
             status=status.HTTP_200_OK,
         )
 
-    def _get_all_translations(
-        self, tts_module: TTSModule, ocr_result: list, session_id: str, page_index: int
-    ) -> list:
-        """
-        Get translations and sentiment for all paragraphs (no TTS yet).
-        Runs ALL paragraphs in parallel.
-        Returns list of translation data per paragraph.
-        """
-
-        async def get_para_translation(i: int, para: dict):
-            page_data = {
-                "fileName": f"{session_id}_{page_index}_{i}.jpg",
-                "text": para.get("text", ""),
-            }
-            return await tts_module.get_translations_only(page_data)
-
-        # Run ALL paragraphs in parallel
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        translation_data = loop.run_until_complete(
-            asyncio.gather(
-                *[get_para_translation(i, para) for i, para in enumerate(ocr_result)]
-            )
-        )
-        loop.close()
-
-        return translation_data
-
-    def _create_page_and_bbs(
-        self,
-        session: Session,
-        image_path: str,
-        ocr_result: list,
-        translation_data: list,
-    ) -> Page:
-        """Create Page and BoundingBox objects with translations"""
-        page = Page.objects.create(
-            session=session,
-            img_url=image_path,
-            bbox_json=json.dumps(ocr_result),
-            created_at=timezone.now(),
-        )
-
-        for i, para in enumerate(ocr_result):
-            # Extract translation text
-            if i < len(translation_data) and translation_data[i]["status"] == "ok":
-                sentences = translation_data[i]["sentences"]
-                translated_text = " ".join([s["translation"] for s in sentences])
-            else:
-                translated_text = ""
-
-            BB.objects.create(
-                page=page,
-                original_text=para.get("text", ""),
-                audio_base64=[],
-                translated_text=translated_text,
-                coordinates=para.get("bbox", {}),
-            )
-
-        return page
-
-    def _save_image(self, image_base64: str, session_id: str, page_index: int) -> str:
-        """Decode and save uploaded image"""
-        image_bytes = base64.b64decode(image_base64)
-        image_filename = f"{uuid.uuid4().hex}.jpg"
-        image_path = f"media/images/{session_id}_{page_index}_{image_filename}"
-
-        os.makedirs(os.path.dirname(image_path), exist_ok=True)
-        with open(image_path, "wb") as f:
-            f.write(image_bytes)
-
+    def _save_image(
+        self, image_base64: str, image_file, session_id: str, page_index: int
+    ) -> str:
+        """Stream uploaded image to disk (file upload preferred over base64)."""
+        if image_file is not None:
+            image_path, _ = save_image_file(image_file, session_id, page_index)
+        else:
+            image_path, _ = save_image_base64(image_base64, session_id, page_index)
         return image_path
 
     def _run_async(self, coroutine):
@@ -612,7 +973,11 @@ class ProcessWordPickerView(APIView):
                 {"error": "session_not_found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        pages = Page.objects.filter(session=session).order_by("id")
+        pages = (
+            Page.objects.filter(session=session)
+            .exclude(page_index=None)
+            .order_by("page_index")
+        )
         if not pages.exists():
             return Response(
                 {
@@ -655,3 +1020,62 @@ class ProcessWordPickerView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class ProcessTTSStatsView(APIView):
+    """
+    TTS calls per model tier, hedged provider calls, provider circuit
+    breakers and adaptive concurrency windows in this worker process
+
+    [GET] /process/tts_stats/
+
+    Response (200 OK):
+        {
+            "policy": "adaptive",
+            "tiers": {
+                "full": {
+                    "calls": 0, "failures": 0, "reused": 0, "chars": 0,
+                    "cost_usd": 0.0,
+                    "latency": {"count": 0, "mean": null, "p50": null, ...}
+                },
+                "lite": {...}
+            },
+            "hedging": {
+                "synthesize_tts": {
+                    "calls": 0, "failures": 0, "hedged": 0, "hedge_wins": 0,
+                    "rate_limited": 0, "cancelled": 0, "hedge_rate": 0.0,
+                    "attempt_latency": {"count": 0, "p95": null, ...},
+                    "call_latency": {"count": 0, "p95": null, ...}
+                },
+                "translate": {...}
+            },
+            "breakers": {
+                "gpt-4o-mini-tts": {
+                    "state": "closed", "consecutive_failures": 0,
+                    "calls": 0, "failures": 0, "rejected": 0, "opened": 0
+                },
+                ...
+            },
+            "concurrency": {
+                "tts": {
+                    "limit": 8.0, "in_flight": 0, "waiting": 0,
+                    "calls": 0, "waited": 0, "increases": 0, "decreases": 0,
+                    "throttled": 0, "latency_spikes": 0,
+                    "latency": {"count": 0, "p50": null, ...}
+                },
+                "translate": {...}, "sentiment": {...}, "tts_lite": {...}
+            }
+        }
+    """
+
+    def get(self, request):
+        return Response(
+            {
+                "policy": settings.TTS_TIER_POLICY,
+                "tiers": tts_routing.stats(),
+                "hedging": hedging.stats(),
+                "breakers": retry_policy.stats(),
+                "concurrency": adaptive_concurrency.stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
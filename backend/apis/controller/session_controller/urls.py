@@ -5,6 +5,7 @@ from .views import (
     EndSessionView,
     GetSessionStatsView,
     SessionReloadAllView,
+    SessionSyncView,
     DiscardSessionView,
 )
 
@@ -14,5 +15,6 @@ urlpatterns = [
     path("end", EndSessionView.as_view()),
     path("stats", GetSessionStatsView.as_view()),
     path("reload_all", SessionReloadAllView.as_view()),
+    path("sync", SessionSyncView.as_view()),
     path("discard", DiscardSessionView.as_view()),
 ]
@@ -1,12 +1,17 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from apis.models.session_model import Session
 from apis.models.user_model import User
 from apis.models.page_model import Page
+from apis.models.bb_model import BB
+from apis.modules import page_payloads, response_cache, session_sync
+from apis.modules.file_serving import remove_audio_clips
 import base64
+import json
 import os
 
 
@@ -208,6 +213,71 @@ class GetSessionStatsView(APIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
 
+class SessionSyncView(APIView):
+    """
+    Manifest of a session's pages for incremental client sync
+
+    [GET] /session/sync?session_id={session_id}&since={sync_token}&resume=true
+
+    Query Parameters:
+        session_id: Session identifier
+        since: sync_token of the client's last sync (optional)
+        resume: restart the session's reading clock, as reload_all does
+                (optional)
+
+    Response (200 OK):
+        {
+            "session_id": "string",
+            "sync_token": "string",
+            "full": false,
+            "total_pages": 40,
+            "pages": [
+                {
+                    "page_index": 0,
+                    "status": "ready",
+                    "version": 1,
+                    "image_url": "/page/get_image/?session_id=...&page_index=0",
+                    "ocr_hash": "string or null",
+                    "audio_hash": "string or null"
+                }
+            ],
+            "removed": [41]
+        }
+
+    With a known `since`, `pages` holds only the entries that changed
+    (empty when nothing did); the client then refetches just those pages
+    with page/get_ocr, page/get_tts and page/image. Unlike reload_all,
+    this is read-only unless `resume` is set.
+    """
+
+    def get(self, request):
+        session_id = request.query_params.get("session_id")
+        since = request.query_params.get("since")
+        resume = request.query_params.get("resume") in ("1", "true")
+        if not session_id:
+            return Response(
+                {"error_code": 400, "message": "SESSION__INVALID_REQUEST"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            session = Session.objects.get(id=session_id)
+        except (Session.DoesNotExist, ValidationError):
+            return Response(
+                {"error_code": 404, "message": "SESSION__NOT_FOUND"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if resume:
+            session.started_at = timezone.now()
+            session.save(update_fields=["started_at"])
+
+        return Response(
+            {"session_id": str(session.id), **session_sync.sync(session, since)},
+            status=status.HTTP_200_OK,
+        )
+
+
 class SessionReloadAllView(APIView):
     """
     Reload all session data for resuming reading
@@ -274,21 +344,16 @@ class SessionReloadAllView(APIView):
                 )
             session.started_at = timezone.now()
             session.save(update_fields=["started_at"])
+            pages = list(session.pages.exclude(status="failed").order_by("page_index"))
+            ocr_by_page = page_payloads.session_ocr_results(pages)
             pages_data = []
-            for page in session.pages.all().order_by("id"):
+            for page in pages:
                 page_info = {
                     "page_index": page.id,
                     "img_url": page.img_url,
                     "translation_text": page.translation_text,
                     "audio_url": page.audio_url,
-                    "ocr_results": [
-                        {
-                            "bbox": bb.coordinates,
-                            "original_txt": bb.original_text,
-                            "translation_txt": bb.translated_text,
-                        }
-                        for bb in page.bbs.all()
-                    ],
+                    "ocr_results": ocr_by_page[page.id],
                 }
                 pages_data.append(page_info)
 
@@ -347,8 +412,21 @@ class DiscardSessionView(APIView):
                     except Exception as e:
                         print(f"[DEBUG] Failed to delete image {page.img_url}: {e}")
 
+            # Delete the mp3 files /page/audio materialized for its clips
+            for audio in BB.objects.filter(page__session=session).values_list(
+                "audio_base64", flat=True
+            ):
+                if isinstance(audio, str):
+                    try:
+                        audio = json.loads(audio) if audio else []
+                    except ValueError:
+                        audio = [audio]
+                remove_audio_clips(audio or [])
+
             # Delete session (CASCADE will delete Pages and BBs automatically)
+            discarded_id = session.id
             session.delete()
+            response_cache.invalidate_session(discarded_id)
 
             return Response(
                 {"message": "Session discarded successfully"},
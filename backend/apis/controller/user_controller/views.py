@@ -169,8 +169,12 @@ class UserInfoView(APIView):
                 "started_at": "datetime"
             }
         ]
+
+    With Accept: application/msgpack, image_base64 carries raw bytes.
     """
 
+    binary_fields = ("image_base64",)
+
     def get(self, request):
         device_info = request.query_params.get("device_info")
         if not device_info:
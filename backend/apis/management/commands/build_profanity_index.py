@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apis.modules import profanity_index
+from apis.modules.profanity_check import default_base_path
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile media/profanity into the snapshot that workers memory-map "
+        "at startup. Run it whenever the lists change (deploy.sh does)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            default=default_base_path(),
+            help="Directory holding <lang>.txt lists (default: media/profanity)",
+        )
+        parser.add_argument(
+            "--output",
+            default=settings.PROFANITY_INDEX_PATH,
+            help="Snapshot path (default: settings.PROFANITY_INDEX_PATH)",
+        )
+
+    def handle(self, *args, **options):
+        result = profanity_index.build(options["source"], options["output"])
+        for lang, stats in result["langs"].items():
+            self.stdout.write(
+                f"{lang}: {stats['words']} words, {stats['states']} states"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {result['path']} ({result['bytes']} bytes)")
+        )
@@ -0,0 +1,60 @@
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apis.modules import startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot Django in a fresh interpreter, import the URLconf and report the "
+        "heaviest imports. Fails when the boot exceeds the budget or pulls "
+        "in a module that should load lazily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target", default="app.urls", help="Module imported after setup"
+        )
+        parser.add_argument("--top", type=int, default=15, help="Rows per table")
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=settings.STARTUP_IMPORT_BUDGET_MS,
+            help="Boot-time target (default: settings.STARTUP_IMPORT_BUDGET_MS)",
+        )
+
+    def handle(self, *args, **options):
+        result = startup.profile_imports(options["target"])
+        imports = result["imports"]
+        top = options["top"]
+
+        self.stdout.write(f"{'cumulative ms':>14}{'self ms':>10}  module")
+        for name, self_us, cumulative_us in sorted(
+            imports, key=lambda row: row[2], reverse=True
+        )[:top]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}"
+            )
+
+        packages = Counter()
+        for name, self_us, _ in imports:
+            packages[name.split(".")[0]] += self_us
+        self.stdout.write(f"\n{'self ms':>14}  package")
+        for package, self_us in packages.most_common(top):
+            self.stdout.write(f"{self_us / 1000:>14.1f}  {package}")
+
+        boot_ms = result["seconds"] * 1000
+        budget_ms = options["budget_ms"]
+        self.stdout.write(
+            f"\nboot (django.setup + {options['target']}): {boot_ms:.0f} ms, "
+            f"budget {budget_ms:.0f} ms (includes -X importtime overhead)"
+        )
+        if result["loaded"]:
+            raise CommandError(
+                "Imported at boot, should load lazily: " + ", ".join(result["loaded"])
+            )
+        if boot_ms > budget_ms:
+            raise CommandError(f"Boot took {boot_ms:.0f} ms > {budget_ms:.0f} ms")
+        self.stdout.write(self.style.SUCCESS("Within budget"))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apis.modules import startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the worker warm-up (imports, kss, OCR clustering, LangChain "
+        "chains, provider connections) and report the time of each step. "
+        "Fails when a step fails, e.g. a provider host is unreachable."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--skip",
+            action="append",
+            default=[],
+            choices=[name for name, _ in startup.WARM_UP_STEPS],
+            help="Step to leave out (repeatable), e.g. --skip connections",
+        )
+
+    def handle(self, *args, **options):
+        result = startup.warm_up(skip=set(options["skip"]))
+
+        failed = []
+        for name, step in result["steps"].items():
+            line = f"{name:<16}{step['seconds'] * 1000:>9.0f} ms"
+            if step["error"]:
+                failed.append(name)
+                line += f"  FAILED {step['error']}"
+            self.stdout.write(line)
+
+        if failed:
+            raise CommandError("Warm-up steps failed: " + ", ".join(failed))
+        self.stdout.write(self.style.SUCCESS("Warm"))
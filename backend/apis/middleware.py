@@ -0,0 +1,212 @@
+"""
+Response compression for API payloads.
+
+Compresses text-like responses (JSON by default) with the best encoding
+the client accepts: zstd, then brotli, then gzip. brotli and zstd are
+optional; without their packages only gzip is offered.
+
+Binary bodies (mp3 / jpeg files, MessagePack with raw audio) are left
+alone by the content-type allowlist, and a body whose sample does not
+compress well is sent as-is instead of paying CPU for a few bytes.
+"""
+
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        # wbits=31: gzip container, no file name / mtime in the header
+        self._c = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._c.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level: int):
+        self._c = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._c = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._c.flush()
+
+
+# Content-Encoding token -> compressor, only for installed codecs
+CODECS = {"gzip": _GzipStream}
+if brotli is not None:
+    CODECS["br"] = _BrotliStream
+if zstandard is not None:
+    CODECS["zstd"] = _ZstdStream
+
+
+def compress_bytes(encoding: str, data: bytes, level: int) -> bytes:
+    stream = CODECS[encoding](level)
+    return stream.compress(data) + stream.finish()
+
+
+def accepted_encodings(header: str) -> dict:
+    """Parse an Accept-Encoding header into {coding: qvalue}."""
+    accepted = {}
+    for part in header.split(","):
+        coding, *params = [p.strip() for p in part.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def choose_encoding(header: str, preference) -> str:
+    """
+    First coding in `preference` that is installed and that the client
+    accepts with q > 0. Returns "" when nothing matches.
+    """
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get("*", 0.0)
+    for coding in preference:
+        if coding in CODECS and accepted.get(coding, wildcard) > 0:
+            return coding
+    return ""
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses whose Content-Type is in COMPRESSION_CONTENT_TYPES
+    and whose body is at least COMPRESSION_MIN_SIZE bytes.
+
+    Streaming responses are compressed chunk by chunk, flushing after
+    each chunk so that nothing is held back from the client.
+    """
+
+    def process_response(self, request, response):
+        if not self._eligible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = choose_encoding(
+            request.headers.get("Accept-Encoding", ""),
+            settings.COMPRESSION_ENCODINGS,
+        )
+        if not encoding:
+            return response
+        level = settings.COMPRESSION_LEVELS[encoding]
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._acompress_stream(
+                    response.streaming_content, encoding, level
+                )
+            else:
+                response.streaming_content = self._compress_stream(
+                    response.streaming_content, encoding, level
+                )
+            del response.headers["Content-Length"]
+        else:
+            content = response.content
+            if not self._worth_compressing(content, encoding, level):
+                return response
+            compressed = compress_bytes(encoding, content, level)
+            if len(compressed) >= len(content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # The representation changed; a strong validator no longer holds
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def _eligible(self, response) -> bool:
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if response.has_header("Content-Encoding"):
+            return False
+        if "no-transform" in response.get("Cache-Control", "").lower():
+            return False
+
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if content_type.lower() not in settings.COMPRESSION_CONTENT_TYPES:
+            return False
+
+        return response.streaming or (
+            len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        )
+
+    @staticmethod
+    def _worth_compressing(content: bytes, encoding: str, level: int) -> bool:
+        """
+        For large bodies, compress a sample first and skip the rest when
+        it saves less than COMPRESSION_MIN_RATIO.
+        """
+        sample_size = settings.COMPRESSION_SAMPLE_SIZE
+        if len(content) <= 2 * sample_size:
+            return True
+        sample = compress_bytes(encoding, content[:sample_size], level)
+        return len(sample) <= sample_size * (1 - settings.COMPRESSION_MIN_RATIO)
+
+    @staticmethod
+    def _compress_stream(chunks, encoding: str, level: int):
+        stream = CODECS[encoding](level)
+        for chunk in chunks:
+            data = stream.compress(chunk) + stream.flush()
+            if data:
+                yield data
+        yield stream.finish()
+
+    @staticmethod
+    async def _acompress_stream(chunks, encoding: str, level: int):
+        stream = CODECS[encoding](level)
+        async for chunk in chunks:
+            data = stream.compress(chunk) + stream.flush()
+            if data:
+                yield data
+        yield stream.finish()
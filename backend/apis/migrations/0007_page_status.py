@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apis", "0006_session_started_at_session_totalwords"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="page",
+            name="progress",
+            field=models.IntegerField(default=100),
+        ),
+        migrations.AddField(
+            model_name="page",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("ocr", "OCR"),
+                    ("translating", "Translating"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="ready",
+                max_length=20,
+            ),
+        ),
+    ]
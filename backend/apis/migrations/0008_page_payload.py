@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apis", "0007_page_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PagePayload",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="payload",
+                        serialize=False,
+                        to="apis.page",
+                    ),
+                ),
+                ("ocr_results", models.TextField(blank=True, null=True)),
+                ("audio_results", models.TextField(blank=True, null=True)),
+                ("built_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
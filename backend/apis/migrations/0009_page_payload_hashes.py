@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apis", "0008_page_payload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pagepayload",
+            name="audio_hash",
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name="pagepayload",
+            name="ocr_hash",
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name="pagepayload",
+            name="version",
+            field=models.IntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+def number_pages(apps, schema_editor):
+    """Give existing pages the positional index they were addressed by."""
+    Page = apps.get_model("apis", "Page")
+    session_ids = Page.objects.values_list("session_id", flat=True).distinct()
+    for session_id in session_ids:
+        pages = Page.objects.filter(session_id=session_id).order_by("id")
+        for index, page in enumerate(pages):
+            page.page_index = index
+            page.save(update_fields=["page_index"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apis", "0009_page_payload_hashes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="page_index",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(number_pages, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="page",
+            constraint=models.UniqueConstraint(
+                fields=("session", "page_index"), name="unique_page_index"
+            ),
+        ),
+    ]
@@ -26,3 +26,18 @@ class BB(models.Model):
 
     def __str__(self):
         return f"BB of Page {self.page.id}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._invalidate_page_payloads()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._invalidate_page_payloads()
+        return result
+
+    def _invalidate_page_payloads(self):
+        """Translation or audio may have changed: rebuild on the next read."""
+        from apis.modules.page_payloads import invalidate_page
+
+        invalidate_page(self.page_id)
@@ -16,10 +16,48 @@ class Page(models.Model):
     translation_text = models.TextField(null=True, blank=True)
     bbox_json = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(default=timezone.now)
+    # Processing state of an accepted upload (OCR -> translation).
+    # Pages created in one step (cover, older rows) are ready right away.
+    status = models.CharField(
+        max_length=20,
+        default="ready",
+        choices=[
+            ("queued", "Queued"),
+            ("ocr", "OCR"),
+            ("translating", "Translating"),
+            ("ready", "Ready"),
+            ("failed", "Failed"),
+        ],
+    )
+    progress = models.IntegerField(default=100)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # Position of the page in its session, the page_index of every API.
+    # Assigned at creation and never shifted: a failed page keeps its
+    # index (check_ocr reports it) until the retaken upload takes it over,
+    # and the pages after it keep theirs. NULL for a replaced failed page.
+    page_index = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["session", "page_index"], name="unique_page_index"
+            )
+        ]
 
     def __str__(self):
         return f"Page {self.id} of Session {self.session.id}"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.session_id is not None:
+            if self.page_index is None:
+                self.page_index = self.session.nextPageIndex()
+            Page.objects.filter(
+                session_id=self.session_id,
+                page_index=self.page_index,
+                status="failed",
+            ).update(page_index=None)
+        super().save(*args, **kwargs)
+
     def getBBs(self):
         """Returns all bounding boxes for this page"""
         return self.bbs.all()
@@ -0,0 +1,30 @@
+from django.db import models
+from django.utils import timezone
+from apis.models.page_model import Page
+
+
+class PagePayload(models.Model):
+    """
+    Materialized read payloads of a finished page
+    - Serialized JSON lists built once when processing completes, so that
+      get_ocr / get_tts / reload_all do not iterate BBs on every read
+    - NULL means "not built yet"; readers fall back to the BBs
+    - The hashes and version feed the session sync manifest
+    """
+
+    page = models.OneToOneField(
+        Page, on_delete=models.CASCADE, primary_key=True, related_name="payload"
+    )
+    # [{"bbox", "original_txt", "translation_txt"}, ...]
+    ocr_results = models.TextField(null=True, blank=True)
+    # [{"bbox_index", "audio_base64_list"}, ...]
+    audio_results = models.TextField(null=True, blank=True)
+    # First 16 hex digits of the SHA-256 of the serialized lists
+    ocr_hash = models.CharField(max_length=16, null=True, blank=True)
+    audio_hash = models.CharField(max_length=16, null=True, blank=True)
+    # Bumped every time the page's content changes after being built
+    version = models.IntegerField(default=1)
+    built_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Payload of Page {self.page_id}"
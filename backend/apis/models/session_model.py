@@ -32,13 +32,20 @@ class Session(models.Model):
         """Returns all pages belonging to the current session"""
         return self.pages.all()
 
+    def nextPageIndex(self):
+        """Page index the next page gets (a trailing failed page is retaken)"""
+        last = self.pages.exclude(status="failed").aggregate(
+            last=models.Max("page_index")
+        )["last"]
+        return 0 if last is None else last + 1
+
     def addPage(self, img_url, index=None):
         """
         Add a page to this session
 
         Args:
             img_url: URL/path to the page image
-            index: Page index (optional, not used for ordering)
+            index: Page index (optional, defaults to the next free one)
 
         Returns:
             Created Page object
@@ -46,6 +53,9 @@ class Session(models.Model):
         from apis.models.page_model import Page
 
         page = Page.objects.create(
-            session=self, img_url=img_url, created_at=timezone.now()
+            session=self,
+            img_url=img_url,
+            created_at=timezone.now(),
+            page_index=index,
         )
         return page
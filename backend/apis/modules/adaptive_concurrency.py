@@ -0,0 +1,261 @@
+"""
+Adaptive (AIMD) concurrency limits for provider calls.
+
+Each operation TTSModule sends to OpenAI -- translate, sentiment, tts
+(full model) and tts_lite -- has its own limiter, shared by every event
+loop and thread of the process. A request waits for a slot while the
+operation has `limit` requests in flight, and the limit follows the
+provider:
+
+    additive increase        every healthy response adds 1 / limit (about
+                             +1 per round of `limit` requests)
+    multiplicative decrease  a 429, or a response slower than
+                             AIMD_LATENCY_SPIKE_FACTOR x the running p50,
+                             multiplies it by AIMD_DECREASE_FACTOR (at most
+                             once per AIMD_DECREASE_COOLDOWN seconds, so
+                             one burst of 429s counts once)
+
+Other failures leave the limit where it is. hedged_call() takes the
+slot before hedging starts, so only provider time is hedged. stats()
+reports the current window of every operation.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from django.conf import settings
+
+from apis.modules import hedging, retry_policy
+from apis.modules.latency_stats import LatencyWindow
+
+T = TypeVar("T")
+
+
+class AIMDLimiter:
+    """Concurrency window of one operation."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.limit = float(settings.AIMD_INITIAL_LIMIT)
+        self.in_flight = 0
+        self.latency = LatencyWindow()
+        self.last_decrease = 0.0
+        self.counters = {
+            "calls": 0,
+            "waited": 0,
+            "increases": 0,
+            "decreases": 0,
+            "throttled": 0,
+            "latency_spikes": 0,
+        }
+        self._waiters = deque()  # (loop, future) in arrival order
+        self._lock = threading.Lock()
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < max(int(self.limit), 1)
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.counters["calls"] += 1
+            if not self._waiters and self._has_slot():
+                self.in_flight += 1
+                return
+            self.counters["waited"] += 1
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                else:
+                    granted = future.done() and not future.cancelled()
+            if granted:
+                self._release_slot()
+            raise
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free now (nobody is queued)."""
+        with self._lock:
+            if self._waiters or not self._has_slot():
+                return False
+            self.counters["calls"] += 1
+            self.in_flight += 1
+            return True
+
+    def _grant(self, future: asyncio.Future):
+        """Runs on the waiter's loop; the slot is already counted for it."""
+        if future.cancelled():
+            self._release_slot()
+        else:
+            future.set_result(None)
+
+    def _release_slot(self):
+        with self._lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def _wake(self):
+        # Called with the lock held
+        while self._waiters and self._has_slot():
+            loop, future = self._waiters.popleft()
+            self.in_flight += 1
+            try:
+                loop.call_soon_threadsafe(self._grant, future)
+            except RuntimeError:
+                # The waiter's loop is closed: nobody will take the slot
+                self.in_flight -= 1
+
+    def on_success(self, latency: float):
+        typical = self.latency.percentile(50)
+        self.latency.add(latency)
+        if (
+            typical is not None
+            and latency > settings.AIMD_LATENCY_SPIKE_FACTOR * typical
+        ):
+            self._decrease("latency_spikes")
+            return
+        with self._lock:
+            # Only grow while the window is in use (this request still counts)
+            if self.in_flight >= int(self.limit) - 1:
+                self.limit = min(self.limit + 1 / self.limit, settings.AIMD_MAX_LIMIT)
+                self.counters["increases"] += 1
+
+    def on_throttled(self):
+        self._decrease("throttled")
+
+    def _decrease(self, reason: str):
+        with self._lock:
+            self.counters[reason] += 1
+            now = time.monotonic()
+            if now - self.last_decrease < settings.AIMD_DECREASE_COOLDOWN:
+                return
+            self.last_decrease = now
+            self.limit = max(
+                self.limit * settings.AIMD_DECREASE_FACTOR, settings.AIMD_MIN_LIMIT
+            )
+            self.counters["decreases"] += 1
+
+    def release(self, outcome: str, latency: float = 0.0):
+        """Give the slot back; outcome is "ok", "throttled", "error" or "cancelled"."""
+        if outcome == "ok":
+            self.on_success(latency)
+        elif outcome == "throttled":
+            self.on_throttled()
+        self._release_slot()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                **self.counters,
+                "latency": self.latency.snapshot(),
+            }
+
+
+_limiters_lock = threading.Lock()
+_limiters: Dict[str, AIMDLimiter] = {}
+
+
+def limiter(name: str) -> AIMDLimiter:
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = AIMDLimiter(name)
+        return _limiters[name]
+
+
+class Slot:
+    """A slot held on a limiter, handed back once by run() or release()."""
+
+    def __init__(self, slots: AIMDLimiter):
+        self.slots = slots
+        self.released = False
+
+    def release(self, outcome: str, latency: float = 0.0):
+        if not self.released:
+            self.released = True
+            self.slots.release(outcome, latency)
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Await request() in this slot and release it with the outcome."""
+        t0 = time.monotonic()
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            self.release("cancelled")
+            raise
+        except Exception as e:
+            throttled = retry_policy.status_code(e) == 429
+            self.release("throttled" if throttled else "error")
+            raise
+        self.release("ok", time.monotonic() - t0)
+        return result
+
+
+async def acquire(name: str) -> Slot:
+    """Wait for a slot of the `name` limiter."""
+    slots = limiter(name)
+    await slots.acquire()
+    return Slot(slots)
+
+
+def try_acquire(name: str) -> Optional[Slot]:
+    """A slot of the `name` limiter if one is free now, else None."""
+    slots = limiter(name)
+    return Slot(slots) if slots.try_acquire() else None
+
+
+async def call(name: str, request: Callable[[], Awaitable[T]]) -> T:
+    """Await request() once a slot of the `name` limiter is free."""
+    slot = await acquire(name)
+    return await slot.run(request)
+
+
+async def hedged_call(name: str, hedge: str, request: Callable[[], Awaitable[T]]) -> T:
+    """
+    call(), hedged under the name `hedge` (apis.modules.hedging).
+
+    The primary attempt gets its slot before the hedge timer starts, and
+    a hedge runs only if another slot is free at once. Time spent queueing
+    therefore neither fires hedges nor counts as attempt latency, and a
+    saturated limiter is not sent extra requests.
+    """
+    held = [await acquire(name)]
+    ready = deque(held)
+
+    def admit() -> bool:
+        slot = try_acquire(name)
+        if slot is None:
+            return False
+        held.append(slot)
+        ready.append(slot)
+        return True
+
+    try:
+        return await hedging.call(
+            hedge, lambda: ready.popleft().run(request), admit=admit
+        )
+    finally:
+        # Slots of attempts cancelled before they started
+        for slot in held:
+            slot.release("cancelled")
+
+
+def stats() -> Dict[str, dict]:
+    """Current window and counters per operation in this process."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {slots.name: slots.snapshot() for slots in limiters}
+
+
+def reset():
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,68 @@
+import threading
+import time
+
+from django.db import connections
+
+# Number of background jobs (e.g. TTS threads) still running in this process
+_in_flight = 0
+_cond = threading.Condition()
+
+
+def start(target, name: str = None) -> threading.Thread:
+    """
+    Run target in a daemon thread and track it until it returns.
+    Tracked jobs are waited for by wait_for_drain() on graceful shutdown.
+    """
+
+    caller = threading.get_ident()
+
+    def run():
+        global _in_flight
+        try:
+            target()
+        finally:
+            if threading.get_ident() != caller:
+                # Connections opened by the job belong to this thread only;
+                # close them (or return them to the pool) instead of leaving
+                # them open until the thread is collected.
+                connections.close_all()
+            with _cond:
+                _in_flight -= 1
+                _cond.notify_all()
+
+    global _in_flight
+    with _cond:
+        _in_flight += 1
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    try:
+        thread.start()
+    except Exception:
+        with _cond:
+            _in_flight -= 1
+            _cond.notify_all()
+        raise
+    return thread
+
+
+def in_flight() -> int:
+    """Number of tracked jobs that have not finished yet."""
+    with _cond:
+        return _in_flight
+
+
+def wait_for_drain(timeout: float) -> bool:
+    """
+    Block until every tracked job has finished or timeout seconds pass.
+
+    Returns:
+        True if all jobs finished, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    with _cond:
+        while _in_flight > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _cond.wait(remaining)
+        return True
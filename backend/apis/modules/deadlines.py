@@ -0,0 +1,107 @@
+"""
+Time budget of an upload.
+
+ProcessUploadView creates one Deadline per upload (UPLOAD_DEADLINE_SECONDS,
+from the request to the last audio clip) and hands it to every stage:
+
+    OCR          request timeout capped by what is left of the page budget
+    translation  waits until page_budget() (the deadline minus
+                 UPLOAD_TTS_RESERVE); paragraphs still translating then
+                 are published as pending and finished by the TTS job
+    TTS          model routing plans against the remaining time; once it
+                 runs out, paragraphs left are marked failed
+
+Provider calls made while a deadline is active (see use()) are bounded
+by it: retry_policy does not sleep or attempt past it, and hedging skips
+a hedge that could not finish in time.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The upload's time budget ran out before a stage could finish."""
+
+
+class Deadline:
+    def __init__(self, seconds: float, expires_at: Optional[float] = None):
+        self.seconds = seconds
+        self.expires_at = (
+            time.monotonic() + seconds if expires_at is None else expires_at
+        )
+
+    def __repr__(self):
+        return f"Deadline({self.remaining():.1f}s of {self.seconds:.0f}s left)"
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        """Timeout for one operation: cap, shortened to the time left."""
+        return min(cap, self.remaining())
+
+    def check(self, stage: str):
+        if self.expired():
+            raise DeadlineExceeded(f"{stage}: deadline of {self.seconds:.0f}s passed")
+
+    def page_budget(self) -> "Deadline":
+        """When the page must be published, leaving UPLOAD_TTS_RESERVE for TTS."""
+        reserve = min(settings.UPLOAD_TTS_RESERVE, self.seconds / 2)
+        return Deadline(self.seconds - reserve, self.expires_at - reserve)
+
+
+def for_upload() -> Deadline:
+    return Deadline(settings.UPLOAD_DEADLINE_SECONDS)
+
+
+def current() -> Optional[Deadline]:
+    """Deadline of the work running in this context, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def use(deadline: Optional[Deadline]):
+    """
+    Make deadline current for the block and the tasks created in it
+    (None keeps whatever deadline is current).
+    """
+    if deadline is None:
+        yield current()
+        return
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+async def bounded(awaitable: Awaitable[T]) -> T:
+    """Await awaitable, giving up with DeadlineExceeded at the current deadline."""
+    deadline = current()
+    if deadline is None:
+        return await awaitable
+    if deadline.expired():
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        deadline.check("provider call")
+    try:
+        return await asyncio.wait_for(awaitable, deadline.remaining())
+    except TimeoutError:
+        if deadline.expired():
+            raise DeadlineExceeded("provider call: deadline passed") from None
+        raise
@@ -0,0 +1,199 @@
+import base64
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+
+AUDIO_DIR = "media/audio"
+CHUNK_SIZE = 64 * 1024
+CACHE_CONTROL = "private, max-age=86400"
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# path -> (mtime_ns, size, etag); avoids re-hashing unchanged files
+_etag_cache: Dict[str, Tuple[int, int, str]] = {}
+_etag_lock = threading.Lock()
+
+
+def file_etag(path: str) -> str:
+    """
+    Strong ETag for a file, derived from the SHA-256 of its content.
+    The digest is cached per process and recomputed only when the file's
+    mtime or size changes.
+    """
+    st = os.stat(path)
+    with _etag_lock:
+        cached = _etag_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()}"'
+
+    with _etag_lock:
+        _etag_cache[path] = (st.st_mtime_ns, st.st_size, etag)
+    return etag
+
+
+def prime_etag(path: str, sha256_hex: str):
+    """Record the digest of a file whose content hash is already known."""
+    st = os.stat(path)
+    with _etag_lock:
+        _etag_cache[path] = (st.st_mtime_ns, st.st_size, f'"{sha256_hex}"')
+
+
+def audio_clip_path(audio_base64: str) -> Tuple[str, str]:
+    """
+    Materialize a base64 audio clip as a content-addressed mp3 file.
+
+    The file name is the SHA-256 of the stored clip, so the same clip is
+    written to disk at most once and its name doubles as a strong ETag.
+
+    Returns:
+        (path, etag)
+    """
+    digest = hashlib.sha256(audio_base64.encode("ascii")).hexdigest()
+    path = os.path.join(AUDIO_DIR, f"{digest}.mp3")
+
+    if not os.path.exists(path):
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+        # Unique per process and thread; the rename makes the file appear whole
+        with tempfile.NamedTemporaryFile(
+            dir=AUDIO_DIR, prefix=f"{digest}.", suffix=".tmp", delete=False
+        ) as f:
+            f.write(base64.b64decode(audio_base64))
+        os.replace(f.name, path)
+
+    return path, f'"{digest}"'
+
+
+def remove_audio_clips(audio_base64_list):
+    """
+    Delete the materialized mp3 files of the given clips.
+
+    Clips are content-addressed, so an identical clip of another session
+    loses its file as well; audio_clip_path writes it again on the next
+    request.
+    """
+    for audio_base64 in audio_base64_list:
+        if not audio_base64:
+            continue
+        digest = hashlib.sha256(audio_base64.encode("ascii")).hexdigest()
+        path = os.path.join(AUDIO_DIR, f"{digest}.mp3")
+        with _etag_lock:
+            _etag_cache.pop(path, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[DEBUG] Failed to delete audio clip {path}: {e}")
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison used for If-None-Match (RFC 9110 13.1.2)."""
+    if header.strip() == "*":
+        return True
+    candidates = [c.strip() for c in header.split(",")]
+    return any(c.removeprefix("W/") == etag for c in candidates)
+
+
+class RangeNotSatisfiable(Exception):
+    """A well-formed Range none of whose bytes exist in the file."""
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=" header into an inclusive (start, end).
+
+    Returns None for a header that cannot be parsed (or asks for several
+    ranges), which RFC 9110 14.2 lets the server ignore: the full body is
+    sent. Raises RangeNotSatisfiable for a valid range outside the file.
+    """
+    m = _RANGE_RE.match(header.strip())
+    if not m:
+        return None
+    first, last = m.groups()
+    if not first and not last:
+        return None
+    if first and last and int(last) < int(first):
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+def _iter_range(path: str, start: int, length: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(request, path: str, content_type: str, etag: Optional[str] = None):
+    """
+    Serve a file as a binary response.
+
+    - If-None-Match -> 304 Not Modified
+    - Range (single byte range, honouring If-Range) -> 206 Partial Content,
+      or 416 when it lies outside the file; an unparseable Range is ignored
+    - otherwise a FileResponse, which WSGI servers send via sendfile
+    """
+    etag = etag or file_etag(path)
+    size = os.path.getsize(path)
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        response = HttpResponse(status=304)
+        response["ETag"] = etag
+        response["Cache-Control"] = CACHE_CONTROL
+        return response
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    byte_range = None
+    if range_header and (not if_range or if_range.strip() == etag):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is not None:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _iter_range(path, start, length), status=206, content_type=content_type
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(length)
+    else:
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+
+    response["ETag"] = etag
+    response["Accept-Ranges"] = "bytes"
+    response["Cache-Control"] = CACHE_CONTROL
+    return response
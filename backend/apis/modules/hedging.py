@@ -0,0 +1,205 @@
+"""
+Hedged provider calls.
+
+A few slow responses dominate the tail of translation and TTS. call()
+runs an attempt and, if it is still running after the running
+HEDGE_PERCENTILE latency of its operation, starts a duplicate; the first
+successful attempt wins and the other is cancelled. A failing attempt
+leaves the other one running; the call fails only when both have.
+
+Hedging stays off for an operation until its latency window holds enough
+samples, and at most HEDGE_MAX_RATE * HEDGE_RATE_WINDOW of its last
+HEDGE_RATE_WINDOW calls are hedged, which bounds the extra provider cost.
+Under a deadline (apis.modules.deadlines) a hedge is skipped when less
+than a typical (p50) attempt is left.
+
+A primary attempt cancelled because its hedge won is recorded at the
+time it had run so far (a censored sample: its real latency is at least
+that). Leaving it out would keep the slowest attempts out of the window,
+pull the p95 down and make hedging fire more and more often. A cancelled
+hedge is not recorded: it started late and lost to a primary whose own
+latency is already a sample, so its elapsed time would pull the p95 down
+the same way.
+
+Per operation, stats() reports the latency of single attempts (what a
+call costs without hedging) next to the latency callers saw, so the tail
+improvement can be read off p95 / p99.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from django.conf import settings
+
+from apis.modules import deadlines
+from apis.modules.latency_stats import LatencyWindow
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_operations: Dict[str, dict] = {}
+
+
+def _operation(name: str) -> dict:
+    with _lock:
+        if name not in _operations:
+            _operations[name] = {
+                "attempt_latency": LatencyWindow(),
+                "call_latency": LatencyWindow(),
+                "recent": deque(maxlen=settings.HEDGE_RATE_WINDOW),
+                "calls": 0,
+                "failures": 0,
+                "hedged": 0,
+                "hedge_wins": 0,
+                "rate_limited": 0,
+                "deadline_skipped": 0,
+                "not_admitted": 0,
+                "cancelled": 0,
+            }
+        return _operations[name]
+
+
+def _count(op: dict, **increments):
+    with _lock:
+        for key, value in increments.items():
+            op[key] += value
+
+
+def hedge_delay(operation: str) -> Optional[float]:
+    """Seconds before a call of operation is hedged, None while unknown."""
+    delay = _operation(operation)["attempt_latency"].percentile(
+        settings.HEDGE_PERCENTILE
+    )
+    if delay is None:
+        return None
+    return max(delay, settings.HEDGE_MIN_DELAY)
+
+
+def _fits_deadline(op: dict) -> bool:
+    """Whether a hedge started now could finish within the current deadline."""
+    deadline = deadlines.current()
+    typical = op["attempt_latency"].percentile(50)
+    if deadline is None or typical is None or deadline.remaining() >= typical:
+        return True
+    _count(op, deadline_skipped=1)
+    return False
+
+
+def _take_hedge(op: dict, admit: Optional[Callable[[], bool]]) -> bool:
+    """Whether the rate cap (and admit, if given) allows hedging the call."""
+    with _lock:
+        recent = op["recent"]
+        if sum(recent) + 1 > settings.HEDGE_MAX_RATE * recent.maxlen:
+            op["rate_limited"] += 1
+            return False
+        if admit is not None and not admit():
+            op["not_admitted"] += 1
+            return False
+        recent.append(True)
+        op["hedged"] += 1
+        return True
+
+
+async def _timed(
+    op: dict, attempt: Callable[[], Awaitable[T]], censored: bool = False
+) -> T:
+    t0 = time.monotonic()
+    try:
+        result = await attempt()
+    except asyncio.CancelledError:
+        _count(op, cancelled=1)
+        if censored:
+            op["attempt_latency"].add(time.monotonic() - t0)
+        raise
+    op["attempt_latency"].add(time.monotonic() - t0)
+    return result
+
+
+async def call(
+    operation: str,
+    attempt: Callable[[], Awaitable[T]],
+    admit: Optional[Callable[[], bool]] = None,
+) -> T:
+    """
+    Await attempt(), hedged with a second attempt() when it runs slow.
+
+    Args:
+        operation: Name the latency window and counters are kept under
+        attempt: Starts one provider call; raises on failure
+        admit: Asked right before a hedge would start; False skips it
+               (e.g. no concurrency slot is free)
+
+    Returns:
+        The result of the first successful attempt (the last error is
+        raised when every attempt failed)
+    """
+    op = _operation(operation)
+    _count(op, calls=1)
+    hedged = False
+    t0 = time.monotonic()
+    primary = asyncio.ensure_future(_timed(op, attempt, censored=True))
+    done, pending = set(), {primary}
+    try:
+        delay = hedge_delay(operation) if settings.HEDGING_ENABLED else None
+        if delay is not None:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            hedged = not done and _fits_deadline(op) and _take_hedge(op, admit)
+            if hedged:
+                pending.add(asyncio.ensure_future(_timed(op, attempt)))
+
+        error = None
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    _count(op, hedge_wins=int(task is not primary))
+                    op["call_latency"].add(time.monotonic() - t0)
+                    return task.result()
+                error = task.exception()
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+        _count(op, failures=1)
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+        if not hedged:
+            with _lock:
+                op["recent"].append(False)
+
+
+def stats() -> Dict[str, dict]:
+    """Per operation counters and latency percentiles of this process."""
+    with _lock:
+        operations = dict(_operations)
+    result = {}
+    for name, op in operations.items():
+        with _lock:
+            counters = {
+                key: op[key]
+                for key in (
+                    "calls",
+                    "failures",
+                    "hedged",
+                    "hedge_wins",
+                    "rate_limited",
+                    "deadline_skipped",
+                    "not_admitted",
+                    "cancelled",
+                )
+            }
+        counters["hedge_rate"] = round(counters["hedged"] / counters["calls"], 3)
+        counters["attempt_latency"] = op["attempt_latency"].snapshot()
+        counters["call_latency"] = op["call_latency"].snapshot()
+        result[name] = counters
+    return result
+
+
+def reset_stats():
+    with _lock:
+        _operations.clear()
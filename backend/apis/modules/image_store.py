@@ -0,0 +1,82 @@
+import base64
+import binascii
+import hashlib
+import os
+import re
+import uuid
+from typing import Tuple
+
+from apis.modules.file_serving import prime_etag
+
+IMAGE_DIR = "media/images"
+
+# Multiple of 4 so every slice is a complete run of base64 quanta
+B64_CHUNK_CHARS = 4 * 16 * 1024
+
+_WHITESPACE_RE = re.compile(r"\s")
+
+
+def _new_image_path(session_id: str, page_index: int) -> str:
+    image_filename = f"{uuid.uuid4().hex}.jpg"
+    os.makedirs(IMAGE_DIR, exist_ok=True)
+    return f"{IMAGE_DIR}/{session_id}_{page_index}_{image_filename}"
+
+
+def save_image_base64(
+    image_base64: str, session_id: str, page_index: int
+) -> Tuple[str, str]:
+    """
+    Decode a base64 image to disk in fixed-size slices, hashing as it goes,
+    so a second full copy of the image is never held in memory.
+
+    Every slice is decoded with validate=True, so a character outside the
+    base64 alphabet or misplaced padding anywhere in the payload is
+    rejected rather than silently dropped.
+
+    Returns:
+        (image_path, sha256 hex digest)
+
+    Raises:
+        binascii.Error: the payload is not valid base64 (nothing is kept
+        on disk)
+    """
+    if _WHITESPACE_RE.search(image_base64):
+        # Line-wrapped base64 (e.g. Android Base64.DEFAULT) would break
+        # slice alignment
+        image_base64 = "".join(image_base64.split())
+
+    image_path = _new_image_path(session_id, page_index)
+    digest = hashlib.sha256()
+    try:
+        with open(image_path, "wb") as f:
+            for start in range(0, len(image_base64), B64_CHUNK_CHARS):
+                chunk = base64.b64decode(
+                    image_base64[start : start + B64_CHUNK_CHARS], validate=True
+                )
+                digest.update(chunk)
+                f.write(chunk)
+    except binascii.Error:
+        os.remove(image_path)
+        raise
+
+    prime_etag(image_path, digest.hexdigest())
+    return image_path, digest.hexdigest()
+
+
+def save_image_file(uploaded_file, session_id: str, page_index: int) -> Tuple[str, str]:
+    """
+    Copy an uploaded file (multipart field or raw body) to disk chunk by
+    chunk with an incremental hash.
+
+    Returns:
+        (image_path, sha256 hex digest)
+    """
+    image_path = _new_image_path(session_id, page_index)
+    digest = hashlib.sha256()
+    with open(image_path, "wb") as f:
+        for chunk in uploaded_file.chunks():
+            digest.update(chunk)
+            f.write(chunk)
+
+    prime_etag(image_path, digest.hexdigest())
+    return image_path, digest.hexdigest()
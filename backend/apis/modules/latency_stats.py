@@ -0,0 +1,56 @@
+"""
+Running latency percentiles of provider calls.
+
+A LatencyWindow keeps the latencies of the last `size` calls of one
+operation (e.g. TTS on one model tier); percentiles are computed over
+that window, so they follow the provider as it speeds up or slows down.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+
+def _nearest_rank(samples, q: float) -> float:
+    return samples[max(math.ceil(q / 100 * len(samples)), 1) - 1]
+
+
+class LatencyWindow:
+    def __init__(self, size: int = 512, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, q: float, default: Optional[float] = None):
+        """
+        q-th percentile (0-100, nearest rank) of the window, or default
+        while it holds fewer than min_samples latencies.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return default
+        return _nearest_rank(samples, q)
+
+    def snapshot(self) -> dict:
+        """{"count", "mean", "p50", "p95", "p99"} in seconds (None when empty)."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "mean": None, "p50": None, "p95": None, "p99": None}
+        return {
+            "count": len(samples),
+            "mean": round(sum(samples) / len(samples), 3),
+            "p50": round(_nearest_rank(samples, 50), 3),
+            "p95": round(_nearest_rank(samples, 95), 3),
+            "p99": round(_nearest_rank(samples, 99), 3),
+        }
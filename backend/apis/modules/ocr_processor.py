@@ -1,13 +1,16 @@
 import os
+import asyncio
 import requests
 import uuid
 import time
 import json
-import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any
-from sklearn.cluster import DBSCAN
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
+from django.conf import settings
+from apis.modules import retry_policy
+from apis.modules.deadlines import Deadline
+from apis.modules.provider_clients import get_http_client
 
 load_dotenv()
 
@@ -84,6 +87,10 @@ class OCRModule:
         Returns:
             List of {"text": str, "bbox": dict}
         """
+        # numpy / sklearn take seconds to import; load them on first use
+        import numpy as np
+        from sklearn.cluster import DBSCAN
+
         # Filter low-confidence fields
         filtered_json = self._filter_low_confidence(result_json)
 
@@ -186,33 +193,33 @@ class OCRModule:
             results.append({"text": paragraph_text.strip(), "bbox": bbox})
         return results
 
-    def process_page(self, image_path: str) -> List[str]:
+    def _timeout(self, deadline: Optional[Deadline]) -> tuple:
+        """(connect, read) timeout of a Clova request, within the deadline"""
+        if deadline is None:
+            return settings.OCR_CONNECT_TIMEOUT, settings.OCR_READ_TIMEOUT
+        deadline.check("ocr")
+        return (
+            deadline.timeout(settings.OCR_CONNECT_TIMEOUT),
+            deadline.timeout(settings.OCR_READ_TIMEOUT),
+        )
+
+    def process_page(
+        self, image_path: str, deadline: Optional[Deadline] = None
+    ) -> List[str]:
         """
         Process a regular page image with OCR
 
         Args:
             image_path: Path to image file
+            deadline: Upload deadline; shortens the request timeout
 
         Returns:
             List of paragraphs with text and bounding boxes
         """
 
-        request_json = {
-            "images": [{"format": "png", "name": Path(image_path).stem}],
-            "requestId": str(uuid.uuid4()),
-            "version": "V2",
-            "timestamp": int(round(time.time() * 1000)),
-        }
-
-        headers = {"X-OCR-SECRET": self.secret_key}
-        files = {
-            "file": open(image_path, "rb"),
-            "message": (None, json.dumps(request_json), "application/json"),
-        }
-
         print(f"[DEBUG] Sending OCR request for {image_path}")
         start = time.time()
-        response = requests.post(self.api_url, headers=headers, files=files)
+        response = self._post(image_path, deadline)
         print(f"[DEBUG] OCR API call took {time.time() - start:.2f}s")
         print(f"[DEBUG] OCR raw response text (first 300 chars): {response.text[:300]}")
 
@@ -233,22 +240,99 @@ class OCRModule:
             Extracted title text (largest text block)
         """
 
+        print(f"[DEBUG] Sending OCR request for {image_path} (cover mode)")
+        start = time.time()
+        response = self._post(image_path, None)
+        print(f"[DEBUG] OCR API call took {time.time() - start:.2f}s")
+
+        return self._parse_cover_title(response.json())
+
+    async def aprocess_page(self, image_path: str) -> List[str]:
+        """
+        Async variant of process_page: awaits the Clova call on the running
+        event loop over the loop's shared HTTP client.
+        """
+        print(f"[DEBUG] Sending OCR request for {image_path}")
+        start = time.time()
+        result = await self._apost(image_path)
+        print(f"[DEBUG] OCR API call took {time.time() - start:.2f}s")
+        return self._parse_infer_text(result)
+
+    async def aprocess_cover_page(self, image_path: str) -> str:
+        """Async variant of process_cover_page."""
+        print(f"[DEBUG] Sending OCR request for {image_path} (cover mode)")
+        start = time.time()
+        result = await self._apost(image_path)
+        print(f"[DEBUG] OCR API call took {time.time() - start:.2f}s")
+        return self._parse_cover_title(result)
+
+    def _request_message(self, image_path: str) -> str:
+        """Clova OCR V2 request message for a single image"""
         request_json = {
             "images": [{"format": "png", "name": Path(image_path).stem}],
             "requestId": str(uuid.uuid4()),
             "version": "V2",
             "timestamp": int(round(time.time() * 1000)),
         }
-        headers = {"X-OCR-SECRET": self.secret_key}
-        files = {
-            "file": open(image_path, "rb"),
-            "message": (None, json.dumps(request_json), "application/json"),
-        }
-        print(f"[DEBUG] Sending OCR request for {image_path} (cover mode)")
-        start = time.time()
-        response = requests.post(self.api_url, headers=headers, files=files)
-        print(f"[DEBUG] OCR API call took {time.time() - start:.2f}s")
-        result = response.json()
+        return json.dumps(request_json)
+
+    def _post(self, image_path: str, deadline: Optional[Deadline]) -> requests.Response:
+        """
+        POST an image to Clova under the "ocr" retry policy and breaker
+        (apis.modules.retry_policy); every attempt reopens the image and
+        gets the timeout left by the deadline.
+        """
+
+        def attempt():
+            with open(image_path, "rb") as image:
+                files = {
+                    "file": image,
+                    "message": (
+                        None,
+                        self._request_message(image_path),
+                        "application/json",
+                    ),
+                }
+                response = requests.post(
+                    self.api_url,
+                    headers={"X-OCR-SECRET": self.secret_key},
+                    files=files,
+                    timeout=self._timeout(deadline),
+                )
+            response.raise_for_status()
+            return response
+
+        return retry_policy.call("ocr", attempt)
+
+    async def _apost(self, image_path: str) -> Dict[str, Any]:
+        """POST an image to Clova without blocking the event loop (see _post)"""
+        image_bytes = await asyncio.to_thread(Path(image_path).read_bytes)
+
+        async def attempt():
+            files = {
+                "file": (Path(image_path).name, image_bytes),
+                "message": (
+                    None,
+                    self._request_message(image_path),
+                    "application/json",
+                ),
+            }
+            response = await get_http_client().post(
+                self.api_url, headers={"X-OCR-SECRET": self.secret_key}, files=files
+            )
+            response.raise_for_status()
+            return response.json()
+
+        return await retry_policy.acall("ocr", attempt)
+
+    def _parse_cover_title(self, result: Dict[str, Any]) -> str:
+        """
+        Pick the title out of a cover page OCR response
+        (largest text block after height-based filtering)
+        """
+        # Loaded on first use, as in _parse_infer_text
+        import numpy as np
+        from sklearn.cluster import DBSCAN
 
         filtered_json = self._filter_low_confidence(result)
         images_f = filtered_json.get("images", [])
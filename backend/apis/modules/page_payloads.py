@@ -0,0 +1,157 @@
+"""
+Materialized page payloads (apis.models.page_payload_model.PagePayload).
+
+The OCR results and audio list of a page are serialized once, when the
+page (or its TTS) finishes, and read back as a single row afterwards.
+Pages without a payload (still processing, or processed before payloads
+existed) are built from their BBs, and materialized on first read once
+they are final.
+"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+import orjson
+from django.db.models import F
+from django.utils import timezone
+
+from apis.models.page_model import Page
+from apis.models.page_payload_model import PagePayload
+from apis.modules import response_cache
+
+FINAL_TTS_STATUSES = ("ready", "failed")
+
+
+def build_ocr_results(page: Page) -> List[dict]:
+    return [
+        {
+            "bbox": bb.coordinates,
+            "original_txt": bb.original_text,
+            # NULL while the translation is still pending
+            "translation_txt": bb.translated_text or "",
+        }
+        for bb in page.getBBs()
+    ]
+
+
+def has_pending_translations(page: Page) -> bool:
+    """True while paragraphs published without a translation await the TTS job."""
+    return page.bbs.filter(translated_text__isnull=True).exists()
+
+
+def build_audio_results(page: Page) -> List[dict]:
+    """Audio clips per BB; boxes without audio are left out."""
+    audio_results = []
+    for i, bb in enumerate(page.getBBs()):
+        audio_list = (
+            json.loads(bb.audio_base64)
+            if isinstance(bb.audio_base64, str)
+            else bb.audio_base64
+        )
+        if audio_list:
+            audio_results.append({"bbox_index": i, "audio_base64_list": audio_list})
+    return audio_results
+
+
+def is_tts_final(page: Page) -> bool:
+    return page.status == "ready" and not (
+        page.bbs.exclude(tts_status__in=FINAL_TTS_STATUSES).exists()
+    )
+
+
+def _stored(page_id: int, field: str) -> Optional[str]:
+    return (
+        PagePayload.objects.filter(page_id=page_id)
+        .values_list(field, flat=True)
+        .first()
+    )
+
+
+def content_hash(serialized: bytes) -> str:
+    return hashlib.sha256(serialized).hexdigest()[:16]
+
+
+def _store(page_id: int, field: str, results: List[dict]):
+    serialized = orjson.dumps(results)
+    PagePayload.objects.update_or_create(
+        page_id=page_id,
+        defaults={
+            field: serialized.decode(),
+            field.replace("_results", "_hash"): content_hash(serialized),
+            "built_at": timezone.now(),
+        },
+    )
+
+
+def materialize_ocr(page: Page) -> List[dict]:
+    """Build and store the OCR payload of a ready page."""
+    results = build_ocr_results(page)
+    _store(page.id, "ocr_results", results)
+    return results
+
+
+def materialize_audio(page: Page) -> List[dict]:
+    """Build and store the audio payload of a page whose TTS is final."""
+    results = build_audio_results(page)
+    _store(page.id, "audio_results", results)
+    return results
+
+
+def _ocr_from(page: Page, stored: Optional[str]) -> List[dict]:
+    if stored is not None:
+        return orjson.loads(stored)
+    if page.status == "ready":
+        return materialize_ocr(page)
+    return build_ocr_results(page)
+
+
+def ocr_results(page: Page) -> List[dict]:
+    """OCR results of a page, from its payload when there is one."""
+    return _ocr_from(page, _stored(page.id, "ocr_results"))
+
+
+def audio_results(page: Page):
+    """
+    Audio results of a page, from its payload when there is one.
+
+    Returns:
+        (audio_results, is_final)
+    """
+    stored = _stored(page.id, "audio_results")
+    if stored is not None:
+        return orjson.loads(stored), True
+    if is_tts_final(page):
+        return materialize_audio(page), True
+    return build_audio_results(page), False
+
+
+def session_ocr_results(pages: Iterable[Page]) -> Dict[int, List[dict]]:
+    """OCR results of many pages, reading all stored payloads in one query."""
+    pages = list(pages)
+    stored = dict(
+        PagePayload.objects.filter(
+            page_id__in=[page.id for page in pages], ocr_results__isnull=False
+        ).values_list("page_id", "ocr_results")
+    )
+    return {page.id: _ocr_from(page, stored.get(page.id)) for page in pages}
+
+
+def invalidate_page(page_id: int):
+    """
+    Drop the payloads of a page whose BBs changed, together with the
+    cached responses of its session; both are rebuilt on the next read.
+    The row stays so that its version keeps counting.
+    """
+    PagePayload.objects.filter(page_id=page_id).update(
+        ocr_results=None,
+        audio_results=None,
+        ocr_hash=None,
+        audio_hash=None,
+        version=F("version") + 1,
+    )
+    session_id = (
+        Page.objects.filter(pk=page_id).values_list("session_id", flat=True).first()
+    )
+    if session_id is not None:
+        response_cache.invalidate_session(session_id)
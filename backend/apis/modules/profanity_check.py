@@ -1,44 +1,311 @@
 import re
-from typing import List, Dict, Tuple
+from array import array
+from collections import deque
+from typing import Any, List, Dict, Optional, Tuple
 
 SUPPORTED_LANGS = ["en", "zh", "vi"]
 PROFANITY_DICT: Dict[str, List[str]] = {}
+# lang -> automaton over PROFANITY_DICT[lang], built by load_profanity_lists
+PROFANITY_MATCHERS: Dict[str, "ProfanityMatcher"] = {}
 
 
-def load_profanity_lists(base_path=None):
+def _is_word_char(c: str) -> bool:
+    # Same class as \w in a str pattern
+    return c.isalnum() or c == "_"
+
+
+# Flat uint32 tables of a compiled matcher, in snapshot order
+# (see profanity_index). State s has transitions
+# trans_char/trans_next[trans_start[s]:trans_start[s + 1]], sorted by
+# code point, and reports out[out_start[s]:out_start[s + 1]] (unique word
+# ids); unique word w has length word_len[w] and appears in the list at
+# pos[pos_start[w]:pos_start[w + 1]].
+TABLES = (
+    "trans_start",
+    "trans_char",
+    "trans_next",
+    "fail",
+    "out_start",
+    "out",
+    "word_len",
+    "pos_start",
+    "pos",
+)
+
+
+def compile_tables(words: List[str]) -> Dict[str, array]:
+    """Build the Aho-Corasick automaton of words as flat tables."""
+    # Unique words, and where each one appears in `words`
+    unique: List[str] = []
+    positions: List[List[int]] = []
+    word_ids: Dict[str, int] = {}
+    for position, word in enumerate(words):
+        if word not in word_ids:
+            word_ids[word] = len(unique)
+            unique.append(word)
+            positions.append([])
+        positions[word_ids[word]].append(position)
+
+    # Trie: state -> {char: state}; output: word ids ending at a state
+    goto: List[Dict[str, int]] = [{}]
+    output: List[List[int]] = [[]]
+    for word_id, word in enumerate(unique):
+        state = 0
+        for char in word:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                output.append([])
+            state = next_state
+        output[state].append(word_id)
+
+    # Failure links (BFS); outputs are merged along them
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            target = goto[fallback].get(char, 0)
+            fail[child] = target if target != child else 0
+            output[child] = output[child] + output[fail[child]]
+
+    tables = {name: array("I") for name in TABLES}
+    for state, transitions in enumerate(goto):
+        tables["trans_start"].append(len(tables["trans_char"]))
+        for char, child in sorted(transitions.items()):
+            tables["trans_char"].append(ord(char))
+            tables["trans_next"].append(child)
+        tables["out_start"].append(len(tables["out"]))
+        tables["out"].extend(output[state])
+    tables["trans_start"].append(len(tables["trans_char"]))
+    tables["out_start"].append(len(tables["out"]))
+    tables["fail"].extend(fail)
+    for word, word_positions in zip(unique, positions):
+        tables["word_len"].append(len(word))
+        tables["pos_start"].append(len(tables["pos"]))
+        tables["pos"].extend(word_positions)
+    tables["pos_start"].append(len(tables["pos"]))
+    return tables
+
+
+class ProfanityMatcher:
+    """
+    Aho-Corasick automaton over one language's profanity list.
+
+    A single left-to-right pass over the lowercased text reports every
+    occurrence of every listed word, including overlapping ones, so the
+    cost no longer grows with the size of the list.
+
+    The automaton lives in the flat tables of compile_tables(); `tables`
+    may be any uint32 sequences, e.g. views into a memory-mapped snapshot.
+    """
+
+    def __init__(self, words: List[str], tables: Optional[Dict[str, Any]] = None):
+        self.words = words
+        if tables is None:
+            tables = compile_tables(words)
+        self.tables = tables
+        self._trans_start = tables["trans_start"]
+        self._trans_char = tables["trans_char"]
+        self._trans_next = tables["trans_next"]
+        self._fail = tables["fail"]
+        self._out_start = tables["out_start"]
+        self._out = tables["out"]
+        self._word_len = tables["word_len"]
+        self._pos_start = tables["pos_start"]
+        self._pos = tables["pos"]
+        # Rows of the states this process visited, as ({char: state}, ends)
+        # where ends are (length, word_id) pairs; the tables stay read-only
+        self._rows: Dict[int, tuple] = {}
+
+    def _row(self, state: int) -> tuple:
+        lo, hi = self._trans_start[state], self._trans_start[state + 1]
+        row = (
+            dict(zip(map(chr, self._trans_char[lo:hi]), self._trans_next[lo:hi])),
+            tuple(
+                (self._word_len[word_id], word_id)
+                for word_id in self._out[
+                    self._out_start[state] : self._out_start[state + 1]
+                ]
+            ),
+        )
+        self._rows[state] = row
+        return row
+
+    def matches(self, text_lower: str):
+        """Yield (start, end, word_id) for every occurrence in text_lower."""
+        rows, fail, load_row = self._rows, self._fail, self._row
+        state = 0
+        row = rows.get(0) or load_row(0)
+        for i, char in enumerate(text_lower):
+            while True:
+                next_state = row[0].get(char)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if not state:
+                    break
+                state = fail[state]
+                row = rows.get(state) or load_row(state)
+            row = rows.get(state) or load_row(state)
+            for length, word_id in row[1]:
+                yield i + 1 - length, i + 1, word_id
+
+    def _words_of(self, word_ids) -> List[str]:
+        """Listed words with the given ids, in list order (with duplicates)."""
+        pos_start, pos = self._pos_start, self._pos
+        positions = sorted(
+            pos[k]
+            for word_id in word_ids
+            for k in range(pos_start[word_id], pos_start[word_id + 1])
+        )
+        return [self.words[p] for p in positions]
+
+    def found_words(self, text_lower: str) -> List[str]:
+        """Listed words occurring in text_lower, in list order."""
+        return self._words_of({word_id for _, _, word_id in self.matches(text_lower)})
+
+    def remove(self, text: str) -> Tuple[List[str], str]:
+        """
+        Found words (as in is_clean) and the text with every word-bounded
+        occurrence removed, as removing the found words one at a time with
+        re.sub(r"\\b<word>\\b", "", flags=re.IGNORECASE) does.
+
+        Removing a span bounded by word characters leaves every other
+        boundary in place, so one pass gives the same result. When spans
+        overlap, or a removed word starts or ends with a non-word
+        character (e.g. a punctuation-only word, whose removal joins the
+        words around it), earlier removals change what later words
+        match; those texts are delegated to the sequential removal. Not
+        reproduced: a listed phrase that only appears across the gap an
+        earlier removal leaves behind.
+        """
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            # Lowercasing changed offsets (e.g. "İ"); positions would not map
+            found = self.found_words(text_lower)
+            return found, (_remove_sequential(text, found) if found else text)
+
+        matched = set()
+        spans = []
+        joins_words = False
+        for start, end, word_id in self.matches(text_lower):
+            matched.add(word_id)
+            if _is_boundary(text, start) and _is_boundary(text, end):
+                spans.append((start, end))
+                joins_words = joins_words or not (
+                    _is_word_char(text[start]) and _is_word_char(text[end - 1])
+                )
+
+        found = self._words_of(matched)
+        if not found:
+            return found, text
+        if joins_words:
+            return found, _remove_sequential(text, found)
+
+        spans.sort()
+        for (_, prev_end), (start, _) in zip(spans, spans[1:]):
+            if start < prev_end:
+                return found, _remove_sequential(text, found)
+
+        pieces, last = [], 0
+        for start, end in spans:
+            pieces.append(text[last:start])
+            last = end
+        pieces.append(text[last:])
+        return found, re.sub(r"\s+", " ", "".join(pieces)).strip()
+
+
+def _is_boundary(text: str, i: int) -> bool:
+    """Whether \\b matches at index i of text."""
+    before = i > 0 and _is_word_char(text[i - 1])
+    after = i < len(text) and _is_word_char(text[i])
+    return before != after
+
+
+def _remove_sequential(text: str, found_words: List[str]) -> str:
+    result = text
+    for word in found_words:
+        pattern = r"\b" + re.escape(word) + r"\b"
+        result = re.sub(pattern, "", result, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", result).strip()
+
+
+def read_list(path: str) -> List[str]:
+    """Normalized words of a list file (raises FileNotFoundError)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+
+def default_base_path() -> str:
+    import os
+
+    return os.path.join(os.path.dirname(__file__), "../../media/profanity")
+
+
+def load_profanity_lists(base_path=None, index_path=None):
+    """
+    Load the lists and their matchers. With index_path, the compiled
+    snapshot there is memory-mapped instead when it is up to date with
+    the lists (see profanity_index); otherwise they are parsed and
+    compiled here.
+    """
     import os
 
     global PROFANITY_DICT
     if base_path is None:
-        base_path = os.path.join(os.path.dirname(__file__), "../../media/profanity")
+        base_path = default_base_path()
+
+    if index_path is not None:
+        from apis.modules import profanity_index
+
+        matchers = profanity_index.load(base_path, index_path)
+        if matchers is not None:
+            for lang, matcher in matchers.items():
+                PROFANITY_DICT[lang] = matcher.words
+                PROFANITY_MATCHERS[lang] = matcher
+            return
 
     for lang in SUPPORTED_LANGS:
         try:
-            path = os.path.join(base_path, f"{lang}.txt")
-            with open(path, "r", encoding="utf-8") as f:
-                PROFANITY_DICT[lang] = [
-                    line.strip().lower() for line in f if line.strip()
-                ]
+            PROFANITY_DICT[lang] = read_list(os.path.join(base_path, f"{lang}.txt"))
         except FileNotFoundError:
             PROFANITY_DICT[lang] = []
             print(f"Warning: {lang}.txt not found, empty list loaded.")
+        PROFANITY_MATCHERS[lang] = ProfanityMatcher(PROFANITY_DICT[lang])
 
 
-def is_clean(text: str, lang: str) -> Tuple[bool, List[str]]:
-    """
-    text에 profanity가 하나라도 있으면 False, 존재한 단어 리스트도 반환
-    """
+def _matcher(lang: str) -> ProfanityMatcher:
     if lang not in SUPPORTED_LANGS:
         raise ValueError(f"Unsupported language code: {lang}")
 
-    profanity_list = PROFANITY_DICT.get(lang, [])
-    text_lower = text.lower()
-    found_words = []
+    words = PROFANITY_DICT.get(lang, [])
+    matcher = PROFANITY_MATCHERS.get(lang)
+    if matcher is None or matcher.words is not words:
+        # List replaced after loading: rebuild for the current one
+        matcher = PROFANITY_MATCHERS[lang] = ProfanityMatcher(words)
+    return matcher
 
-    for word in profanity_list:
-        pattern = r"\b" + re.escape(word) + r"\b"
-        if re.search(pattern, text_lower) or word in text_lower:
-            found_words.append(word)
+
+def is_clean(text: str, lang: str) -> Tuple[bool, List[str]]:
+    """
+    text에 profanity가 하나라도 있으면 False, 존재한 단어 리스트도 반환
+    """
+    found_words = _matcher(lang).found_words(text.lower())
 
     is_text_clean = len(found_words) == 0
     return is_text_clean, found_words
+
+
+def remove_profanity(text: str, lang: str) -> str:
+    """
+    text에서 profanity 단어를 제거한 결과를 반환 (is_clean과 같은 한 번의 탐색)
+    """
+    _, cleaned = _matcher(lang).remove(text)
+    return cleaned
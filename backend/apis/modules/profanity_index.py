@@ -0,0 +1,178 @@
+"""
+Compiled profanity index snapshot.
+
+`manage.py build_profanity_index` writes the normalized lists of every
+supported language together with their compiled matcher tables
+(profanity_check.TABLES) into one binary file. At startup each worker
+memory-maps it read-only instead of parsing the lists and building the
+automata again; the mapping is backed by the page cache, so every worker
+on the host shares the same physical pages.
+
+Layout: MAGIC, a uint32 header length, a JSON header, then 4-byte aligned
+chunks (UTF-8 words joined by newlines, native uint32 tables) located by
+the [offset, length] pairs of the header, relative to the data start.
+
+The header records a digest of the source list files. When the lists
+change, the snapshot is stale and is ignored until it is rebuilt.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Dict, Optional
+
+from apis.modules.profanity_check import (
+    SUPPORTED_LANGS,
+    TABLES,
+    ProfanityMatcher,
+    read_list,
+)
+
+MAGIC = b"PROFIDX\0"
+FORMAT_VERSION = 1
+_HEADER_LEN = struct.Struct("<I")
+
+
+def _align(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def source_digest(base_path: str) -> str:
+    """Digest of the list files a snapshot is built from."""
+    digest = hashlib.sha256()
+    for lang in SUPPORTED_LANGS:
+        digest.update(lang.encode() + b"\0")
+        try:
+            with open(os.path.join(base_path, f"{lang}.txt"), "rb") as f:
+                content = f.read()
+            digest.update(struct.pack("<Q", len(content)) + content)
+        except FileNotFoundError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def build(base_path: str, index_path: str) -> dict:
+    """
+    Compile the lists under base_path into a snapshot at index_path.
+
+    The file is replaced atomically, so workers still mapping the previous
+    snapshot keep reading it intact.
+
+    Returns:
+        {"path": str, "bytes": int, "langs": {lang: {"words": int, "states": int}}}
+    """
+    chunks = []
+    offset = 0
+
+    def add(data: bytes):
+        nonlocal offset
+        location = [offset, len(data)]
+        padded = data + b"\0" * (_align(len(data)) - len(data))
+        chunks.append(padded)
+        offset += len(padded)
+        return location
+
+    langs = {}
+    stats = {}
+    for lang in SUPPORTED_LANGS:
+        try:
+            words = read_list(os.path.join(base_path, f"{lang}.txt"))
+        except FileNotFoundError:
+            words = []
+            print(f"Warning: {lang}.txt not found, empty list loaded.")
+        tables = ProfanityMatcher(words).tables
+        langs[lang] = {
+            "words": add("\n".join(words).encode("utf-8")),
+            "tables": {name: add(tables[name].tobytes()) for name in TABLES},
+        }
+        stats[lang] = {"words": len(words), "states": len(tables["fail"])}
+
+    header = json.dumps(
+        {
+            "format": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "source_digest": source_digest(base_path),
+            "langs": langs,
+        }
+    ).encode("utf-8")
+    prefix = MAGIC + _HEADER_LEN.pack(len(header)) + header
+    prefix += b"\0" * (_align(len(prefix)) - len(prefix))
+
+    directory = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".profanity-")
+    try:
+        os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(prefix)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return {"path": index_path, "bytes": len(prefix) + offset, "langs": stats}
+
+
+def _read_header(buffer):
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError("bad magic")
+    start = len(MAGIC) + _HEADER_LEN.size
+    (length,) = _HEADER_LEN.unpack(buffer[len(MAGIC) : start])
+    header = json.loads(bytes(buffer[start : start + length]))
+    return header, _align(start + length)
+
+
+def load(base_path: str, index_path: str) -> Optional[Dict[str, ProfanityMatcher]]:
+    """
+    Matchers of every supported language backed by the mapped snapshot,
+    or None when there is no usable snapshot (missing, corrupt, or built
+    from other lists than the ones under base_path).
+    """
+    try:
+        with open(index_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: cannot map profanity index {index_path}: {e}")
+        return None
+
+    try:
+        header, data_start = _read_header(buffer)
+        if (
+            header["format"] != FORMAT_VERSION
+            or header["byteorder"] != sys.byteorder
+            or header["source_digest"] != source_digest(base_path)
+        ):
+            print(
+                f"Warning: profanity index {index_path} is stale, compiling "
+                "the lists instead (run manage.py build_profanity_index)."
+            )
+            return None
+
+        view = memoryview(buffer)
+
+        def chunk(location):
+            start, length = location
+            start += data_start
+            if start + length > len(view):
+                raise ValueError("chunk out of range")
+            return view[start : start + length]
+
+        matchers = {}
+        for lang in SUPPORTED_LANGS:
+            entry = header["langs"][lang]
+            words_bytes = bytes(chunk(entry["words"]))
+            words = words_bytes.decode("utf-8").split("\n") if words_bytes else []
+            tables = {name: chunk(entry["tables"][name]).cast("I") for name in TABLES}
+            matchers[lang] = ProfanityMatcher(words, tables)
+        return matchers
+    except (KeyError, TypeError, ValueError, struct.error) as e:
+        print(f"Warning: profanity index {index_path} is unreadable ({e}).")
+        return None
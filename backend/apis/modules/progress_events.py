@@ -0,0 +1,80 @@
+"""
+In-process change notifications for page processing progress.
+
+The upload / TTS pipeline calls publish(session_id) whenever it persists a
+page stage or a BB's TTS status. Listeners (the SSE stream, long-polling
+status checks) wait for the session's version to move past the one they
+last saw, then re-read the state from the database.
+
+Only a wake-up is delivered, never the state itself, so the database stays
+the single source of truth. A listener in another process simply does not
+get woken early; it falls back to its periodic re-check.
+"""
+
+import asyncio
+import threading
+from typing import Dict, Set, Tuple
+
+# session_id -> version, bumped on every publish
+_versions: Dict[str, int] = {}
+# session_id -> async waiters, as (loop, event) pairs
+_async_waiters: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+_condition = threading.Condition()
+
+
+def version(session_id) -> int:
+    """Current change version of a session (0 if nothing was published)."""
+    with _condition:
+        return _versions.get(str(session_id), 0)
+
+
+def publish(session_id):
+    """Record a change for a session and wake everyone waiting on it."""
+    key = str(session_id)
+    with _condition:
+        _versions[key] = _versions.get(key, 0) + 1
+        waiters = list(_async_waiters.get(key, ()))
+        _condition.notify_all()
+
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # loop already closed
+
+
+def wait_for_change(session_id, since: int, timeout: float) -> int:
+    """
+    Block until the session's version is greater than `since`, or until
+    `timeout` seconds have passed. Returns the current version.
+    """
+    key = str(session_id)
+    with _condition:
+        _condition.wait_for(lambda: _versions.get(key, 0) > since, timeout=timeout)
+        return _versions.get(key, 0)
+
+
+async def async_wait_for_change(session_id, since: int, timeout: float) -> int:
+    """Async variant of wait_for_change; does not block the event loop."""
+    key = str(session_id)
+    event = asyncio.Event()
+    waiter = (asyncio.get_running_loop(), event)
+
+    with _condition:
+        if _versions.get(key, 0) > since:
+            return _versions[key]
+        _async_waiters.setdefault(key, set()).add(waiter)
+
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        with _condition:
+            waiters = _async_waiters.get(key)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del _async_waiters[key]
+
+    return version(key)
@@ -0,0 +1,100 @@
+"""
+Provider clients shared across requests.
+
+httpx / OpenAI async clients keep a connection pool that is bound to the
+event loop it was first used on, so clients are cached per running loop.
+Under ASGI that is one set per worker, reused by every request; under
+WSGI each request's temporary loop gets its own set, which the view
+closes with aclose_clients() before the loop is discarded.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+
+OCR_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+
+# event loop -> {client name: client}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+# Key of the httpx clients created for a loop, closed by aclose_clients()
+_OWNED = "_owned"
+
+
+def _loop_clients() -> dict:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.get(loop)
+        if clients is None:
+            clients = _clients[loop] = {}
+    return clients
+
+
+def _new_http_client(clients: dict, **kwargs) -> httpx.AsyncClient:
+    client = httpx.AsyncClient(limits=HTTP_LIMITS, **kwargs)
+    clients.setdefault(_OWNED, []).append(client)
+    return client
+
+
+async def aclose_clients():
+    """Close and forget the running loop's clients."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.pop(loop, None)
+    if clients:
+        await asyncio.gather(
+            *(client.aclose() for client in clients.get(_OWNED, [])),
+            return_exceptions=True,
+        )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Plain HTTP client (Clova OCR) for the running event loop."""
+    clients = _loop_clients()
+    if "http" not in clients:
+        clients["http"] = _new_http_client(clients, timeout=OCR_TIMEOUT)
+    return clients["http"]
+
+
+def get_openai_client():
+    """AsyncOpenAI client (TTS) for the running event loop."""
+    from openai import AsyncOpenAI
+
+    clients = _loop_clients()
+    if "openai" not in clients:
+        # Retries are left to apis.modules.retry_policy
+        clients["openai"] = AsyncOpenAI(
+            http_client=_new_http_client(clients), max_retries=0
+        )
+    return clients["openai"]
+
+
+def get_tts_module(target_lang: str):
+    """TTSModule per target language, reusing the loop's shared clients."""
+    from apis.modules.tts_processor import TTSModule
+
+    clients = _loop_clients()
+    key = ("tts", target_lang)
+    if key not in clients:
+        clients[key] = TTSModule(
+            target_lang=target_lang,
+            client=get_openai_client(),
+            http_client=_new_http_client(clients),
+        )
+    return clients[key]
+
+
+def get_word_picker():
+    """StoryWordPicker reusing a shared HTTP client for its LLM calls."""
+    from apis.modules.word_picker import StoryWordPicker
+
+    clients = _loop_clients()
+    if "word_picker" not in clients:
+        clients["word_picker"] = StoryWordPicker(http_client=_new_http_client(clients))
+    return clients["word_picker"]
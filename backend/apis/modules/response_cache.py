@@ -0,0 +1,145 @@
+"""
+Response cache for finished page reads (get_image, get_ocr, get_tts).
+
+Once a page is processed its responses never change, so the rendered
+bytes are cached per (endpoint, session_id, page_index, format, version).
+`version` is a per-session token stored in the same cache;
+invalidate_session() replaces it, which orphans every cached response of
+the session at once (they then expire through the cache's own TIMEOUT).
+
+Only final states are cached (see the `cache_response` flag set by the
+views); a ready page whose translations are still pending is not final.
+A discard or a page change still has to reach every worker, so the
+version tokens live in the same shared cache as the responses (the file
+backend by default; a per-process locmem cache only suits one worker).
+Bodies over RESPONSE_CACHE_MAX_ENTRY_BYTES are not stored.
+"""
+
+import threading
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from rest_framework.response import Response
+
+# endpoint -> count, per process
+_hits: Counter = Counter()
+_misses: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+def _cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(session_id) -> str:
+    # Canonical UUID form, however the id was spelled in the request
+    return f"page-version:{uuid.UUID(str(session_id))}"
+
+
+def session_version(session_id) -> str:
+    """Current cache version token of a session."""
+    key = _version_key(session_id)
+    cache = _cache()
+    version = cache.get(key)
+    if version is None:
+        # add() so that concurrent first readers agree on one token
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_session(session_id):
+    """Drop every cached page response of a session."""
+    _cache().set(_version_key(session_id), uuid.uuid4().hex, timeout=None)
+
+
+def page_key(endpoint: str, session_id, page_index, fmt: str):
+    """
+    Cache key of a page response, or None when the parameters are not
+    a well-formed (UUID, non-negative int) pair.
+    """
+    try:
+        session_id = uuid.UUID(str(session_id))
+        page_index = int(page_index)
+    except (TypeError, ValueError):
+        return None
+    if page_index < 0:
+        return None
+    version = session_version(session_id)
+    return f"page:{endpoint}:{session_id}:{page_index}:{fmt}:{version}"
+
+
+def get(endpoint: str, key: str):
+    """Cached response for key (X-Cache: HIT), or None on a miss."""
+    cached = _cache().get(key)
+    with _stats_lock:
+        (_hits if cached is not None else _misses)[endpoint] += 1
+    if cached is None:
+        return None
+
+    content, content_type = cached
+    response = HttpResponse(content, content_type=content_type)
+    response["X-Cache"] = "HIT"
+    return response
+
+
+def store(key: str, response):
+    """Cache a rendered 200 response unless its body is too large."""
+    if len(response.content) <= settings.RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        _cache().set(key, (response.content, response["Content-Type"]))
+    response["X-Cache"] = "MISS"
+
+
+def stats() -> dict:
+    """Hit / miss counters of this process, per endpoint."""
+    with _stats_lock:
+        endpoints = sorted(set(_hits) | set(_misses))
+        result = {}
+        for endpoint in endpoints:
+            hits, misses = _hits[endpoint], _misses[endpoint]
+            result[endpoint] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4),
+            }
+    return result
+
+
+class CachedPageReadMixin:
+    """
+    APIView mixin storing GET responses in the response cache.
+
+    The view names its endpoint in `cache_endpoint`, returns
+    cached_response(request) when it is not None, and sets
+    `self.cache_response = True` once the page it read is in its final
+    state; only then is the 200 response stored.
+    """
+
+    cache_endpoint = ""
+
+    def cached_response(self, request):
+        self.cache_response = False
+        self.cache_key = page_key(
+            self.cache_endpoint,
+            request.query_params.get("session_id"),
+            request.query_params.get("page_index"),
+            request.accepted_renderer.format,
+        )
+        if self.cache_key is None:
+            return None
+        return get(self.cache_endpoint, self.cache_key)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            isinstance(response, Response)
+            and response.status_code == 200
+            and getattr(self, "cache_key", None) is not None
+            and getattr(self, "cache_response", False)
+        ):
+            response.render()
+            store(self.cache_key, response)
+        return response
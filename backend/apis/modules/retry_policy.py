@@ -0,0 +1,288 @@
+"""
+Retries and circuit breakers for provider calls.
+
+Every OpenAI call (translation, sentiment, TTS, word picking) goes
+through acall() / call() under the name of its model, and every Clova
+OCR request under "ocr". A failed attempt is
+classified before anything else happens:
+
+    transient   429, 408/409, 5xx, connection errors and timeouts: retried
+                after the provider's Retry-After, or after a jittered
+                exponential backoff; counts against the model's breaker
+    invalid     the model's structured output failed validation: retried
+                at once (the provider is healthy, another sample may pass)
+    fatal       any other 4xx (bad request, auth) and every other error,
+                e.g. a KeyError in our own response handling: raised
+                immediately, without counting against the breaker
+
+Each model has a breaker: after BREAKER_FAILURE_THRESHOLD consecutive
+transient failures it opens, and calls fail fast with CircuitOpenError
+for BREAKER_RESET_TIMEOUT seconds instead of holding workers through a
+provider outage; then a single probe call is let through, and its
+outcome closes or reopens the breaker.
+
+The SDK clients are built with max_retries=0 so this is the only retry
+layer.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from django.conf import settings
+
+from apis.modules import deadlines
+
+T = TypeVar("T")
+
+TRANSIENT = "transient"
+INVALID = "invalid"
+FATAL = "fatal"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_RETRYABLE_STATUS = {408, 409, 429}
+_INVALID_ERRORS = {"ValidationError", "OutputParserException"}
+# Matched by class name along the MRO, so the SDKs stay lazy imports:
+# openai's connection / timeout errors, httpx's transport errors (which
+# include its timeouts), requests' ConnectionError and Timeout, and the
+# builtin ones (asyncio.TimeoutError is TimeoutError; socket.gaierror is
+# a failed DNS lookup)
+_TRANSIENT_ERRORS = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "TransportError",
+    "TimeoutException",
+    "ConnectionError",
+    "Timeout",
+    "TimeoutError",
+    "gaierror",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the provider while a model's breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit open, retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+def status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify(exc: BaseException) -> str:
+    status = status_code(exc)
+    if status is not None:
+        if status in _RETRYABLE_STATUS or status >= 500:
+            return TRANSIENT
+        return FATAL
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if names & _INVALID_ERRORS:
+        return INVALID
+    if names & _TRANSIENT_ERRORS:
+        return TRANSIENT
+    return FATAL
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the provider asked to wait (Retry-After / retry-after-ms)."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return max(float(headers["retry-after-ms"]) / 1000, 0.0)
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            date = email.utils.parsedate_to_datetime(value)
+            return max(date.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(attempt: int) -> float:
+    """Full-jitter exponential delay before retry number `attempt` (1-based)."""
+    ceiling = min(
+        settings.RETRY_MAX_DELAY, settings.RETRY_BASE_DELAY * 2 ** (attempt - 1)
+    )
+    return random.uniform(0, ceiling)
+
+
+class Breaker:
+    """Circuit breaker of one model: closed -> open -> half_open -> ..."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.counters = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Raise CircuitOpenError unless an attempt may go to the provider."""
+        with self._lock:
+            if self.state == OPEN:
+                retry_in = (
+                    self.opened_at + settings.BREAKER_RESET_TIMEOUT - time.monotonic()
+                )
+                if retry_in > 0:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(self.name, retry_in)
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self.probing:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self.probing = True
+            self.counters["calls"] += 1
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.counters["failures"] += 1
+            self.probing = False
+            if (
+                self.state == HALF_OPEN
+                or self.failures >= settings.BREAKER_FAILURE_THRESHOLD
+            ):
+                if self.state != OPEN:
+                    self.counters["opened"] += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """An attempt ended without telling anything about provider health."""
+        with self._lock:
+            self.probing = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                **self.counters,
+            }
+
+
+_breakers_lock = threading.Lock()
+_breakers: Dict[str, Breaker] = {}
+
+
+def breaker(name: str) -> Breaker:
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = Breaker(name)
+        return _breakers[name]
+
+
+def _after_failure(name: str, exc: BaseException, attempt: int) -> Optional[float]:
+    """
+    Record a failed attempt; seconds to wait before the next one, or None
+    to give up and raise.
+    """
+    if isinstance(exc, deadlines.DeadlineExceeded):
+        breaker(name).release()
+        return None
+
+    kind = classify(exc)
+    if kind == TRANSIENT:
+        breaker(name).record_failure()
+    else:
+        breaker(name).release()
+
+    if kind == FATAL or attempt >= settings.RETRY_MAX_ATTEMPTS:
+        return None
+    if kind == INVALID:
+        delay = 0.0
+    else:
+        asked = retry_after(exc)
+        if asked is not None and asked > settings.RETRY_MAX_DELAY:
+            return None
+        delay = asked if asked is not None else backoff(attempt)
+    deadline = deadlines.current()
+    if deadline is not None and delay >= deadline.remaining():
+        # The next attempt could not start before the deadline
+        return None
+    print(f"[retry] {name} attempt {attempt} failed ({kind}): {exc}")
+    print(f"[retry] {name} retrying in {delay:.2f}s")
+    return delay
+
+
+async def acall(name: str, attempt: Callable[[], Awaitable[T]]) -> T:
+    """
+    Await attempt() under the retry policy and breaker of `name`, within
+    the current deadline (apis.modules.deadlines) if there is one.
+
+    Raises:
+        CircuitOpenError while the breaker is open, DeadlineExceeded once
+        the deadline passes, else the last error once the call is given up
+    """
+    for number in range(1, settings.RETRY_MAX_ATTEMPTS + 1):
+        breaker(name).allow()
+        try:
+            result = await deadlines.bounded(attempt())
+        except asyncio.CancelledError:
+            breaker(name).release()
+            raise
+        except Exception as e:
+            delay = _after_failure(name, e, number)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+        breaker(name).record_success()
+        return result
+
+
+def call(name: str, attempt: Callable[[], T]) -> T:
+    """Blocking variant of acall() (the deadline is checked between attempts)."""
+    deadline = deadlines.current()
+    for number in range(1, settings.RETRY_MAX_ATTEMPTS + 1):
+        if deadline is not None:
+            deadline.check(name)
+        breaker(name).allow()
+        try:
+            result = attempt()
+        except Exception as e:
+            delay = _after_failure(name, e, number)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+        breaker(name).record_success()
+        return result
+
+
+def stats() -> Dict[str, dict]:
+    """Breaker state and counters per model in this process."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.snapshot() for b in breakers}
+
+
+def reset():
+    with _breakers_lock:
+        _breakers.clear()
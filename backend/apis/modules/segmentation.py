@@ -0,0 +1,173 @@
+"""
+Sentence segmentation of OCR paragraphs (kss.split_sentences).
+
+kss loads its morpheme analyzer on the first call and costs a few ms
+per paragraph afterwards, while the same paragraphs come back on every
+retry, re-upload and translation of a book. Results are therefore
+memoized per normalized paragraph in a bounded LRU.
+
+Short paragraphs that are plainly punctuated are split by rule instead:
+pieces end at . ! ? followed by a space, right after a sentence-final
+ending (다, 요, 까, ...), and every piece must look like a single
+sentence: no quotes, brackets or inner punctuation, and no inner word
+ending in a syllable kss may treat as a sentence ending. That includes
+any syllable with a final ㅁ, since kss ends a sentence at nominal
+endings such as 맑음, 정답임 or 고픔. Anything else goes to kss, so both
+paths return the same sentences.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+
+# Paragraph used to load kss' backend before the first real request
+WARM_UP_TEXT = "옛날 옛적에 작은 여우가 살았어요 그리고 엄마를 찾으러 갔답니다. 안녕!"
+
+_TERMINATORS = ".!?"
+_PIECE_END = re.compile(r"(?<=[가-힣][.!?]) +")
+# Characters that kss handles specially (quotes, brackets, ellipses, ...)
+_SPECIAL = re.compile(r"[\"'“”‘’「」『』()\[\]{}<>《》〈〉…~\n]")
+# Last syllables of Korean sentence-final endings (다, 요, 까, 죠, ...)
+_FINAL_SYLLABLES = set("다요까죠니네자라어아지야게래대데때걸군나든며고서")
+# Of those, the ones kss reliably splits after when punctuated (connective
+# endings such as 고 / 서 / 며 are split after only sometimes)
+_PIECE_FINAL_SYLLABLES = _FINAL_SYLLABLES - set("며고서")
+_HANGUL_FIRST, _HANGUL_LAST = ord("가"), ord("힣")
+# Index of the final consonant ㅁ within a precomposed Hangul syllable
+_FINAL_MIEUM = 16
+
+_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "rule_based": 0}
+
+
+def normalize(text: str) -> str:
+    """Cache key (and kss input) of a paragraph."""
+    return unicodedata.normalize("NFC", (text or "").replace("\r\n", "\n")).strip()
+
+
+def _may_end_sentence(syllable: str) -> bool:
+    if syllable in _FINAL_SYLLABLES:
+        return True
+    code = ord(syllable)
+    return (
+        _HANGUL_FIRST <= code <= _HANGUL_LAST
+        and (code - _HANGUL_FIRST) % 28 == _FINAL_MIEUM
+    )
+
+
+def _single_sentence(piece: str) -> bool:
+    if _SPECIAL.search(piece):
+        return False
+    body = piece.rstrip(_TERMINATORS)
+    if any(c in _TERMINATORS for c in body):
+        return False
+    words = body.split(" ")
+    return all(word and not _may_end_sentence(word[-1]) for word in words[:-1])
+
+
+def split_rule_based(text: str) -> Optional[List[str]]:
+    """
+    Sentences of a normalized paragraph split by punctuation, or None when
+    the paragraph is not plain enough for the rules to agree with kss.
+    """
+    if len(text) > settings.SEGMENTATION_RULE_MAX_CHARS:
+        return None
+    pieces = _PIECE_END.split(text)
+    if not all(_single_sentence(piece) for piece in pieces):
+        return None
+    # kss only splits after a sentence-final ending, not after any mark
+    if any(
+        piece.rstrip(_TERMINATORS)[-1] not in _PIECE_FINAL_SYLLABLES
+        for piece in pieces[:-1]
+    ):
+        return None
+    return pieces
+
+
+def _kss_split(texts: List[str]) -> List[List[str]]:
+    import kss
+
+    if len(texts) == 1:
+        # kss flattens the result of a one-element list
+        return [kss.split_sentences(texts[0])]
+    # One process: kss would otherwise fork a pool for list inputs
+    return kss.split_sentences(texts, num_workers=1)
+
+
+def _remember(key: str, sentences: List[str]):
+    with _lock:
+        _cache[key] = sentences
+        _cache.move_to_end(key)
+        while len(_cache) > settings.SEGMENTATION_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def split_paragraphs(texts: Iterable[str]) -> List[List[str]]:
+    """
+    Sentences of every paragraph of a page, in order. Paragraphs missing
+    from the cache that the rules cannot split go to kss in one call.
+    """
+    keys = [normalize(text) for text in texts]
+    results: List[Optional[List[str]]] = [None] * len(keys)
+    pending = {}
+
+    with _lock:
+        for i, key in enumerate(keys):
+            if not key:
+                results[i] = []
+            elif key in _cache:
+                _cache.move_to_end(key)
+                results[i] = _cache[key]
+                _stats["hits"] += 1
+            else:
+                pending.setdefault(key, []).append(i)
+                _stats["misses"] += 1
+
+    to_kss = []
+    for key in pending:
+        sentences = split_rule_based(key)
+        if sentences is None:
+            to_kss.append(key)
+            continue
+        with _lock:
+            _stats["rule_based"] += 1
+        _remember(key, sentences)
+        for i in pending[key]:
+            results[i] = sentences
+
+    if to_kss:
+        for key, sentences in zip(to_kss, _kss_split(to_kss)):
+            _remember(key, sentences)
+            for i in pending[key]:
+                results[i] = sentences
+
+    # Callers own their lists; the cached ones stay untouched
+    return [list(sentences) for sentences in results]
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of one paragraph (kss.split_sentences, memoized)."""
+    return split_paragraphs([text])[0]
+
+
+def warm_up():
+    """Load kss and its backend so the first request does not pay for it."""
+    _kss_split([WARM_UP_TEXT])
+
+
+def cache_info() -> dict:
+    """Counters of this process: cache hits / misses, rule-based splits."""
+    with _lock:
+        return {**_stats, "size": len(_cache)}
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        for name in _stats:
+            _stats[name] = 0
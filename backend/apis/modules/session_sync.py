@@ -0,0 +1,123 @@
+"""
+Session sync manifest (GET /session/sync).
+
+A manifest lists, per page, its processing status, content version and
+the hashes of its materialized OCR / audio payloads (see page_payloads).
+The sync token is a hash of the whole manifest, so any worker computing
+the same session state hands out the same token.
+
+Manifests are kept in the response cache under their token. A client
+sending the token of its last sync gets only the pages whose entry
+changed; when that manifest has expired it simply gets the full one.
+"""
+
+import hashlib
+import re
+from typing import List, Optional
+
+import orjson
+from django.conf import settings
+from django.core.cache import caches
+
+from apis.models.page_payload_model import PagePayload
+from apis.models.session_model import Session
+from apis.modules import page_payloads
+
+_TOKEN_RE = re.compile(r"^[0-9a-f]{16}$")
+
+
+def _cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _hash(results) -> str:
+    return page_payloads.content_hash(orjson.dumps(results))
+
+
+def build_manifest(session: Session) -> List[dict]:
+    """
+    One entry per page, in page_index order (the index used by get_ocr,
+    get_tts and page/image); image_url is the page/get_image endpoint
+    for that index. Final pages processed before payloads
+    existed are materialized here, once.
+    """
+    pages = list(
+        session.pages.exclude(page_index=None)
+        .order_by("page_index")
+        .only("id", "page_index", "status")
+    )
+    rows = {
+        row[0]: row[1:]
+        for row in PagePayload.objects.filter(page__session=session).values_list(
+            "page_id", "ocr_hash", "audio_hash", "version"
+        )
+    }
+
+    manifest = []
+    for page in pages:
+        ocr_hash, audio_hash, version = rows.get(page.id, (None, None, 1))
+        if ocr_hash is None and page.status == "ready":
+            ocr_hash = _hash(page_payloads.materialize_ocr(page))
+        if audio_hash is None and page_payloads.is_tts_final(page):
+            audio_hash = _hash(page_payloads.materialize_audio(page))
+
+        manifest.append(
+            {
+                "page_index": page.page_index,
+                "status": page.status,
+                "version": version,
+                "image_url": (
+                    f"/page/get_image/?session_id={session.id}"
+                    f"&page_index={page.page_index}"
+                ),
+                "ocr_hash": ocr_hash,
+                "audio_hash": audio_hash,
+            }
+        )
+    return manifest
+
+
+def sync_token(session_id, manifest: List[dict]) -> str:
+    digest = hashlib.sha256(str(session_id).encode())
+    digest.update(orjson.dumps(manifest))
+    return digest.hexdigest()[:16]
+
+
+def sync(session: Session, since: Optional[str]) -> dict:
+    """
+    Manifest delta since the token `since`.
+
+    Returns:
+        {
+            "sync_token": str,
+            "full": bool,      # True when `pages` is the whole manifest
+            "pages": [...],    # entries that changed (or all of them)
+            "removed": [...],  # page indexes that no longer exist
+            "total_pages": int
+        }
+    """
+    manifest = build_manifest(session)
+    token = sync_token(session.id, manifest)
+    cache = _cache()
+    key_prefix = f"sync-manifest:{session.id}:"
+    cache.set(key_prefix + token, manifest, timeout=settings.SESSION_SYNC_MANIFEST_TTL)
+
+    previous = None
+    if since == token:
+        previous = manifest
+    elif since and _TOKEN_RE.match(since):
+        previous = cache.get(key_prefix + since)
+
+    result = {"sync_token": token, "total_pages": len(manifest)}
+    if previous is None:
+        result.update(full=True, pages=manifest, removed=[])
+        return result
+
+    before = {entry["page_index"]: entry for entry in previous}
+    current = {entry["page_index"] for entry in manifest}
+    result.update(
+        full=False,
+        pages=[entry for entry in manifest if before.get(entry["page_index"]) != entry],
+        removed=sorted(set(before) - current),
+    )
+    return result
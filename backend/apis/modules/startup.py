@@ -0,0 +1,282 @@
+"""
+Worker startup cost.
+
+Provider SDKs and ML libraries are imported where they are first used
+(TTSModule / StoryWordPicker construction, OCR clustering, segmentation)
+rather than at module import, so booting Django -- gunicorn workers,
+manage.py commands, the test runner -- does not pay for them.
+preload() imports them ahead of the first request in a fresh worker;
+profile_imports() measures what a boot actually imports.
+
+warm_up() goes further and exercises every path the first upload would
+otherwise pay for: the imports, kss' analyzer, OCR clustering, LangChain
+chain construction and a connection to each provider host. gunicorn's
+post_worker_init runs it before the worker accepts connections; where no
+hook runs (runserver, another server) the first GET /healthz/ready starts
+it in the background. The endpoint reports ready only once every step
+succeeded, together with the boot time of the process so a deploy can
+tell the new workers from the old ones.
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from django.conf import settings
+
+# Kept off the import path of the URLconf; imported by preload()
+LAZY_MODULES = (
+    "numpy",
+    "sklearn.cluster",
+    "openai",
+    "langchain_openai",
+    "langchain_core.prompts",
+    "kss",
+)
+
+_BOOT = """
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+import importlib
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+lazy = sys.argv[2].split(",")
+print(json.dumps({"seconds": seconds, "loaded": [m for m in lazy if m in sys.modules]}))
+"""
+
+
+def preload() -> Dict[str, float]:
+    """Import every lazy module; seconds spent per module."""
+    timings = {}
+    for name in LAZY_MODULES:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def _parse_importtime(stderr: str):
+    """(module, self_us, cumulative_us) rows of -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def profile_imports(target: str = "app.urls") -> dict:
+    """
+    Boot Django and import `target` in a fresh interpreter.
+
+    Returns:
+        {
+            "seconds": float,      # django.setup() + importing target
+            "loaded": [...],       # LAZY_MODULES imported by the boot
+            "imports": [(module, self_us, cumulative_us), ...]
+        }
+    """
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "settings"),
+    }
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(settings.BASE_DIR), env.get("PYTHONPATH")])
+    )
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _BOOT,
+            target,
+            ",".join(LAZY_MODULES),
+        ],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["imports"] = _parse_importtime(completed.stderr)
+    return result
+
+
+# Two text lines in the shape of a Clova OCR response
+_SAMPLE_OCR = {
+    "images": [
+        {
+            "fields": [
+                {
+                    "inferText": word,
+                    "inferConfidence": 0.99,
+                    "boundingPoly": {
+                        "vertices": [
+                            {"x": x, "y": y},
+                            {"x": x + 40, "y": y},
+                            {"x": x + 40, "y": y + 20},
+                            {"x": x, "y": y + 20},
+                        ]
+                    },
+                }
+                for y, line in ((0, ("옛날", "옛적에")), (30, ("작은", "여우가")))
+                for x, word in zip((0, 50), line)
+            ]
+        }
+    ]
+}
+
+_state_lock = threading.Lock()
+_state = {
+    "ready": False,
+    "running": False,
+    "started_at": None,
+    "finished_at": None,
+    "steps": {},
+}
+_boot = {"id": uuid.uuid4().hex, "at": time.time()}
+
+
+def _reset_boot():
+    # A forked worker is a new generation even if its parent imported this
+    _boot.update(id=uuid.uuid4().hex, at=time.time())
+
+
+os.register_at_fork(after_in_child=_reset_boot)
+
+
+def _warm_segmentation():
+    from apis.modules import segmentation
+
+    segmentation.warm_up()
+
+
+def _warm_ocr_clustering():
+    from apis.modules.ocr_processor import OCRModule
+
+    OCRModule()._parse_infer_text(_SAMPLE_OCR)
+
+
+def _warm_chains():
+    from apis.modules.tts_processor import TTSModule
+    from apis.modules.word_picker import StoryWordPicker
+
+    # TTSModule resets its output directories; keep it away from real ones
+    with tempfile.TemporaryDirectory() as tmp:
+        TTSModule(
+            out_dir=os.path.join(tmp, "audio"),
+            log_dir=os.path.join(tmp, "log"),
+            target_lang="English",
+        )
+    StoryWordPicker()
+
+
+def provider_urls():
+    """Hosts the first upload talks to (Clova OCR, OpenAI)."""
+    urls = [
+        os.getenv("OCR_API_URL", ""),
+        os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+    ]
+    return [url for url in urls if url]
+
+
+def _warm_connections():
+    import httpx
+
+    # DNS, the CA bundle and a TLS handshake with each host; any HTTP
+    # status will do, only transport errors count as failures
+    with httpx.Client(timeout=settings.WARMUP_CONNECT_TIMEOUT) as client:
+        for url in provider_urls():
+            client.head(url)
+
+
+WARM_UP_STEPS = (
+    ("imports", preload),
+    ("segmentation", _warm_segmentation),
+    ("ocr_clustering", _warm_ocr_clustering),
+    ("chains", _warm_chains),
+    ("connections", _warm_connections),
+)
+
+
+def warm_up(skip: Optional[set] = None) -> dict:
+    """
+    Run every warm-up step of this process and mark it ready if all of
+    them succeeded. A failing step is recorded (the worker still serves
+    everything else), the remaining steps run and the process stays not
+    ready until a later run succeeds (see ensure_warm_up).
+
+    Returns:
+        status(), with per-step "seconds" and "error" (None on success)
+    """
+    skip = skip or set()
+    with _state_lock:
+        _state.update(
+            ready=False, running=True, started_at=time.time(), finished_at=None
+        )
+        _state["steps"] = {}
+
+    for name, step in WARM_UP_STEPS:
+        if name in skip:
+            continue
+        start = time.perf_counter()
+        error = None
+        try:
+            step()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        with _state_lock:
+            _state["steps"][name] = {
+                "seconds": round(time.perf_counter() - start, 3),
+                "error": error,
+            }
+
+    with _state_lock:
+        ready = all(step["error"] is None for step in _state["steps"].values())
+        _state.update(ready=ready, running=False, finished_at=time.time())
+    return status()
+
+
+def ensure_warm_up() -> None:
+    """
+    Start warm_up() on a background thread unless it is running or has
+    succeeded. Readiness probes call it, which warms up processes no
+    gunicorn hook did and retries a failed warm-up at most every
+    WARMUP_RETRY_SECONDS.
+    """
+    with _state_lock:
+        if _state["ready"] or _state["running"]:
+            return
+        finished = _state["finished_at"]
+        if finished and time.time() - finished < settings.WARMUP_RETRY_SECONDS:
+            return
+        _state["running"] = True
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+
+def is_ready() -> bool:
+    with _state_lock:
+        return _state["ready"]
+
+
+def status() -> dict:
+    """Warm-up state of this process, with its boot id and time."""
+    with _state_lock:
+        return {
+            **_state,
+            "boot_id": _boot["id"],
+            "booted_at": _boot["at"],
+            "steps": {name: dict(step) for name, step in _state["steps"].items()},
+        }
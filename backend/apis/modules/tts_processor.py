@@ -6,16 +6,21 @@ import time
 import asyncio
 import base64
 import shutil
-import re
 from pathlib import Path
-from typing import Dict, List, Any
-from openai import AsyncOpenAI
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from typing import TYPE_CHECKING, Dict, List, Any
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
-import kss
-from .profanity_check import is_clean
+from . import (
+    adaptive_concurrency,
+    deadlines,
+    retry_policy,
+    segmentation,
+    tts_routing,
+)
+from .profanity_check import remove_profanity
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 load_dotenv()
 
@@ -73,9 +78,23 @@ class TTSModule:
     """
 
     def __init__(
-        self, out_dir="out_audio", log_dir="log", target_lang: str = "English"
+        self,
+        out_dir="out_audio",
+        log_dir="log",
+        target_lang: str = "English",
+        client: "AsyncOpenAI" = None,
+        http_client=None,
     ):
-        self.client = AsyncOpenAI()
+        # openai / langchain take over a second to import; they are loaded
+        # by the first module built (or by startup.preload in a worker)
+        from langchain_openai import ChatOpenAI
+        from openai import AsyncOpenAI
+
+        # client / http_client let callers share connection pools
+        # across requests (see apis.modules.provider_clients)
+        # Retries are left to apis.modules.retry_policy
+        self.client = client or AsyncOpenAI(max_retries=0)
+        self.LLM_MODEL = "gpt-4o-mini"
         self.TTS_MODEL = "gpt-4o-mini-tts"
         self.TTS_MODEL_LITE = "tts-1"
         self.OUT_DIR = Path(out_dir)
@@ -83,7 +102,12 @@ class TTSModule:
         self.CSV_LOG = self.LOG_DIR / "sentence_log.csv"
 
         self.target_lang = target_lang
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+        self.llm = ChatOpenAI(
+            model=self.LLM_MODEL,
+            temperature=0.7,
+            max_retries=0,
+            http_async_client=http_client,
+        )
         self.translation_chain = self._create_translation_chain()
         self.sentiment_chain = self._create_sentiment_chain()
 
@@ -111,6 +135,8 @@ class TTSModule:
 
     def _create_translation_chain(self):
         """Create LangChain translation chain"""
+        from langchain_core.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_messages(
             [("system", TRANSLATION_PROMPT), ("user", "{text_with_context}")]
         )
@@ -118,53 +144,68 @@ class TTSModule:
 
     def _create_sentiment_chain(self):
         """Create LangChain sentiment analysis chain"""
+        from langchain_core.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_messages(
             [("system", SENTIMENT_PROMPT), ("user", "{korean_text}")]
         )
         return prompt | self.llm.with_structured_output(Sentiment)
 
-    def _remove_profanity(self, text: str) -> str:
-        lang_code = self.profanity_lang_map.get(self.target_lang)
-        clean, found_words = is_clean(text, lang_code)
-        if clean:
-            return text
-
-        result = text
-        for word in found_words:
-            pattern = r"\b" + re.escape(word) + r"\b"
-            result = re.sub(pattern, "", result, flags=re.IGNORECASE)
+    @property
+    def lang_code(self) -> str:
+        return self.profanity_lang_map.get(self.target_lang)
 
-        result = re.sub(r"\s+", " ", result).strip()
+    def _remove_profanity(self, text: str) -> str:
+        return remove_profanity(text, self.lang_code)
 
-        return result
+    async def _call_provider(
+        self, model: str, operation: str, request, hedge: str = None
+    ):
+        """
+        One OpenAI request: admitted by the AIMD limiter of operation
+        (apis.modules.adaptive_concurrency), hedged under the name `hedge`
+        if given (apis.modules.hedging, once the slot is held), with the
+        retries and breaker of model (apis.modules.retry_policy).
+        """
+        if hedge is not None:
+            return await retry_policy.acall(
+                model,
+                lambda: adaptive_concurrency.hedged_call(operation, hedge, request),
+            )
+        return await retry_policy.acall(
+            model, lambda: adaptive_concurrency.call(operation, request)
+        )
 
     async def translate(self, text_with_context: str) -> Dict[str, Any]:
-        """Translate text with retry logic and profanity filtering."""
-        for attempt in range(3):
-            try:
-                t0 = time.time()
-                response = await self.translation_chain.ainvoke(
+        """
+        Translate text (see _call_provider) with profanity filtering.
+        """
+        try:
+            t0 = time.time()
+            response = await self._call_provider(
+                self.LLM_MODEL,
+                "translate",
+                lambda: self.translation_chain.ainvoke(
                     {
                         "text_with_context": text_with_context,
                         "target_lang": self.target_lang,
                     }
-                )
-                # Remove profanity from translated text
-                cleaned_text = self._remove_profanity(response.translated_text)
-                response.translated_text = cleaned_text
-
-                latency = time.time() - t0
-                return {"result": response, "latency": round(latency, 3)}
-            except Exception as e:
-                print(f"Translation attempt {attempt + 1} failed: {e}")
-                if attempt == 2:
-                    return {"result": e, "latency": -1.0}
-                await asyncio.sleep(0.7)
-        return {"result": None, "latency": -1.0}
+                ),
+                hedge="translate",
+            )
+            # Remove profanity from translated text
+            cleaned_text = self._remove_profanity(response.translated_text)
+            response.translated_text = cleaned_text
+
+            latency = time.time() - t0
+            return {"result": response, "latency": round(latency, 3)}
+        except Exception as e:
+            print(f"Translation failed: {e}")
+            return {"result": e, "latency": -1.0}
 
     async def sentiment(self, korean_text: str) -> Dict[str, Any]:
         """
-        Analyze sentiment with retry logic
+        Analyze sentiment (see _call_provider)
 
         Args:
             korean_text: Korean text to analyze
@@ -173,20 +214,18 @@ class TTSModule:
             {"result": Sentiment, "latency": float}
         """
 
-        for attempt in range(3):
-            try:
-                t0 = time.time()
-                response = await self.sentiment_chain.ainvoke(
-                    {"korean_text": korean_text}
-                )
-                latency = time.time() - t0
-                return {"result": response, "latency": round(latency, 3)}
-            except Exception as e:
-                print(f"Sentiment attempt {attempt + 1} failed: {e}")
-                if attempt == 2:
-                    return {"result": e, "latency": -1.0}
-                await asyncio.sleep(0.7)
-        return {"result": None, "latency": -1.0}
+        try:
+            t0 = time.time()
+            response = await self._call_provider(
+                self.LLM_MODEL,
+                "sentiment",
+                lambda: self.sentiment_chain.ainvoke({"korean_text": korean_text}),
+            )
+            latency = time.time() - t0
+            return {"result": response, "latency": round(latency, 3)}
+        except Exception as e:
+            print(f"Sentiment failed: {e}")
+            return {"result": e, "latency": -1.0}
 
     async def synthesize_tts(
         self,
@@ -197,7 +236,8 @@ class TTSModule:
         response_format: str,
     ) -> tuple[float, bytes]:
         """
-        Synthesize TTS audio with full model (gpt-4o-mini-tts)
+        Synthesize TTS audio with full model (gpt-4o-mini-tts), hedging
+        slow requests (see _call_provider)
 
         Args:
             voice: Voice name (e.g., "shimmer", "echo")
@@ -213,12 +253,17 @@ class TTSModule:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         t0 = time.time()
         try:
-            response = await self.client.audio.speech.create(
-                model=self.TTS_MODEL,
-                voice=voice,
-                input=text,
-                instructions=instructions,
-                response_format=response_format,
+            response = await self._call_provider(
+                self.TTS_MODEL,
+                "tts",
+                lambda: self.client.audio.speech.create(
+                    model=self.TTS_MODEL,
+                    voice=voice,
+                    input=text,
+                    instructions=instructions,
+                    response_format=response_format,
+                ),
+                hedge="synthesize_tts",
             )
             audio_bytes = response.content
 
@@ -250,11 +295,15 @@ class TTSModule:
 
         t0 = time.time()
         try:
-            response = await self.client.audio.speech.create(
-                model=self.TTS_MODEL_LITE,
-                voice=voice,
-                input=text,
-                response_format=response_format,
+            response = await self._call_provider(
+                self.TTS_MODEL_LITE,
+                "tts_lite",
+                lambda: self.client.audio.speech.create(
+                    model=self.TTS_MODEL_LITE,
+                    voice=voice,
+                    input=text,
+                    response_format=response_format,
+                ),
             )
             audio_bytes = response.content
 
@@ -269,13 +318,18 @@ class TTSModule:
             print(f"TTS Lite error: {e}")
             return -1.0, None
 
-    async def get_translations_only(self, page: Dict[str, str]) -> Dict[str, Any]:
+    async def get_translations_only(
+        self, page: Dict[str, str], deadline: "deadlines.Deadline" = None
+    ) -> Dict[str, Any]:
         """
         Get translations and sentiment for all sentences WITHOUT running TTS
         Used by backend to get translations before TTS
 
         Args:
-            page: {"fileName": "...", "text": "..."}
+            page: {"fileName": "...", "text": "...", "sentences": [...]}
+                  ("sentences" is optional: the text already segmented,
+                  e.g. by segmentation.split_paragraphs for the whole page)
+            deadline: Upload deadline bounding the provider calls
 
         Returns:
             {
@@ -291,55 +345,58 @@ class TTSModule:
                 ]
             }
         """
+        with deadlines.use(deadline):
+            if "sentences" in page:
+                sentences = page["sentences"]
+            else:
+                sentences = segmentation.split_sentences(page["text"])
+            if not sentences:
+                return {"status": "no_sentences", "sentences": []}
+
+            async def process_sentence(i: int, sentence: str):
+                # Build context
+                context = [f"[CURRENT]: {sentence}"]
+                if i > 0:
+                    context.insert(0, f"[PREVIOUS]: {sentences[i-1]}")
+                if i < len(sentences) - 1:
+                    context.append(f"[NEXT]: {sentences[i+1]}")
+                context_prompt = "\n".join(context)
+
+                # Run translation and sentiment in parallel
+                trans_response, senti_response = await asyncio.gather(
+                    self.translate(context_prompt), self.sentiment(sentence)
+                )
 
-        sentences = kss.split_sentences(page["text"].strip())
-        if not sentences:
-            return {"status": "no_sentences", "sentences": []}
-
-        async def process_sentence(i: int, sentence: str):
-            # Build context
-            context = [f"[CURRENT]: {sentence}"]
-            if i > 0:
-                context.insert(0, f"[PREVIOUS]: {sentences[i-1]}")
-            if i < len(sentences) - 1:
-                context.append(f"[NEXT]: {sentences[i+1]}")
-            context_prompt = "\n".join(context)
+                trans_result = trans_response["result"]
+                senti_result = senti_response["result"]
 
-            # Run translation and sentiment in parallel
-            trans_response, senti_response = await asyncio.gather(
-                self.translate(context_prompt), self.sentiment(sentence)
+                is_error = isinstance(trans_result, Exception) or isinstance(
+                    senti_result, Exception
+                )
+                if is_error:
+                    return None
+
+                translated = trans_result.translated_text.strip()
+                if not translated:
+                    return None
+
+                return {
+                    "translation": translated,
+                    "tone": senti_result.tone,
+                    "emotion": senti_result.emotion,
+                    "pacing": senti_result.pacing,
+                    "korean": sentence,
+                }
+
+            # Process all sentences in parallel
+            results = await asyncio.gather(
+                *[process_sentence(i, sent) for i, sent in enumerate(sentences)]
             )
 
-            trans_result = trans_response["result"]
-            senti_result = senti_response["result"]
+            # Filter out None results
+            ok_results = [r for r in results if r is not None]
 
-            is_error = isinstance(trans_result, Exception) or isinstance(
-                senti_result, Exception
-            )
-            if is_error:
-                return None
-
-            translated = trans_result.translated_text.strip()
-            if not translated:
-                return None
-
-            return {
-                "translation": translated,
-                "tone": senti_result.tone,
-                "emotion": senti_result.emotion,
-                "pacing": senti_result.pacing,
-                "korean": sentence,
-            }
-
-        # Process all sentences in parallel
-        results = await asyncio.gather(
-            *[process_sentence(i, sent) for i, sent in enumerate(sentences)]
-        )
-
-        # Filter out None results
-        ok_results = [r for r in results if r is not None]
-
-        return {"status": "ok" if ok_results else "failed", "sentences": ok_results}
+            return {"status": "ok" if ok_results else "failed", "sentences": ok_results}
 
     async def run_tts_only(
         self,
@@ -348,6 +405,8 @@ class TTSModule:
         page_index: int,
         para_index: int,
         para_voice: str,
+        routing: "tts_routing.PageRouting" = None,
+        deadline: "deadlines.Deadline" = None,
     ) -> List[str]:
         """
         Run TTS using pre-computed translations
@@ -359,60 +418,102 @@ class TTSModule:
             page_index: Page number
             para_index: Paragraph number
             para_voice: Voice to use
+            routing: Model tier decisions for the whole page (built from
+                     this paragraph alone when omitted)
+            deadline: Upload deadline bounding the provider calls
 
         Returns:
             List of base64-encoded audio clips
         """
+        with deadlines.use(deadline):
+            sentences_data = translation_data["sentences"]
+            if not sentences_data:
+                return []
+
+            if routing is None:
+                routing = tts_routing.PageRouting(
+                    [data["translation"] for data in sentences_data], self.lang_code
+                )
+            stem = f"{session_id}_{page_index}_{para_index}"
+            # Lite syntheses in flight in this paragraph, shared by its refrains
+            pending_lite: Dict[tuple, asyncio.Task] = {}
+
+            async def synthesize_lite(voice: str, text: str, out_file: Path):
+                key = (voice, tts_routing.normalize(text))
+                audio = routing.lite_audio.get(key)
+                if audio is None and key in pending_lite:
+                    _, audio = await asyncio.shield(pending_lite[key])
+                if audio:
+                    # Refrain already synthesized on this page
+                    tts_routing.record(
+                        tts_routing.LITE, 0.0, len(text), True, reused=True
+                    )
+                    return audio
 
-        sentences_data = translation_data["sentences"]
-        if not sentences_data:
-            return []
-
-        stem = f"{session_id}_{page_index}_{para_index}"
-
-        async def synthesize_sentence(i: int, sentence_data: dict):
-            voice = para_voice
-            out_file = self.OUT_DIR / f"{stem}_sent{i+1}.mp3"
+                pending_lite[key] = asyncio.ensure_future(
+                    self.synthesize_tts_lite(voice, text, out_file)
+                )
+                tts_latency, audio = await pending_lite[key]
+                tts_routing.record(
+                    tts_routing.LITE, tts_latency, len(text), bool(audio)
+                )
+                if audio:
+                    routing.lite_audio[key] = audio
+                return audio
+
+            async def synthesize_sentence(i: int, sentence_data: dict):
+                voice = para_voice
+                text = sentence_data["translation"]
+                out_file = self.OUT_DIR / f"{stem}_sent{i+1}.mp3"
+
+                if routing.choose(text) == tts_routing.LITE:
+                    tts_result = await synthesize_lite(voice, text, out_file)
+                    if tts_result:
+                        return base64.b64encode(tts_result).decode("utf-8")
+                    # Lite model failed: fall through to the full model
+
+                affect = (
+                    "[Affect: A gentle, curious narrator with a clear "
+                    "accent, guiding a magical, child-friendly "
+                    "adventure through a fairy tale world.]"
+                )
+                pronunciation = (
+                    "[Pronunciation: Clear and precise, with an emphasis "
+                    "on storytelling, ensuring the words are easy to "
+                    "follow and enchanting to listen to.]"
+                )
+                mood = (
+                    f"[Tone: {sentence_data['tone']}] "
+                    f"[Emotion: {sentence_data['emotion']}] "
+                    f"[Pacing: {sentence_data['pacing']}]"
+                )
+                tts_instr = affect + pronunciation + mood
+
+                tts_latency, tts_result = await self.synthesize_tts(
+                    voice=voice,
+                    text=text,
+                    instructions=tts_instr,
+                    out_path=out_file,
+                    response_format="mp3",
+                )
+                tts_routing.record(
+                    tts_routing.FULL, tts_latency, len(text), bool(tts_result)
+                )
 
-            affect = (
-                "[Affect: A gentle, curious narrator with a clear "
-                "accent, guiding a magical, child-friendly "
-                "adventure through a fairy tale world.]"
-            )
-            pronunciation = (
-                "[Pronunciation: Clear and precise, with an emphasis "
-                "on storytelling, ensuring the words are easy to "
-                "follow and enchanting to listen to.]"
-            )
-            mood = (
-                f"[Tone: {sentence_data['tone']}] "
-                f"[Emotion: {sentence_data['emotion']}] "
-                f"[Pacing: {sentence_data['pacing']}]"
-            )
-            tts_instr = affect + pronunciation + mood
+                if tts_result:
+                    return base64.b64encode(tts_result).decode("utf-8")
+                return None
 
-            tts_latency, tts_result = await self.synthesize_tts(
-                voice=voice,
-                text=sentence_data["translation"],
-                instructions=tts_instr,
-                out_path=out_file,
-                response_format="mp3",
+            # Run TTS for all sentences in parallel
+            audio_results = await asyncio.gather(
+                *[
+                    synthesize_sentence(i, sent_data)
+                    for i, sent_data in enumerate(sentences_data)
+                ]
             )
 
-            if tts_result:
-                return base64.b64encode(tts_result).decode("utf-8")
-            return None
-
-        # Run TTS for all sentences in parallel
-        audio_results = await asyncio.gather(
-            *[
-                synthesize_sentence(i, sent_data)
-                for i, sent_data in enumerate(sentences_data)
-            ]
-        )
-
-        # Filter out None results
-        return [audio for audio in audio_results if audio is not None]
+            # Filter out None results
+            return [audio for audio in audio_results if audio is not None]
 
     async def translate_cover(
         self, title: str, session_id: str, page_index: int
@@ -462,7 +563,7 @@ class TTSModule:
             {"status": "ok" or "failed", "details": [...]}
         """
         file_name = page["fileName"]
-        sentences = kss.split_sentences(page["text"].strip())
+        sentences = segmentation.split_sentences(page["text"])
         if not sentences:
             return {"status": "no_sentences"}
 
@@ -0,0 +1,151 @@
+"""
+TTS model tiering.
+
+Every sentence used to go to the full model (gpt-4o-mini-tts) with the
+long narrator instructions. Very short sentences, interjections ("Oh
+no!", "Wow!") and refrains repeated on a page gain little from them, so
+they are candidates for the lite model (tts-1), which is faster.
+
+Policies (settings.TTS_TIER_POLICY):
+    full      always the full model (previous behaviour)
+    lite      candidates always go to the lite model
+    adaptive  candidates go to the full model as long as the page's
+              latency budget (TTS_PAGE_LATENCY_BUDGET) allows it, judged
+              from the running p95 of the full tier; otherwise lite
+
+Calls are recorded per tier (latency window, characters and estimated
+cost from TTS_TIER_COST_PER_1K_CHARS); see stats().
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+
+from apis.modules.latency_stats import LatencyWindow
+
+FULL = "full"
+LITE = "lite"
+TIERS = (FULL, LITE)
+
+_NON_WORD = re.compile(r"[^\w\s'-]+")
+
+_lock = threading.Lock()
+_latency = {tier: LatencyWindow() for tier in TIERS}
+_counters = {
+    tier: {"calls": 0, "failures": 0, "reused": 0, "chars": 0, "cost_usd": 0.0}
+    for tier in TIERS
+}
+
+
+def normalize(text: str) -> str:
+    """Sentence text compared for refrains and interjections."""
+    return " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+
+
+def is_interjection(text: str, lang: str) -> bool:
+    words = normalize(text).split()
+    interjections = settings.TTS_LITE_INTERJECTIONS.get(lang, ())
+    return bool(words) and all(word in interjections for word in words)
+
+
+def record(tier: str, latency: float, chars: int, ok: bool, reused: bool = False):
+    """Record one synthesized (or reused) sentence of a tier."""
+    with _lock:
+        counters = _counters[tier]
+        if reused:
+            counters["reused"] += 1
+            return
+        counters["calls"] += 1
+        if not ok:
+            counters["failures"] += 1
+            return
+        counters["chars"] += chars
+        counters["cost_usd"] += chars / 1000 * settings.TTS_TIER_COST_PER_1K_CHARS[tier]
+    _latency[tier].add(latency)
+
+
+def stats() -> Dict[str, dict]:
+    """Per tier counters and latency percentiles of this process."""
+    with _lock:
+        counters = {tier: dict(values) for tier, values in _counters.items()}
+    for tier in TIERS:
+        counters[tier]["cost_usd"] = round(counters[tier]["cost_usd"], 4)
+        counters[tier]["latency"] = _latency[tier].snapshot()
+    return counters
+
+
+def reset_stats():
+    with _lock:
+        for tier in TIERS:
+            _latency[tier] = LatencyWindow()
+            _counters[tier].update(calls=0, failures=0, reused=0, chars=0, cost_usd=0.0)
+
+
+def expected_latency(tier: str) -> float:
+    """Running p95 of a tier, or the configured estimate until known."""
+    return _latency[tier].percentile(95, settings.TTS_TIER_LATENCY_ESTIMATE[tier])
+
+
+class PageRouting:
+    """
+    Tier decisions for the sentences of one page.
+
+    Built from the page's translated sentences (to find refrains) and the
+    number of paragraphs still to synthesize, which run one after the
+    other; paragraph_done() is called as each one finishes.
+    """
+
+    def __init__(
+        self,
+        sentences: Iterable[str],
+        lang: str,
+        paragraphs: int = 1,
+        policy: Optional[str] = None,
+        budget: Optional[float] = None,
+    ):
+        self.lang = lang
+        self.policy = policy or settings.TTS_TIER_POLICY
+        self.budget = settings.TTS_PAGE_LATENCY_BUDGET if budget is None else budget
+        self.paragraphs_left = paragraphs
+        self.started = time.monotonic()
+        self.repeats = Counter(normalize(text) for text in sentences)
+        self.tiers = Counter()
+        # (voice, normalized text) -> audio of lite refrains, reused on the page
+        self.lite_audio: Dict[tuple, bytes] = {}
+
+    def is_lite_candidate(self, text: str) -> bool:
+        key = normalize(text)
+        return (
+            len(key) <= settings.TTS_LITE_MAX_CHARS
+            or self.repeats[key] > 1
+            or is_interjection(text, self.lang)
+        )
+
+    def budget_allows_full(self) -> bool:
+        elapsed = time.monotonic() - self.started
+        projected = elapsed + self.paragraphs_left * expected_latency(FULL)
+        return projected <= self.budget
+
+    def choose(self, text: str) -> str:
+        if self.policy == FULL or not self.is_lite_candidate(text):
+            tier = FULL
+        elif self.policy == LITE:
+            tier = LITE
+        else:
+            tier = FULL if self.budget_allows_full() else LITE
+        self.tiers[tier] += 1
+        return tier
+
+    def paragraph_done(self):
+        self.paragraphs_left = max(self.paragraphs_left - 1, 0)
+
+    def summary(self) -> str:
+        took = time.monotonic() - self.started
+        return (
+            f"{self.tiers[FULL]} full / {self.tiers[LITE]} lite sentences "
+            f"in {took:.1f}s (budget {self.budget:.0f}s, policy {self.policy})"
+        )
@@ -6,10 +6,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Any
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+from . import retry_policy
 
 load_dotenv()
 
@@ -59,11 +58,23 @@ class StoryWordPicker:
     with simple Korean meanings.
     """
 
-    def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+    def __init__(self, http_client=None):
+        # Loaded on first use, as in TTSModule
+        from langchain_openai import ChatOpenAI
+
+        # Retries are left to apis.modules.retry_policy
+        self.LLM_MODEL = "gpt-4o-mini"
+        self.llm = ChatOpenAI(
+            model=self.LLM_MODEL,
+            temperature=0.2,
+            max_retries=0,
+            http_async_client=http_client,
+        )
         self.word_chain = self._create_word_chain()
 
     def _create_word_chain(self):
+        from langchain_core.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", WORD_PICKER_PROMPT),
@@ -88,41 +99,59 @@ class StoryWordPicker:
         if not story_text:
             return {"status": "no_words", "items": [], "latency": 0.0}
 
-        for attempt in range(3):
-            try:
-                t0 = time.time()
-
-                response: VocabResult = self.word_chain.invoke(
-                    {"story_text": story_text}
-                )
-                print(f"[WordPicker] response: {response}")
-                latency = round(time.time() - t0, 3)
-
-                items = response.items
-                if not items:
-                    return {"status": "no_words", "items": [], "latency": latency}
+        try:
+            t0 = time.time()
 
-                cleaned = []
-                seen = set()
+            response: VocabResult = retry_policy.call(
+                self.LLM_MODEL,
+                lambda: self.word_chain.invoke({"story_text": story_text}),
+            )
+            print(f"[WordPicker] response: {response}")
+            return self._clean_response(response, round(time.time() - t0, 3))
 
-                for item in items:
-                    w = item.word.strip()
-                    if not w:
-                        continue
-                    if w not in seen:
-                        seen.add(w)
-                        cleaned.append(
-                            {"word": w, "meaning_ko": item.meaning_ko.strip()}
-                        )
+        except Exception as e:
+            print(f"[WordPicker] failed: {e}")
+            return {"status": "failed", "items": [], "latency": -1.0}
 
-                if not cleaned:
-                    return {"status": "no_words", "items": [], "latency": latency}
+    async def apick_words(self, story_text: str) -> Dict[str, Any]:
+        """Extract vocabulary words from story text (async version)."""
 
-                return {"status": "ok", "items": cleaned[:3], "latency": latency}
-
-            except Exception as e:
-                print(f"[WordPicker] attempt {attempt+1} failed: {e}")
-                if attempt == 2:
-                    return {"status": "failed", "items": [], "latency": -1.0}
+        story_text = (story_text or "").strip()
+        if not story_text:
+            return {"status": "no_words", "items": [], "latency": 0.0}
 
-        return {"status": "failed", "items": [], "latency": -1.0}
+        try:
+            t0 = time.time()
+
+            response: VocabResult = await retry_policy.acall(
+                self.LLM_MODEL,
+                lambda: self.word_chain.ainvoke({"story_text": story_text}),
+            )
+            print(f"[WordPicker] response: {response}")
+            return self._clean_response(response, round(time.time() - t0, 3))
+
+        except Exception as e:
+            print(f"[WordPicker] failed: {e}")
+            return {"status": "failed", "items": [], "latency": -1.0}
+
+    def _clean_response(self, response: VocabResult, latency: float) -> Dict[str, Any]:
+        """Deduplicate picked words and build the result dict"""
+        items = response.items
+        if not items:
+            return {"status": "no_words", "items": [], "latency": latency}
+
+        cleaned = []
+        seen = set()
+
+        for item in items:
+            w = item.word.strip()
+            if not w:
+                continue
+            if w not in seen:
+                seen.add(w)
+                cleaned.append({"word": w, "meaning_ko": item.meaning_ko.strip()})
+
+        if not cleaned:
+            return {"status": "no_words", "items": [], "latency": latency}
+
+        return {"status": "ok", "items": cleaned[:3], "latency": latency}
@@ -0,0 +1,36 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, FileUploadParser
+
+
+class ORJSONParser(BaseParser):
+    """Drop-in replacement for rest_framework.parsers.JSONParser using orjson."""
+
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class RawImageUploadParser(FileUploadParser):
+    """
+    Parser for uploads sent as a raw image body (Content-Type: image/*).
+
+    The body is streamed through Django's upload handlers, so large images
+    spill to a temporary file instead of being held in memory. The parsed
+    file is exposed as request.FILES["file"].
+    """
+
+    media_type = "image/*"
+
+    def get_filename(self, stream, media_type, parser_context):
+        return super().get_filename(stream, media_type, parser_context) or "upload"
+
+
+class RawBinaryUploadParser(RawImageUploadParser):
+    """Same as RawImageUploadParser for Content-Type: application/octet-stream."""
+
+    media_type = "application/octet-stream"
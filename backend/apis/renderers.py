@@ -0,0 +1,97 @@
+import base64
+import binascii
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:  # optional: binary responses are simply not offered
+    msgpack = None
+
+# DRF's encoder handles what orjson does not (Decimal, lazy strings, ...)
+_drf_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Drop-in replacement for rest_framework.renderers.JSONRenderer backed
+    by orjson. Output matches DRF's compact UTF-8 JSON, including
+    datetimes as ISO 8601 with a trailing "Z" for UTC.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_drf_encoder.default, option=self.options)
+
+
+def _decode_binary_fields(data, binary_fields: frozenset):
+    """
+    Copy of data with the base64 values of binary_fields decoded to bytes.
+    Values that are not valid base64 are left untouched.
+    """
+    if isinstance(data, dict):
+        return {
+            key: (
+                _b64_to_bytes(value)
+                if key in binary_fields
+                else _decode_binary_fields(value, binary_fields)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, (list, tuple)):
+        return [_decode_binary_fields(item, binary_fields) for item in data]
+    return data
+
+
+def _b64_to_bytes(value):
+    if isinstance(value, str):
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError):
+            return value
+    if isinstance(value, (list, tuple)):
+        return [_b64_to_bytes(item) for item in value]
+    return value
+
+
+def _msgpack_default(obj):
+    # Same textual form as the JSON responses (datetimes, UUIDs, ...)
+    return _drf_encoder.default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack responses, selected with "Accept: application/msgpack".
+
+    Fields named in the view's `binary_fields` (base64 audio / images in
+    the JSON responses) are sent as raw msgpack bin values instead, so
+    clients skip base64 decoding and the payload is ~25% smaller. Every
+    other value has the same shape as in the JSON response.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        view = (renderer_context or {}).get("view")
+        binary_fields = getattr(view, "binary_fields", ())
+        if binary_fields:
+            data = _decode_binary_fields(data, frozenset(binary_fields))
+
+        return msgpack.packb(
+            data, default=_msgpack_default, use_bin_type=True, datetime=False
+        )
@@ -9,4 +9,6 @@ urlpatterns = [
     path("process/", include("apis.controller.process_controller.urls")),
     # routing to page controller
     path("page/", include("apis.controller.page_controller.urls")),
+    # routing to health checks (load balancer readiness)
+    path("healthz/", include("apis.controller.health_controller.urls")),
 ]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Response compression benchmark
+
+Builds production-shaped JSON responses (reload_all for a 12-page book,
+get_ocr, user/info with cover thumbnails, get_tts with base64 clips),
+renders them with the API's JSON renderer and compresses each with every
+installed codec at a few levels, reporting size saved and CPU time.
+
+Usage:
+    python benchmarks/compression.py
+    python benchmarks/compression.py --pages 24 --iterations 50
+"""
+
+import argparse
+import base64
+import datetime
+import os
+import random
+import sys
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 6], "zstd": [1, 3, 9]}
+
+WORDS = (
+    "the little fox ran across the meadow to find her mother under the old "
+    "oak tree while the wind sang softly and the stars began to shine"
+).split()
+KO_WORDS = (
+    "작은 여우가 엄마를 찾으러 들판을 가로질러 오래된 참나무 아래로 "
+    "달려갔고 바람은 부드럽게 노래하며 별들이 빛나기 시작했어요"
+).split()
+
+
+def _sentence(rng, words, n):
+    return " ".join(rng.choice(words) for _ in range(n)).capitalize() + "."
+
+
+def _ocr_results(rng, boxes):
+    return [
+        {
+            "bbox": {
+                "x1": rng.randint(0, 900),
+                "y1": rng.randint(0, 1400),
+                "x2": rng.randint(900, 1800),
+                "y2": rng.randint(1400, 2400),
+            },
+            "original_txt": _sentence(rng, WORDS, rng.randint(8, 24)),
+            "translation_txt": _sentence(rng, KO_WORDS, rng.randint(6, 18)),
+        }
+        for _ in range(boxes)
+    ]
+
+
+def build_payloads(args) -> dict:
+    rng = random.Random(0)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    session_id = str(uuid.uuid4())
+
+    reload_all = {
+        "session_id": session_id,
+        "started_at": now.isoformat(),
+        "pages": [
+            {
+                "page_index": i,
+                "img_url": f"media/images/{uuid.uuid4()}_{i}_{uuid.uuid4().hex}.jpg",
+                "translation_text": None,
+                "audio_url": None,
+                "ocr_results": _ocr_results(rng, args.boxes),
+            }
+            for i in range(args.pages)
+        ],
+    }
+    get_ocr = {
+        "session_id": session_id,
+        "page_index": 3,
+        "ocr_results": [
+            {"bbox_index": i, **bb}
+            for i, bb in enumerate(_ocr_results(rng, args.boxes))
+        ],
+        "processed_at": now,
+    }
+    # mp3 / jpeg bytes are already compressed: random data is a fair proxy
+    user_info = [
+        {
+            "user_id": str(uuid.uuid4()),
+            "session_id": str(uuid.uuid4()),
+            "title": _sentence(rng, WORDS, 4),
+            "translated_title": _sentence(rng, KO_WORDS, 3),
+            "image_base64": base64.b64encode(os.urandom(30 * 1024)).decode(),
+            "started_at": now,
+        }
+        for _ in range(args.sessions)
+    ]
+    get_tts = {
+        "session_id": session_id,
+        "page_index": 3,
+        "audio_results": [
+            {
+                "bbox_index": i,
+                "audio_base64_list": [
+                    base64.b64encode(os.urandom(20 * 1024)).decode() for _ in range(4)
+                ],
+            }
+            for i in range(args.boxes)
+        ],
+        "generated_at": now,
+    }
+    return {
+        "reload_all": reload_all,
+        "get_ocr": get_ocr,
+        "user_info": user_info,
+        "get_tts": get_tts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=12)
+    parser.add_argument("--boxes", type=int, default=8)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+    import django
+
+    django.setup()
+
+    from apis.middleware import CODECS, compress_bytes
+    from apis.renderers import ORJSONRenderer
+
+    renderer = ORJSONRenderer()
+    header = f"{'payload':<12}{'codec':<10}{'bytes':>10}{'saved':>9}{'ms':>9}"
+    print(f"{header}{'MB/s':>9}")
+    for name, data in build_payloads(args).items():
+        body = renderer.render(data)
+        print(f"{name:<12}{'identity':<10}{len(body):>10}")
+        for encoding in CODECS:
+            for level in LEVELS[encoding]:
+                compressed = compress_bytes(encoding, body, level)
+                start = time.perf_counter()
+                for _ in range(args.iterations):
+                    compress_bytes(encoding, body, level)
+                ms = (time.perf_counter() - start) / args.iterations * 1000
+                saved = 1 - len(compressed) / len(body)
+                mbps = len(body) / 1e6 / (ms / 1000)
+                label = f"{encoding}-{level}"
+                print(
+                    f"{'':<12}{label:<10}{len(compressed):>10}{saved:>9.1%}"
+                    f"{ms:>9.2f}{mbps:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Request hedging benchmark
+
+Simulates a provider with a long tail (log-normal latencies plus a share
+of stragglers several times slower) and sends the same calls with and
+without hedging, a few at a time. Prints p50 / p95 / p99 of both runs,
+the hedge rate and the extra attempts hedging cost.
+
+Usage:
+    python benchmarks/hedging.py
+    python benchmarks/hedging.py --calls 2000 --stragglers 0.03 --max-rate 0.05
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[max(math.ceil(q / 100 * len(samples)), 1) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--median-ms", type=float, default=40)
+    parser.add_argument("--stragglers", type=float, default=0.05)
+    parser.add_argument("--straggler-factor", type=float, default=8)
+    parser.add_argument("--max-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+    import django
+
+    django.setup()
+
+    from django.test import override_settings
+    from apis.modules import hedging
+
+    rng = random.Random(0)
+
+    def provider_latency():
+        seconds = rng.lognormvariate(math.log(args.median_ms / 1000), 0.3)
+        if rng.random() < args.stragglers:
+            seconds *= args.straggler_factor
+        return seconds
+
+    async def attempt():
+        await asyncio.sleep(provider_latency())
+        return b"audio"
+
+    async def run(enabled):
+        hedging.reset_stats()
+        semaphore = asyncio.Semaphore(args.concurrency)
+        loop = asyncio.get_running_loop()
+        latencies = []
+
+        async def one():
+            async with semaphore:
+                start = loop.time()
+                await hedging.call("benchmark", attempt)
+                latencies.append(loop.time() - start)
+
+        with override_settings(
+            HEDGING_ENABLED=enabled,
+            HEDGE_MAX_RATE=args.max_rate,
+            HEDGE_MIN_DELAY=0.0,
+        ):
+            await asyncio.gather(*[one() for _ in range(args.calls)])
+        return latencies, hedging.stats()["benchmark"]
+
+    print(
+        f"{args.calls} calls, median {args.median_ms:.0f} ms, "
+        f"{args.stragglers:.0%} stragglers x{args.straggler_factor:g}"
+    )
+    print(f"{'':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'hedged':>10}")
+    for label, enabled in (("unhedged", False), ("hedged", True)):
+        latencies, stats = asyncio.run(run(enabled))
+        row = "".join(f"{percentile(latencies, q) * 1000:>10.1f}" for q in (50, 95, 99))
+        print(f"{label:<12}{row}{stats['hedge_rate']:>10.1%}")
+    print(
+        f"hedges won {stats['hedge_wins']} of {stats['hedged']}, "
+        f"{stats['rate_limited']} skipped by the rate cap, "
+        f"extra attempts {stats['hedged'] / stats['calls']:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sentence segmentation benchmark
+
+Builds OCR-like Korean paragraphs from story sentences (with and without
+punctuation, quotes and run-on clauses) and times kss.split_sentences
+per paragraph against the segmentation module: cold (rules + one batched
+kss call per page) and warm (memoized). Checks that every paragraph the
+rules accept is split exactly as kss splits it.
+
+Usage:
+    python benchmarks/segmentation.py
+    python benchmarks/segmentation.py --pages 200 --paragraphs 6
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLAUSES = [
+    "옛날 옛적에 작은 여우가 살았어요",
+    "여우는 엄마를 찾으러 들판을 가로질러 달려갔어요",
+    "바람이 부드럽게 노래했어요",
+    "별들이 하나둘 빛나기 시작했답니다",
+    "토끼가 깡충깡충 뛰어왔어요",
+    "숲속 친구들이 모두 모였어요",
+    "오래된 참나무 아래에서 잠이 들었어요",
+    "곰 아저씨는 꿀을 좋아해요",
+    "우리 같이 놀까요",
+    "정말 멋진 하루였어",
+    "여우가 뛰었다 토끼가 웃었다",
+    "배고파요 밥 주세요",
+    "Mr. 김이 3.5개를 샀어요",
+]
+QUOTES = ['"안녕?"', "'고마워!'", "“어디 가니?”"]
+
+
+def make_paragraph(rng):
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        clause = rng.choice(CLAUSES)
+        roll = rng.random()
+        if roll < 0.6:
+            clause += rng.choice([".", "!", "?", "."])
+        elif roll < 0.7:
+            clause += " " + rng.choice(QUOTES)
+        parts.append(clause)
+    return " ".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--paragraphs", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+    import django
+
+    django.setup()
+
+    import kss
+    from apis.modules import segmentation
+
+    rng = random.Random(0)
+    pages = [
+        [make_paragraph(rng) for _ in range(args.paragraphs)] for _ in range(args.pages)
+    ]
+    paragraphs = [p for page in pages for p in page]
+
+    start = time.perf_counter()
+    segmentation.warm_up()
+    print(f"warm-up: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    expected = [kss.split_sentences(p) for p in paragraphs]
+    kss_us = (time.perf_counter() - start) / len(paragraphs) * 1e6
+
+    agreed = checked = 0
+    for paragraph, sentences in zip(paragraphs, expected):
+        rule = segmentation.split_rule_based(segmentation.normalize(paragraph))
+        if rule is not None:
+            checked += 1
+            agreed += rule == sentences
+    assert agreed == checked, f"rules disagree with kss on {checked - agreed}"
+
+    segmentation.clear_cache()
+    start = time.perf_counter()
+    cold = [s for page in pages for s in segmentation.split_paragraphs(page)]
+    cold_us = (time.perf_counter() - start) / len(paragraphs) * 1e6
+    start = time.perf_counter()
+    warm = [s for page in pages for s in segmentation.split_paragraphs(page)]
+    warm_us = (time.perf_counter() - start) / len(paragraphs) * 1e6
+    assert cold == warm == expected
+
+    info = segmentation.cache_info()
+    print(f"paragraphs: {len(paragraphs)} ({len(set(paragraphs))} distinct)")
+    print(f"split by rules: {checked} of {len(paragraphs)}, all equal to kss")
+    print(f"{'kss per paragraph':<26}{kss_us:>10.1f} us")
+    print(f"{'segmentation, cold cache':<26}{cold_us:>10.1f} us")
+    print(f"{'segmentation, warm cache':<26}{warm_us:>10.1f} us")
+    print(f"cache: {info}")
+
+
+if __name__ == "__main__":
+    main()
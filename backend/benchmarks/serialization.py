@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Response serialization benchmark
+
+Renders synthetic payloads shaped like the heaviest responses (get_tts
+with base64 audio clips, user/info with cover thumbnails, get_ocr with
+many boxes) through DRF's JSONRenderer, the orjson renderer and the
+MessagePack renderer, and reports render time and body size.
+
+Usage:
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --iterations 500 --clips 12
+"""
+
+import argparse
+import base64
+import datetime
+import os
+import sys
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _View:
+    """Stand-in for a view exposing binary_fields to the renderer."""
+
+    def __init__(self, binary_fields=()):
+        self.binary_fields = binary_fields
+
+
+def build_payloads(args) -> dict:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    clip = base64.b64encode(os.urandom(args.clip_kb * 1024)).decode("ascii")
+    thumb = base64.b64encode(os.urandom(args.thumb_kb * 1024)).decode("ascii")
+
+    get_tts = {
+        "session_id": str(uuid.uuid4()),
+        "page_index": 3,
+        "audio_results": [
+            {"bbox_index": i, "audio_base64_list": [clip] * args.clips}
+            for i in range(args.boxes)
+        ],
+        "generated_at": now,
+    }
+    user_info = [
+        {
+            "user_id": str(uuid.uuid4()),
+            "session_id": str(uuid.uuid4()),
+            "title": f"Story {i}",
+            "translated_title": f"이야기 {i}",
+            "image_base64": thumb,
+            "started_at": now,
+        }
+        for i in range(args.sessions)
+    ]
+    get_ocr = {
+        "session_id": str(uuid.uuid4()),
+        "page_index": 3,
+        "ocr_results": [
+            {
+                "bbox_index": i,
+                "original_txt": "The quick brown fox jumps over the lazy dog. " * 3,
+                "translation_txt": "빠른 갈색 여우가 게으른 개를 뛰어넘는다. " * 3,
+                "bbox": {"x1": i, "y1": i, "x2": i + 100, "y2": i + 40},
+            }
+            for i in range(args.boxes * 4)
+        ],
+        "processed_at": now,
+    }
+
+    return {
+        "get_tts": (get_tts, ("audio_base64_list",)),
+        "user_info": (user_info, ("image_base64",)),
+        "get_ocr": (get_ocr, ()),
+    }
+
+
+def measure(renderer, data, binary_fields, iterations: int):
+    context = {"view": _View(binary_fields)}
+    body = renderer.render(data, renderer_context=context)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        renderer.render(data, renderer_context=context)
+    elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1000, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--boxes", type=int, default=8)
+    parser.add_argument("--clips", type=int, default=6)
+    parser.add_argument("--clip-kb", type=int, default=24)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--thumb-kb", type=int, default=40)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+    import django
+
+    django.setup()
+
+    from rest_framework.renderers import JSONRenderer
+    from apis.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+
+    renderers = {"drf-json": JSONRenderer(), "orjson": ORJSONRenderer()}
+    if msgpack is not None:
+        renderers["msgpack"] = MessagePackRenderer()
+
+    print(f"{'payload':<12}{'renderer':<12}{'ms/render':>12}{'bytes':>12}")
+    for name, (data, binary_fields) in build_payloads(args).items():
+        for label, renderer in renderers.items():
+            ms, size = measure(renderer, data, binary_fields, args.iterations)
+            print(f"{name:<12}{label:<12}{ms:>12.3f}{size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Server throughput benchmark: runserver vs gunicorn
+
+Starts each server against a throwaway SQLite database and a fake OCR
+endpoint that answers after --ocr-delay seconds (the Clova call is what
+holds a worker during an upload). Concurrent clients then send a mix of
+page uploads and get_ocr reads, and the script reports throughput and
+read latency for each server.
+
+Usage:
+    python benchmarks/server_throughput.py
+    python benchmarks/server_throughput.py --clients 32 --duration 20
+"""
+
+import argparse
+import base64
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP_SCRIPT = """
+from apis.models.user_model import User
+from apis.models.session_model import Session
+from apis.models.page_model import Page
+from apis.models.bb_model import BB
+user = User.objects.create(device_info="bench-device")
+session = Session.objects.create(user=user, title="bench")
+page = Page.objects.create(session=session, img_url="bench.jpg")
+BB.objects.bulk_create(
+    BB(page=page, original_text="원문 " * 20, translated_text="text " * 20,
+       coordinates={"x1": i, "y1": i, "x2": i, "y2": i,
+                    "x3": i, "y3": i, "x4": i, "y4": i})
+    for i in range(8)
+)
+print(session.id)
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_fake_ocr(delay: float) -> ThreadingHTTPServer:
+    """Fake Clova OCR endpoint: waits, then returns no text fields."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(delay)
+            body = json.dumps({"images": [{"fields": []}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def wait_until_up(port: int, timeout: float = 60.0):
+    """Wait for a real HTTP response, not just a listening socket."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5).read()
+            return
+        except urllib.error.HTTPError:
+            return  # any status means Django answered
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def run_clients(port, session_id, args) -> dict:
+    base = f"http://127.0.0.1:{port}"
+    image_b64 = base64.b64encode(os.urandom(64 * 1024)).decode()
+    upload_body = json.dumps(
+        {"session_id": session_id, "lang": "en", "image_base64": image_b64}
+    ).encode()
+    read_url = f"{base}/page/get_ocr/?session_id={session_id}&page_index=0"
+
+    lock = threading.Lock()
+    read_latencies, upload_latencies, errors = [], [], [0]
+    stop_at = time.time() + args.duration
+
+    def client(i):
+        is_uploader = i < args.clients * args.upload_ratio
+        while time.time() < stop_at:
+            t0 = time.perf_counter()
+            try:
+                if is_uploader:
+                    req = urllib.request.Request(
+                        f"{base}/process/upload/",
+                        data=upload_body,
+                        headers={"Content-Type": "application/json"},
+                    )
+                    try:
+                        urllib.request.urlopen(req, timeout=60).read()
+                    except urllib.error.HTTPError as e:
+                        if e.code != 422:  # expected: fake OCR finds no text
+                            raise
+                    bucket = upload_latencies
+                else:
+                    urllib.request.urlopen(read_url, timeout=60).read()
+                    bucket = read_latencies
+                with lock:
+                    bucket.append(time.perf_counter() - t0)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    def pct(values, q):
+        if not values:
+            return 0.0
+        return round(statistics.quantiles(values, n=100)[q - 1] * 1000, 1)
+
+    return {
+        "reads_per_s": round(len(read_latencies) / args.duration, 1),
+        "uploads_per_s": round(len(upload_latencies) / args.duration, 1),
+        "read_p50_ms": pct(read_latencies, 50),
+        "read_p95_ms": pct(read_latencies, 95),
+        "upload_p95_ms": pct(upload_latencies, 95),
+        "errors": errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--upload-ratio", type=float, default=0.25)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--ocr-delay", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=10.0,
+        help="seconds to let every worker finish importing before measuring",
+    )
+    args = parser.parse_args()
+
+    ocr = start_fake_ocr(args.ocr_delay)
+    tmp = tempfile.mkdtemp()
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="settings",
+        PYTHONPATH=BACKEND_DIR,
+        SQLITE_PATH=os.path.join(tmp, "bench.sqlite3"),
+        OCR_API_URL=f"http://127.0.0.1:{ocr.server_port}/",
+        OCR_SECRET="bench",
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "bench"),
+        GUNICORN_WORKERS=str(args.workers),
+        GUNICORN_THREADS=str(args.threads),
+        GUNICORN_ACCESS_LOG="/dev/null",
+    )
+    manage = os.path.join(BACKEND_DIR, "manage.py")
+    subprocess.run(
+        [sys.executable, manage, "migrate", "--noinput"],
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    session_id = subprocess.run(
+        [sys.executable, manage, "shell", "-c", SETUP_SCRIPT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()[-1]
+
+    servers = {
+        "runserver": lambda port: [
+            sys.executable,
+            manage,
+            "runserver",
+            f"127.0.0.1:{port}",
+            "--noreload",
+        ],
+        "gunicorn": lambda port: [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "-c",
+            os.path.join(BACKEND_DIR, "gunicorn.conf.py"),
+            "--bind",
+            f"127.0.0.1:{port}",
+            "app.wsgi:application",
+        ],
+    }
+
+    results = {}
+    try:
+        for name, cmd in servers.items():
+            port = free_port()
+            proc = subprocess.Popen(
+                cmd(port),
+                cwd=tmp,  # uploaded images land in the throwaway dir
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_until_up(port)
+                time.sleep(args.warmup)
+                results[name] = run_clients(port, session_id, args)
+            finally:
+                proc.terminate()
+                proc.wait(timeout=60)
+    finally:
+        ocr.shutdown()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    keys = list(next(iter(results.values())).keys())
+    print(f"{'metric':<16}" + "".join(f"{name:>14}" for name in results))
+    for key in keys:
+        print(f"{key:<16}" + "".join(f"{r[key]:>14}" for r in results.values()))
+
+
+if __name__ == "__main__":
+    main()
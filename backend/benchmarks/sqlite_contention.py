@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SQLite write-contention benchmark
+
+Simulates N concurrent page uploads (page + BB creation followed by
+per-paragraph audio writes, as the background TTS thread does) while M
+pollers hammer the check_tts read path, and compares SQLite profiles.
+
+Usage:
+    python benchmarks/sqlite_contention.py
+    python benchmarks/sqlite_contention.py --uploads 16 --pollers 8 --bbs 6
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILES = ["default", "production"]
+
+
+def run_workload(args) -> dict:
+    """Run one workload against the database configured by the environment."""
+    sys.path.insert(0, BACKEND_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import OperationalError, connection
+    from apis.models.user_model import User
+    from apis.models.session_model import Session
+    from apis.models.page_model import Page
+    from apis.models.bb_model import BB
+    from apis.controller.process_controller.views import _create_page_and_bbs
+
+    call_command("migrate", verbosity=0)
+    user = User.objects.create(device_info=f"bench-{time.time()}")
+    session = Session.objects.create(user=user, title="bench")
+
+    audio_clip = "A" * (args.audio_kb * 1024)
+    ocr_result = [{"text": f"para {i}", "bbox": {}} for i in range(args.bbs)]
+    translations = [
+        {"status": "ok", "sentences": [{"translation": f"t{i}"}]}
+        for i in range(args.bbs)
+    ]
+
+    stats = {"pages": 0, "bb_writes": 0, "polls": 0, "lock_errors": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def count(key, n=1):
+        with lock:
+            stats[key] += n
+
+    def uploader():
+        try:
+            for _ in range(args.pages_per_upload):
+                try:
+                    _, bb_ids = _create_page_and_bbs(
+                        session, "bench.jpg", ocr_result, translations
+                    )
+                    count("pages")
+                    for bb_id in bb_ids:
+                        BB.objects.filter(pk=bb_id).update(
+                            audio_base64=[audio_clip] * 2, tts_status="ready"
+                        )
+                        count("bb_writes")
+                except OperationalError:
+                    count("lock_errors")
+        finally:
+            connection.close()
+
+    def poller():
+        try:
+            while not stop.is_set():
+                try:
+                    page = Page.objects.filter(session=session).last()
+                    if page is not None:
+                        bbs = list(page.getBBs())
+                        sum(1 for bb in bbs if bb.audio_base64)
+                    count("polls")
+                except OperationalError:
+                    count("lock_errors")
+        finally:
+            connection.close()
+
+    pollers = [threading.Thread(target=poller) for _ in range(args.pollers)]
+    uploaders = [threading.Thread(target=uploader) for _ in range(args.uploads)]
+
+    t0 = time.perf_counter()
+    for t in pollers + uploaders:
+        t.start()
+    for t in uploaders:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    for t in pollers:
+        t.join()
+
+    stats["elapsed"] = round(elapsed, 3)
+    stats["pages_per_s"] = round(stats["pages"] / elapsed, 2)
+    stats["bb_writes_per_s"] = round(stats["bb_writes"] / elapsed, 2)
+    stats["polls_per_s"] = round(stats["polls"] / elapsed, 2)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--pollers", type=int, default=4)
+    parser.add_argument("--pages-per-upload", type=int, default=5)
+    parser.add_argument("--bbs", type=int, default=5)
+    parser.add_argument("--audio-kb", type=int, default=64)
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        # Child process: settings can only be configured once per process
+        print(json.dumps(run_workload(args)))
+        return
+
+    results = {}
+    for profile in PROFILES:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                SQLITE_PROFILE=profile,
+                SQLITE_PATH=os.path.join(tmp, "bench.sqlite3"),
+            )
+            out = subprocess.run(
+                [sys.executable, __file__, "--profile", profile] + sys.argv[1:],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results[profile] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    keys = ["elapsed", "pages_per_s", "bb_writes_per_s", "polls_per_s", "lock_errors"]
+    print(f"{'metric':<18}" + "".join(f"{p:>14}" for p in PROFILES))
+    for key in keys:
+        print(f"{key:<18}" + "".join(f"{results[p][key]:>14}" for p in PROFILES))
+
+
+if __name__ == "__main__":
+    main()
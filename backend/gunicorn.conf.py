@@ -0,0 +1,101 @@
+"""
+Gunicorn configuration for production.
+
+Usage (from the repository root, same working directory as runserver so
+relative media/ paths are unchanged):
+    gunicorn -c backend/gunicorn.conf.py app.wsgi:application
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker \\
+        gunicorn -c backend/gunicorn.conf.py app.asgi:application
+
+Graceful reload: `kill -HUP <master pid>` starts fresh workers with the
+new code, then lets old workers finish in-flight requests and drain
+background TTS jobs (up to graceful_timeout) before they exit.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# Make `settings` and `app` importable without changing the working dir
+pythonpath = str(BACKEND_DIR)
+raw_env = ["DJANGO_SETTINGS_MODULE=settings"]
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Uploads spend most of their time waiting on OCR / OpenAI, so a few
+# processes with many threads each keep slow uploads from blocking reads.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(
+    os.getenv("GUNICORN_WORKERS", min(2 * multiprocessing.cpu_count() + 1, 9))
+)
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# A single upload may take 15s+ (OCR + translation of every paragraph)
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "180"))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = 100
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = os.getenv("GUNICORN_ERROR_LOG", "-")
+capture_output = True
+
+
+def post_worker_init(worker):
+    """
+    Import the URLconf (and with it every view) and warm up the worker
+    before it accepts connections. Otherwise the first upload on each fresh
+    worker pays for the provider / ML imports, kss' analyzer, LangChain
+    chain construction and cold provider connections, which happens on
+    every reload and max_requests recycle. /healthz/ready reports the
+    result and retries a failed warm-up (see apis.modules.startup).
+    """
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+
+    from apis.modules import startup
+
+    result = startup.warm_up()
+    took = result["finished_at"] - result["started_at"]
+    if result["ready"]:
+        worker.log.info("Worker %s warmed up in %.1fs", worker.pid, took)
+    else:
+        worker.log.warning(
+            "Worker %s not ready after %.1fs; /healthz/ready retries the warm-up",
+            worker.pid,
+            took,
+        )
+    for name, step in result["steps"].items():
+        if step["error"]:
+            worker.log.warning(
+                "Worker %s warm-up step %s failed: %s", worker.pid, name, step["error"]
+            )
+
+
+def worker_exit(server, worker):
+    """
+    Keep the exiting worker alive until its background TTS threads finish,
+    so a reload or shutdown never drops half-synthesized pages.
+    """
+    from apis.modules import background_jobs
+
+    pending = background_jobs.in_flight()
+    if not pending:
+        return
+
+    server.log.info("Worker %s draining %d background job(s)", worker.pid, pending)
+    # The arbiter stops waiting after graceful_timeout, and kills silent
+    # workers after timeout; leave a little headroom before either
+    drained = background_jobs.wait_for_drain(max(min(timeout, graceful_timeout) - 5, 1))
+    if not drained:
+        server.log.warning(
+            "Worker %s exiting with %d background job(s) unfinished",
+            worker.pid,
+            background_jobs.in_flight(),
+        )
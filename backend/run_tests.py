@@ -7,6 +7,10 @@ Usage:
     python run_tests.py          # Interactive menu
     python run_tests.py --unit   # Run all unit tests
     python run_tests.py --all    # Run all tests
+    python run_tests.py --postgres --integration
+                                 # Run integration tests on PostgreSQL
+                                 # (DB_* env vars, or a local pgserver
+                                 # stand-in when DB_HOST is unset)
 """
 
 import sys
@@ -54,6 +58,7 @@ TESTS = {
 CLI_ARGS = {
     "--all": "tests",
     "--unit": "tests.unit",
+    "--integration": "tests.integration",
     "--user": USER,
     "--session": SESSION,
     "--process": PROCESS,
@@ -65,11 +70,45 @@ CLI_ARGS = {
 }
 
 
+# --- PostgreSQL test profile ---
+def postgres_env():
+    """
+    Environment for running the suite against PostgreSQL.
+    Uses the DB_* variables when DB_HOST is set (CI service container),
+    otherwise boots a throwaway local server with pgserver.
+    """
+    env = dict(os.environ, DB_ENGINE="postgresql")
+    if env.get("DB_HOST"):
+        return env
+
+    try:
+        import pgserver
+    except ImportError:
+        print(f"{C.R}Set DB_HOST or `pip install pgserver` for a local server{C.EN}")
+        sys.exit(1)
+
+    import tempfile
+
+    data_dir = tempfile.mkdtemp(prefix="storybridge-pg-")
+    server = pgserver.get_server(data_dir, cleanup_mode="delete")
+    env.update(
+        DB_NAME="postgres",
+        DB_USER="postgres",
+        DB_PASSWORD="",
+        DB_HOST=data_dir,  # unix socket directory
+    )
+    # Keep a reference so the server lives as long as this process
+    postgres_env.server = server
+    return env
+
+
 # --- Run a Django test command and parse results ---
-def run_test(path):
+def run_test(path, env=None):
     python_bin = sys.executable
     cmd = [python_bin, "manage.py", "test", path, "--verbosity=2"]
-    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, env=env
+    )
     output = result.stdout + result.stderr
     lines = output.splitlines()
 
@@ -191,13 +230,20 @@ def menu():
 
 # --- Main ---
 def main():
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
+    args = sys.argv[1:]
+    env = None
+    if "--postgres" in args:
+        args.remove("--postgres")
+        env = postgres_env()
+        args = args or ["--all"]
+
+    if args:
+        arg = args[0]
         if arg in ["-h", "--help"]:
             print(__doc__)
             return 0
         if arg in CLI_ARGS:
-            return run_test(CLI_ARGS[arg])
+            return run_test(CLI_ARGS[arg], env)
         print(f"Unknown argument: {arg}")
         return 1
 
@@ -1,3 +1,4 @@
+import importlib.util
 import os
 from dotenv import load_dotenv
 from pathlib import Path
@@ -34,6 +35,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apis.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -65,24 +67,73 @@ WSGI_APPLICATION = "app.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-# DATABASES = {
-#     "default": {
-#         "ENGINE": "django.db.backends.postgresql",
-#         "NAME": os.getenv("DB_NAME", "postgres"),
-#         "USER": os.getenv("DB_USER", "postgres"),
-#         "PASSWORD": os.getenv("DB_PASSWORD"),
-#         "HOST": os.getenv("DB_HOST"),
-#         "PORT": os.getenv("DB_PORT", "5432"),
-#     }
-# }
-
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+# --- Backend selection ---
+# DB_ENGINE=sqlite (default) or DB_ENGINE=postgresql (uses DB_* variables).
+# DB_CONN_MAX_AGE keeps connections open across requests (seconds, 0 to
+# close after each request). DB_POOL=1 enables Django's psycopg 3
+# connection pool instead (requires `pip install "psycopg[pool]"`).
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite").lower()
+DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+DB_POOL = os.getenv("DB_POOL", "0") == "1"
+
+# --- SQLite tuning profile ---
+# "production": WAL journal so readers never block the writer, a busy
+# timeout instead of immediate "database is locked" errors, and IMMEDIATE
+# transactions so concurrent writers queue on the busy timeout rather than
+# deadlocking on a lock upgrade. "default": stock sqlite3 behaviour.
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # safe with WAL; fsync only at checkpoints
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "20000")),
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # negative value is in KiB (64 MiB)
+    "temp_store": "MEMORY",
 }
 
+SQLITE_OPTIONS = {}
+if SQLITE_PROFILE == "production":
+    SQLITE_OPTIONS = {
+        # Executed by Django on every new connection
+        "init_command": ";".join(
+            f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+        ),
+        "transaction_mode": "IMMEDIATE",
+    }
+
+if DB_ENGINE in ("postgres", "postgresql"):
+    POSTGRES_OPTIONS = {}
+    if DB_POOL:
+        POSTGRES_OPTIONS["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME", "postgres"),
+            "USER": os.getenv("DB_USER", "postgres"),
+            "PASSWORD": os.getenv("DB_PASSWORD"),
+            "HOST": os.getenv("DB_HOST"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+            # Pooled connections are returned to the pool, never persisted
+            "CONN_MAX_AGE": 0 if DB_POOL else DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": POSTGRES_OPTIONS,
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "OPTIONS": SQLITE_OPTIONS,
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -135,9 +186,169 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    # JSON stays the default; MessagePack only when the client asks for it
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "apis.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apis.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
 }
+if importlib.util.find_spec("msgpack") is not None:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "apis.renderers.MessagePackRenderer"
+    )
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# --- Page progress push (SSE: /process/stream/) ---
+# How often a stream re-reads progress from the DB when no in-process
+# change notification arrives (changes made by another worker process)
+PROGRESS_RECONCILE_SECONDS = float(os.getenv("PROGRESS_RECONCILE_SECONDS", "2"))
+# Streams are closed after this long; EventSource clients reconnect
+PROGRESS_STREAM_MAX_SECONDS = float(os.getenv("PROGRESS_STREAM_MAX_SECONDS", "600"))
+PROGRESS_KEEPALIVE_SECONDS = 15
+# Longest a check_tts long-poll (?wait=) holds its worker thread
+PROGRESS_LONG_POLL_MAX_SECONDS = float(
+    os.getenv("PROGRESS_LONG_POLL_MAX_SECONDS", "25")
+)
+
+# --- Response compression (apis.middleware.CompressionMiddleware) ---
+# Server preference; each is offered only if installed and accepted
+COMPRESSION_ENCODINGS = ["zstd", "br", "gzip"]
+COMPRESSION_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+# Bodies smaller than this fit in a packet or two; not worth the CPU
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_CONTENT_TYPES = {"application/json", "text/plain", "text/html"}
+# Large bodies are sampled first and sent uncompressed when the sample
+# shrinks by less than COMPRESSION_MIN_RATIO
+COMPRESSION_SAMPLE_SIZE = 64 * 1024
+COMPRESSION_MIN_RATIO = 0.1
+
+# --- Response cache for finished pages (apis.modules.response_cache) ---
+# file: shared by the workers of a host (default); redis: shared by every
+# host (needs the redis package + REDIS_URL); locmem: per worker process,
+# only for a single worker -- other workers never see an invalidation
+RESPONSE_CACHE_ALIAS = "responses"
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "file").lower()
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "600"))
+# Larger bodies (page images, long get_tts payloads) are not cached, which
+# bounds the cache at MAX_ENTRIES * this many bytes
+RESPONSE_CACHE_MAX_ENTRY_BYTES = int(
+    os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", str(256 * 1024))
+)
+_RESPONSE_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "page-responses",
+        "OPTIONS": {"MAX_ENTRIES": 200},
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(BASE_DIR, ".cache", "responses"),
+        "OPTIONS": {"MAX_ENTRIES": 2000},
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL", "redis://127.0.0.1:6379/1"),
+    },
+}
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    RESPONSE_CACHE_ALIAS: {
+        **_RESPONSE_CACHE_BACKENDS[RESPONSE_CACHE_BACKEND],
+        "TIMEOUT": RESPONSE_CACHE_TIMEOUT,
+    },
+}
+
+# --- Session sync (GET /session/sync) ---
+# How long a handed-out manifest is kept for computing deltas against it
+SESSION_SYNC_MANIFEST_TTL = int(os.getenv("SESSION_SYNC_MANIFEST_TTL", "86400"))
+
+# --- Profanity index snapshot (apis.modules.profanity_index) ---
+# Built by `manage.py build_profanity_index`; memory-mapped at startup when
+# it matches media/profanity, otherwise the lists are compiled in-process
+PROFANITY_INDEX_PATH = os.getenv(
+    "PROFANITY_INDEX_PATH", os.path.join(BASE_DIR, ".cache", "profanity.idx")
+)
+
+# --- Sentence segmentation (apis.modules.segmentation) ---
+# Paragraphs memoized per process, and the longest paragraph split by rule
+SEGMENTATION_CACHE_SIZE = int(os.getenv("SEGMENTATION_CACHE_SIZE", "4096"))
+SEGMENTATION_RULE_MAX_CHARS = int(os.getenv("SEGMENTATION_RULE_MAX_CHARS", "200"))
+
+# --- Startup (apis.modules.startup, manage.py profile_imports / warmup) ---
+# Target for django.setup() + importing the URLconf in a fresh worker;
+# provider SDKs and ML libraries load on first use or in startup.preload
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
+# Per provider host, for the connection step of startup.warm_up
+WARMUP_CONNECT_TIMEOUT = float(os.getenv("WARMUP_CONNECT_TIMEOUT", "5"))
+# A failed warm-up is retried by the next readiness probe after this long
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "30"))
+
+# --- TTS model tiering (apis.modules.tts_routing) ---
+# full | lite | adaptive (lite candidates use the full model while the
+# page's TTS is projected to finish within TTS_PAGE_LATENCY_BUDGET seconds)
+TTS_TIER_POLICY = os.getenv("TTS_TIER_POLICY", "adaptive").lower()
+TTS_PAGE_LATENCY_BUDGET = float(os.getenv("TTS_PAGE_LATENCY_BUDGET", "15"))
+# Lite candidates: sentences this short, interjections, refrains on a page
+TTS_LITE_MAX_CHARS = int(os.getenv("TTS_LITE_MAX_CHARS", "16"))
+TTS_LITE_INTERJECTIONS = {
+    "en": set("oh ah aha wow whoa oops uh-oh hooray yay hmm ouch phew shh".split()),
+    "zh": set("哇 啊 哎呀 哦 嗯 耶 哈哈 呀 嘘".split()),
+    "vi": set("ôi ồ à ừ oa chà a ối dạ vâng trời".split()),
+}
+# Seconds per sentence until the running p95 of a tier is known
+TTS_TIER_LATENCY_ESTIMATE = {"full": 3.0, "lite": 1.5}
+# Approximate list prices (USD per 1K input characters), for cost records.
+# tts-1 is billed per character; gpt-4o-mini-tts per audio minute
+# (~$0.015), about 900 characters of narration
+TTS_TIER_COST_PER_1K_CHARS = {
+    "full": float(os.getenv("TTS_FULL_COST_PER_1K_CHARS", "0.017")),
+    "lite": float(os.getenv("TTS_LITE_COST_PER_1K_CHARS", "0.015")),
+}
+
+# --- Request hedging (apis.modules.hedging) ---
+# A call still running after the p-th percentile latency of its operation
+# gets a duplicate; the first success wins and the other is cancelled
+HEDGING_ENABLED = os.getenv("HEDGING_ENABLED", "1") == "1"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.5"))
+# At most this share of the last HEDGE_RATE_WINDOW calls of an operation
+HEDGE_MAX_RATE = float(os.getenv("HEDGE_MAX_RATE", "0.1"))
+HEDGE_RATE_WINDOW = int(os.getenv("HEDGE_RATE_WINDOW", "200"))
+
+# --- Provider retries and circuit breakers (apis.modules.retry_policy) ---
+# Attempts per provider call; transient failures (429, 5xx, connection
+# errors) back off exponentially with full jitter, or as long as the
+# provider's Retry-After asks (giving up when that exceeds RETRY_MAX_DELAY)
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "8"))
+# Consecutive transient failures that open a model's breaker, and seconds
+# it fails fast before letting a probe call through
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+# --- Upload deadlines (apis.modules.deadlines) ---
+# From an accepted upload to its last audio clip; the page itself is
+# published UPLOAD_TTS_RESERVE seconds before that (translations still
+# running then are left pending and finished by the TTS job)
+UPLOAD_DEADLINE_SECONDS = float(os.getenv("UPLOAD_DEADLINE_SECONDS", "120"))
+UPLOAD_TTS_RESERVE = float(os.getenv("UPLOAD_TTS_RESERVE", "45"))
+# Clova OCR request (blocking client), before the deadline shortens it
+OCR_CONNECT_TIMEOUT = float(os.getenv("OCR_CONNECT_TIMEOUT", "5"))
+OCR_READ_TIMEOUT = float(os.getenv("OCR_READ_TIMEOUT", "60"))
+
+# --- Adaptive concurrency (apis.modules.adaptive_concurrency) ---
+# In-flight OpenAI requests per operation (translate, sentiment, tts,
+# tts_lite): +1 per round of healthy responses, x AIMD_DECREASE_FACTOR on
+# a 429 or a response slower than AIMD_LATENCY_SPIKE_FACTOR x the p50
+AIMD_INITIAL_LIMIT = int(os.getenv("AIMD_INITIAL_LIMIT", "8"))
+AIMD_MIN_LIMIT = int(os.getenv("AIMD_MIN_LIMIT", "1"))
+AIMD_MAX_LIMIT = int(os.getenv("AIMD_MAX_LIMIT", "64"))
+AIMD_DECREASE_FACTOR = float(os.getenv("AIMD_DECREASE_FACTOR", "0.5"))
+AIMD_LATENCY_SPIKE_FACTOR = float(os.getenv("AIMD_LATENCY_SPIKE_FACTOR", "3"))
+AIMD_DECREASE_COOLDOWN = float(os.getenv("AIMD_DECREASE_COOLDOWN", "1"))
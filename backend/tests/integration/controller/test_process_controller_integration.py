@@ -10,6 +10,17 @@ from unittest.mock import patch, AsyncMock, MagicMock
 import json
 
 
+class _InlineThread:
+    """Runs a background thread target synchronously on start()."""
+
+    def __init__(self, target, name=None, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+@patch("apis.modules.background_jobs.threading.Thread", _InlineThread)
 class TestProcessUploadViewIntegration(TestCase):
     """Integration tests for Process Upload endpoint"""
 
@@ -65,6 +76,7 @@ class TestProcessUploadViewIntegration(TestCase):
                 ],
             }
         )
+        mock_tts_instance.run_tts_only = AsyncMock(return_value=[])
         mock_tts_class.return_value = mock_tts_instance
 
         data = {
@@ -75,10 +87,18 @@ class TestProcessUploadViewIntegration(TestCase):
 
         response = self.client.post("/process/upload/", data, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn("session_id", response.data)
         self.assertIn("page_index", response.data)
+        self.assertEqual(response.data["status"], "queued")
+
+        # The background job (run inline) leaves the page ready
+        response = self.client.get(
+            "/process/check_ocr/",
+            {"session_id": str(self.test_session.id), "page_index": 0},
+        )
         self.assertEqual(response.data["status"], "ready")
+        self.assertEqual(response.data["progress"], 100)
 
         # Verify session was updated
         self.test_session.refresh_from_db()
@@ -121,7 +141,7 @@ class TestProcessUploadViewIntegration(TestCase):
 
     @patch("apis.controller.process_controller.views.OCRModule")
     def test_06_upload_ocr_failure(self, mock_ocr_class):
-        """Test upload when OCR finds no text (should return 422 UNPROCESSABLE ENTITY)"""
+        """Test upload when OCR finds no text (the page is marked failed)"""
         mock_ocr_instance = MagicMock()
         mock_ocr_instance.process_page.return_value = []
         mock_ocr_class.return_value = mock_ocr_instance
@@ -135,10 +155,14 @@ class TestProcessUploadViewIntegration(TestCase):
 
         response = self.client.post("/process/upload/", data, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
-        self.assertIn("error_code", response.data)
-        self.assertEqual(response.data["error_code"], 422)
-        self.assertEqual(response.data["message"], "PROCESS__UNABLE_TO_PROCESS_IMAGE")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self.client.get(
+            "/process/check_ocr/",
+            {"session_id": str(self.test_session.id), "page_index": 0},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "failed")
 
 
 class TestCheckOCRStatusViewIntegration(TestCase):
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from apis.modules import startup
+
+
+class TestReadinessView(APITestCase):
+    """Unit tests for the readiness endpoint"""
+
+    def setUp(self):
+        """Set up test client and a cold worker"""
+        self.client = APIClient()
+        self.saved = dict(startup._state)
+        startup._state.update(ready=False, running=False, finished_at=None, steps={})
+
+    def tearDown(self):
+        """Restore the warm-up state of the test process"""
+        startup._state.update(self.saved)
+
+    def warm_up(self, fail=False):
+        def connect():
+            if fail:
+                raise ConnectionError("unreachable")
+
+        steps = (("imports", lambda: None), ("connections", connect))
+        with patch.object(startup, "WARM_UP_STEPS", steps):
+            startup.warm_up()
+
+    @patch("apis.modules.startup.threading.Thread")
+    def test_01_first_probe_starts_warm_up(self, mock_thread):
+        """Test a cold worker answers 503 and starts its warm-up once"""
+        response = self.client.get("/healthz/ready")
+        self.client.get("/healthz/ready")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["status"], "warming_up")
+        mock_thread.assert_called_once()
+        self.assertIs(mock_thread.call_args.kwargs["target"], startup.warm_up)
+
+    @patch("apis.modules.startup.threading.Thread")
+    def test_02_ready_after_warm_up(self, mock_thread):
+        """Test the worker is ready once every step succeeded"""
+        self.warm_up()
+
+        response = self.client.get("/healthz/ready")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "ready")
+        self.assertIsNone(response.data["steps"]["connections"]["error"])
+        mock_thread.assert_not_called()
+
+    @patch("apis.modules.startup.threading.Thread")
+    def test_03_failed_step_is_not_ready_and_retried(self, mock_thread):
+        """Test a failed step keeps the worker unready until a retry"""
+        self.warm_up(fail=True)
+
+        with override_settings(WARMUP_RETRY_SECONDS=60):
+            response = self.client.get("/healthz/ready")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["status"], "failed")
+        self.assertEqual(
+            response.data["steps"]["connections"]["error"],
+            "ConnectionError: unreachable",
+        )
+        mock_thread.assert_not_called()
+
+        with override_settings(WARMUP_RETRY_SECONDS=0):
+            response = self.client.get("/healthz/ready")
+        self.assertEqual(response.data["status"], "warming_up")
+        mock_thread.assert_called_once()
+
+    @patch("apis.modules.startup.threading.Thread")
+    def test_04_boot_id_changes_in_forked_worker(self, mock_thread):
+        """Test the response carries the boot id a forked worker renews"""
+        saved = dict(startup._boot)
+        try:
+            before = self.client.get("/healthz/ready").data
+            startup._reset_boot()
+            after = self.client.get("/healthz/ready").data
+        finally:
+            startup._boot.update(saved)
+
+        self.assertEqual(before["boot_id"], saved["id"])
+        self.assertNotEqual(after["boot_id"], before["boot_id"])
+        self.assertGreaterEqual(after["booted_at"], before["booted_at"])
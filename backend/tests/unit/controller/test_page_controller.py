@@ -4,10 +4,12 @@ from apis.models.user_model import User
 from apis.models.session_model import Session
 from apis.models.page_model import Page
 from apis.models.bb_model import BB
+from django.test import override_settings
 from django.utils import timezone
 import json
 import os
 import base64
+import gzip
 
 
 class TestPageGetImageView(APITestCase):
@@ -343,3 +345,640 @@ class TestPageGetTTSView(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestPageImageView(APITestCase):
+    """Unit tests for binary Page Image endpoint"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        self.client = APIClient()
+
+        self.test_user = User.objects.create(
+            device_info="test-image-binary-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+
+        self.test_image_path = "media/test_images/test_binary_image.jpg"
+        os.makedirs(os.path.dirname(self.test_image_path), exist_ok=True)
+        self.test_image_bytes = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 4
+        with open(self.test_image_path, "wb") as f:
+            f.write(self.test_image_bytes)
+
+        Page.objects.create(
+            session=self.test_session,
+            img_url=self.test_image_path,
+            bbox_json=json.dumps([]),
+            created_at=timezone.now(),
+        )
+        self.params = {"session_id": str(self.test_session.id), "page_index": 0}
+
+    def tearDown(self):
+        """Clean up test files"""
+        if os.path.exists(self.test_image_path):
+            os.remove(self.test_image_path)
+        if os.path.exists("media/test_images"):
+            os.rmdir("media/test_images")
+
+    def test_01_get_image_binary(self):
+        """Test image is returned as raw bytes with a strong ETag"""
+        response = self.client.get("/page/image/", self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(b"".join(response.streaming_content), self.test_image_bytes)
+
+    def test_02_get_image_not_modified(self):
+        """Test If-None-Match with the current ETag returns 304"""
+        etag = self.client.get("/page/image/", self.params)["ETag"]
+
+        response = self.client.get("/page/image/", self.params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_03_get_image_range(self):
+        """Test Range request returns 206 with the requested bytes"""
+        response = self.client.get("/page/image/", self.params, HTTP_RANGE="bytes=4-13")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        total = len(self.test_image_bytes)
+        self.assertEqual(response["Content-Range"], f"bytes 4-13/{total}")
+        self.assertEqual(b"".join(response.streaming_content), bytes(range(10)))
+
+    def test_04_get_image_suffix_range(self):
+        """Test suffix Range request returns the last N bytes"""
+        response = self.client.get("/page/image/", self.params, HTTP_RANGE="bytes=-16")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        content = b"".join(response.streaming_content)
+        self.assertEqual(content, self.test_image_bytes[-16:])
+
+    def test_05_get_image_unsatisfiable_range(self):
+        """Test Range beyond end of file returns 416"""
+        response = self.client.get(
+            "/page/image/", self.params, HTTP_RANGE="bytes=999999-"
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+
+    def test_06_get_image_accept_image(self):
+        """Test image clients sending Accept: image/* are not rejected"""
+        response = self.client.get("/page/image/", self.params, HTTP_ACCEPT="image/*")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_07_get_image_page_not_found(self):
+        """Test binary image retrieval with invalid page_index"""
+        response = self.client.get(
+            "/page/image/",
+            {"session_id": str(self.test_session.id), "page_index": 999},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_08_get_image_negative_page_index(self):
+        """Test binary image retrieval with a negative page_index"""
+        response = self.client.get(
+            "/page/image/",
+            {"session_id": str(self.test_session.id), "page_index": -1},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_09_get_image_malformed_range_ignored(self):
+        """Test a Range header that cannot be parsed gets the full body"""
+        for header in (
+            "bytes=abc",
+            "bytes=-",
+            "bytes=9-3",
+            "items=0-1",
+            "bytes=0-1,4-5",
+        ):
+            response = self.client.get("/page/image/", self.params, HTTP_RANGE=header)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, header)
+            self.assertEqual(
+                b"".join(response.streaming_content), self.test_image_bytes, header
+            )
+
+        response = self.client.get("/page/image/", self.params, HTTP_RANGE="bytes=-0")
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+
+
+class TestPageAudioView(APITestCase):
+    """Unit tests for binary Page Audio endpoint"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        self.client = APIClient()
+
+        self.test_user = User.objects.create(
+            device_info="test-audio-binary-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.test_page = Page.objects.create(
+            session=self.test_session,
+            img_url="test.jpg",
+            bbox_json=json.dumps([]),
+            created_at=timezone.now(),
+        )
+
+        self.clip_bytes = b"ID3" + b"\x00" * 64 + b"fake-mp3-frames"
+        BB.objects.create(
+            page=self.test_page,
+            original_text="Text 1",
+            audio_base64=[],
+            translated_text="Translated 1",
+            coordinates={},
+        )
+        BB.objects.create(
+            page=self.test_page,
+            original_text="Text 2",
+            audio_base64=[base64.b64encode(self.clip_bytes).decode("utf-8")],
+            translated_text="Translated 2",
+            coordinates={},
+        )
+        self.params = {
+            "session_id": str(self.test_session.id),
+            "page_index": 0,
+            "bbox_index": 1,
+            "clip_index": 0,
+        }
+        self.written = []
+
+    def tearDown(self):
+        """Clean up materialized audio clips"""
+        for path in self.written:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _get(self, params, **headers):
+        response = self.client.get("/page/audio/", params, **headers)
+        if response.has_header("ETag"):
+            digest = response["ETag"].strip('"')
+            self.written.append(f"media/audio/{digest}.mp3")
+        return response
+
+    def test_01_get_audio_binary(self):
+        """Test audio clip is returned as raw mp3 bytes"""
+        response = self._get(self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "audio/mpeg")
+        self.assertEqual(b"".join(response.streaming_content), self.clip_bytes)
+
+    def test_02_get_audio_not_modified(self):
+        """Test If-None-Match with the clip ETag returns 304"""
+        etag = self._get(self.params)["ETag"]
+
+        response = self._get(self.params, HTTP_IF_NONE_MATCH=f"W/{etag}")
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_03_get_audio_range(self):
+        """Test Range request on an audio clip"""
+        response = self._get(self.params, HTTP_RANGE="bytes=0-2")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), b"ID3")
+
+    def test_04_get_audio_no_clip(self):
+        """Test BB without audio returns 404"""
+        response = self._get({**self.params, "bbox_index": 0})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_05_get_audio_clip_out_of_range(self):
+        """Test clip_index past the last clip returns 404"""
+        response = self._get({**self.params, "clip_index": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_06_get_audio_missing_params(self):
+        """Test audio retrieval without bbox_index"""
+        params = dict(self.params)
+        del params["bbox_index"]
+        response = self._get(params)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_07_discard_removes_clips(self):
+        """Test discarding the session deletes its materialized clips"""
+        self._get(self.params)
+        clip_path = self.written[0]
+        self.assertTrue(os.path.exists(clip_path))
+
+        self.client.post(
+            "/session/discard",
+            {"session_id": str(self.test_session.id)},
+            format="json",
+        )
+
+        self.assertFalse(os.path.exists(clip_path))
+
+
+class TestResponseRenderers(APITestCase):
+    """Unit tests for response rendering and content negotiation"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        self.client = APIClient()
+
+        self.test_user = User.objects.create(
+            device_info="test-renderer-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.test_page = Page.objects.create(
+            session=self.test_session,
+            img_url="test.jpg",
+            bbox_json=json.dumps([]),
+            created_at=timezone.now(),
+        )
+        self.clip = b"ID3\x00fake-mp3"
+        BB.objects.create(
+            page=self.test_page,
+            original_text="Text 1",
+            audio_base64=[base64.b64encode(self.clip).decode("ascii")],
+            translated_text="Translated 1",
+            coordinates={},
+        )
+        self.params = {"session_id": str(self.test_session.id), "page_index": 0}
+
+    def test_01_json_matches_drf_renderer(self):
+        """Test orjson output is byte-identical to DRF's JSONRenderer"""
+        import datetime
+        import decimal
+        import uuid
+
+        from rest_framework.renderers import JSONRenderer
+        from apis.renderers import ORJSONRenderer
+
+        data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "at": datetime.datetime(2025, 1, 2, 3, 4, 5, 678000, datetime.timezone.utc),
+            "score": decimal.Decimal("1.50"),
+            "text": "안녕 — hello",
+            "items": [1, 2.5, None, True],
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_02_default_response_is_json(self):
+        """Test responses default to JSON without an Accept header"""
+        response = self.client.get("/page/get_tts/", self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            json.loads(response.content)["audio_results"][0]["audio_base64_list"],
+            [base64.b64encode(self.clip).decode("ascii")],
+        )
+
+    def test_03_msgpack_sends_raw_audio(self):
+        """Test Accept: application/msgpack returns clips as raw bytes"""
+        import msgpack
+
+        response = self.client.get(
+            "/page/get_tts/", self.params, HTTP_ACCEPT="application/msgpack"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        data = msgpack.unpackb(response.content)
+        self.assertEqual(data["audio_results"][0]["audio_base64_list"], [self.clip])
+        self.assertEqual(data["audio_results"][0]["bbox_index"], 0)
+
+    def test_04_msgpack_error_response(self):
+        """Test error bodies are negotiated the same way"""
+        import msgpack
+
+        response = self.client.post(
+            "/user/register", {}, format="json", HTTP_ACCEPT="application/msgpack"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            msgpack.unpackb(response.content),
+            {"error_code": 400, "message": "USER__INVALID_REQUEST_BODY"},
+        )
+
+    def test_05_malformed_json_body(self):
+        """Test malformed JSON request body returns 400"""
+        response = self.client.post(
+            "/user/register", data=b"{not json", content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestResponseCompression(APITestCase):
+    """Unit tests for response compression middleware"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        self.client = APIClient()
+
+        self.test_user = User.objects.create(
+            device_info="test-compression-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.test_page = Page.objects.create(
+            session=self.test_session,
+            img_url="test.jpg",
+            bbox_json=json.dumps([]),
+            created_at=timezone.now(),
+        )
+        for i in range(20):
+            BB.objects.create(
+                page=self.test_page,
+                original_text=f"Once upon a time there was a little fox number {i}.",
+                audio_base64=[],
+                translated_text=f"옛날 옛적에 작은 여우 {i}번이 살았어요.",
+                coordinates={"x1": i, "y1": i, "x2": i + 100, "y2": i + 40},
+            )
+        self.params = {"session_id": str(self.test_session.id), "page_index": 0}
+
+    def _get_ocr(self, **headers):
+        return self.client.get("/page/get_ocr/", self.params, **headers)
+
+    def test_01_gzip_when_accepted(self):
+        """Test large JSON is gzipped when the client accepts gzip"""
+        plain = self._get_ocr()
+        response = self._get_ocr(HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_02_no_accept_encoding(self):
+        """Test responses stay uncompressed without Accept-Encoding"""
+        response = self._get_ocr()
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(len(response.json()["ocr_results"]), 20)
+
+    def test_03_small_body_not_compressed(self):
+        """Test bodies below COMPRESSION_MIN_SIZE are sent as-is"""
+        response = self.client.get(
+            "/page/get_ocr/",
+            {"session_id": str(self.test_session.id), "page_index": 99},
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_04_refused_encoding_skipped(self):
+        """Test codings with q=0 are never chosen"""
+        response = self._get_ocr(HTTP_ACCEPT_ENCODING="zstd;q=0, br;q=0, gzip;q=0.5")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+        response = self._get_ocr(HTTP_ACCEPT_ENCODING="gzip;q=0")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_05_zstd_preferred(self):
+        """Test zstd is preferred over gzip when both are accepted"""
+        from apis.middleware import zstandard
+
+        if zstandard is None:
+            self.skipTest("zstandard not installed")
+
+        plain = self._get_ocr()
+        response = self._get_ocr(HTTP_ACCEPT_ENCODING="gzip, deflate, br, zstd")
+
+        self.assertEqual(response["Content-Encoding"], "zstd")
+        self.assertEqual(
+            zstandard.ZstdDecompressor().decompressobj().decompress(response.content),
+            plain.content,
+        )
+
+    def test_06_binary_not_compressed(self):
+        """Test already-compressed media types are never recompressed"""
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+        from apis.middleware import CompressionMiddleware
+
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        body = b"\xff\xd8\xff\xe0" + b"\x00" * 4096
+        middleware = CompressionMiddleware(
+            lambda r: HttpResponse(body, content_type="image/jpeg")
+        )
+
+        response = middleware(request)
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, body)
+
+    def test_07_streaming_response(self):
+        """Test streaming JSON is compressed chunk by chunk"""
+        from django.http import StreamingHttpResponse
+        from django.test import RequestFactory
+        from apis.middleware import CompressionMiddleware
+
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        chunks = [b'{"items": [', b'"a", ' * 500, b'"b"]}']
+        middleware = CompressionMiddleware(
+            lambda r: StreamingHttpResponse(
+                iter(chunks), content_type="application/json"
+            )
+        )
+
+        response = middleware(request)
+        body = b"".join(response.streaming_content)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(body), b"".join(chunks))
+
+    def test_08_strong_etag_weakened(self):
+        """Test a strong ETag becomes weak once the body is compressed"""
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+        from apis.middleware import CompressionMiddleware
+
+        def view(request):
+            response = HttpResponse(b"[" + b"1," * 2000 + b"1]")
+            response["Content-Type"] = "application/json"
+            response["ETag"] = '"abc"'
+            return response
+
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        response = CompressionMiddleware(view)(request)
+
+        self.assertEqual(response["ETag"], 'W/"abc"')
+
+
+class TestPageResponseCache(APITestCase):
+    """Unit tests for the finished-page response cache"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        from django.core.cache import caches
+
+        caches["responses"].clear()
+        self.client = APIClient()
+
+        self.test_user = User.objects.create(
+            device_info="test-cache-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.test_page = Page.objects.create(
+            session=self.test_session,
+            img_url="test.jpg",
+            bbox_json=json.dumps([]),
+            created_at=timezone.now(),
+        )
+        self.test_bb = BB.objects.create(
+            page=self.test_page,
+            original_text="Original text",
+            audio_base64=["clip"],
+            translated_text="Translated text",
+            coordinates={},
+            tts_status="ready",
+        )
+        self.params = {"session_id": str(self.test_session.id), "page_index": 0}
+
+    def test_01_ready_page_served_from_cache(self):
+        """Test second read of a finished page is a cache hit"""
+        first = self.client.get("/page/get_ocr/", self.params)
+        second = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second["Content-Type"], "application/json")
+        self.assertEqual(second.content, first.content)
+
+    def test_02_unfinished_page_not_cached(self):
+        """Test pages still being processed are never cached"""
+        Page.objects.filter(pk=self.test_page.pk).update(status="translating")
+
+        self.client.get("/page/get_ocr/", self.params)
+        response = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertFalse(response.has_header("X-Cache"))
+
+    def test_03_tts_cached_once_settled(self):
+        """Test get_tts is cached only when every BB's TTS is final"""
+        BB.objects.filter(pk=self.test_bb.pk).update(tts_status="processing")
+        self.client.get("/page/get_tts/", self.params)
+        response = self.client.get("/page/get_tts/", self.params)
+        self.assertFalse(response.has_header("X-Cache"))
+
+        BB.objects.filter(pk=self.test_bb.pk).update(tts_status="ready")
+        self.client.get("/page/get_tts/", self.params)
+        response = self.client.get("/page/get_tts/", self.params)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_04_invalidate_session(self):
+        """Test invalidation drops the cached responses of the session"""
+        from apis.modules import response_cache
+
+        self.client.get("/page/get_ocr/", self.params)
+        response_cache.invalidate_session(self.test_session.id)
+        response = self.client.get("/page/get_ocr/", self.params)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        self.test_bb.translated_text = "Updated"
+        self.test_bb.save()
+        response = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(
+            response.json()["ocr_results"][0]["translation_txt"], "Updated"
+        )
+
+    def test_05_formats_cached_separately(self):
+        """Test JSON and MessagePack responses use separate entries"""
+        self.client.get("/page/get_tts/", self.params)
+        response = self.client.get(
+            "/page/get_tts/", self.params, HTTP_ACCEPT="application/msgpack"
+        )
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+
+    def test_06_discard_invalidates(self):
+        """Test discarding the session drops its cached pages"""
+        self.client.get("/page/get_ocr/", self.params)
+        self.client.post(
+            "/session/discard",
+            {"session_id": str(self.test_session.id)},
+            format="json",
+        )
+
+        response = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_07_cache_stats(self):
+        """Test cache_stats reports per-endpoint hit ratios"""
+        from apis.modules import response_cache
+
+        before = response_cache.stats().get("get_ocr", {"hits": 0, "misses": 0})
+        for _ in range(4):
+            self.client.get("/page/get_ocr/", self.params)
+
+        response = self.client.get("/page/cache_stats/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["backend"], "file")
+        stats = response.json()["endpoints"]["get_ocr"]
+        self.assertEqual(stats["hits"] - before["hits"], 3)
+        self.assertEqual(stats["misses"] - before["misses"], 1)
+
+    def test_08_pending_translation_not_cached(self):
+        """Test a ready page is not cached while a translation is pending"""
+        BB.objects.filter(pk=self.test_bb.pk).update(translated_text=None)
+
+        self.client.get("/page/get_ocr/", self.params)
+        response = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertFalse(response.has_header("X-Cache"))
+        self.assertEqual(response.json()["ocr_results"][0]["translation_txt"], "")
+
+        BB.objects.filter(pk=self.test_bb.pk).update(translated_text="Translated")
+        self.client.get("/page/get_ocr/", self.params)
+        response = self.client.get("/page/get_ocr/", self.params)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_09_large_body_not_cached(self):
+        """Test a body over RESPONSE_CACHE_MAX_ENTRY_BYTES is served uncached"""
+        with override_settings(RESPONSE_CACHE_MAX_ENTRY_BYTES=10):
+            self.client.get("/page/get_ocr/", self.params)
+            response = self.client.get("/page/get_ocr/", self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Cache"], "MISS")
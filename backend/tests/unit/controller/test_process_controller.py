@@ -4,11 +4,36 @@ from apis.models.user_model import User
 from apis.models.session_model import Session
 from apis.models.page_model import Page
 from apis.models.bb_model import BB
+from apis.models.page_payload_model import PagePayload
+from apis.controller.process_controller.views import (
+    _create_page_and_bbs,
+    _start_background_tts,
+    _translate_paragraphs,
+)
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.utils import timezone
+from apis.modules import deadlines, progress_events
 from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+import base64
 import json
+import os
+import threading
+import time
 
 
+class _InlineThread:
+    """Runs a background thread target synchronously on start()."""
+
+    def __init__(self, target, name=None, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+@patch("apis.modules.background_jobs.threading.Thread", _InlineThread)
 class TestProcessUploadView(APITestCase):
     """Unit tests for Process Upload endpoint"""
 
@@ -64,6 +89,7 @@ class TestProcessUploadView(APITestCase):
                 ],
             }
         )
+        mock_tts_instance.run_tts_only = AsyncMock(return_value=[])
         mock_tts_class.return_value = mock_tts_instance
 
         data = {
@@ -74,14 +100,22 @@ class TestProcessUploadView(APITestCase):
 
         response = self.client.post("/process/upload/", data, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn("session_id", response.data)
         self.assertIn("page_index", response.data)
-        self.assertEqual(response.data["status"], "ready")
+        self.assertEqual(response.data["status"], "queued")
+
+        # Background job (run inline) finished the page
+        page = Page.objects.get(session=self.test_session)
+        self.assertEqual(page.status, "ready")
+        self.assertEqual(page.progress, 100)
+        self.assertIsNotNone(page.processed_at)
+        self.assertEqual(page.getBBs().get().translated_text, "Test translation")
 
         # Verify session was updated
         self.test_session.refresh_from_db()
         self.assertEqual(self.test_session.totalPages, 1)
+        self.assertEqual(self.test_session.totalWords, 2)
 
     def test_02_upload_missing_session_id(self):
         """Test upload with missing session_id"""
@@ -133,10 +167,679 @@ class TestProcessUploadView(APITestCase):
 
         response = self.client.post("/process/upload/", data, format="json")
 
-        self.assertEqual(response.status_code, 422)
-        self.assertEqual(response.data["error_code"], 422)
+        # Accepted up front; the page is marked failed once OCR finds nothing
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        page = Page.objects.get(session=self.test_session)
+        self.assertEqual((page.status, page.page_index), ("failed", 0))
+        os.remove(page.img_url)
+
+        response = self.client.get(
+            f"/process/check_ocr/?session_id={self.test_session.id}&page_index=0"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "failed")
         self.assertEqual(response.data["message"], "PROCESS__UNABLE_TO_PROCESS_IMAGE")
 
+        self.test_session.refresh_from_db()
+        self.assertEqual(self.test_session.totalPages, 0)
+
+    def _mock_pipeline(self, mock_tts_class, mock_ocr_class):
+        mock_ocr_instance = MagicMock()
+        mock_ocr_instance.process_page.return_value = [
+            {"text": "Test paragraph", "bbox": {"x1": 0, "y1": 0, "x2": 100, "y2": 100}}
+        ]
+        mock_ocr_class.return_value = mock_ocr_instance
+
+        mock_tts_instance = MagicMock()
+        mock_tts_instance.get_translations_only = AsyncMock(
+            return_value={"status": "ok", "sentences": []}
+        )
+        mock_tts_instance.run_tts_only = AsyncMock(return_value=[])
+        mock_tts_class.return_value = mock_tts_instance
+        return mock_ocr_instance
+
+    def _assert_saved_image(self, mock_ocr_instance):
+        image_path = mock_ocr_instance.process_page.call_args[0][0]
+        with open(image_path, "rb") as f:
+            saved = f.read()
+        os.remove(image_path)
+        self.assertEqual(saved, base64.b64decode(self.test_image_base64))
+
+    @patch("apis.controller.process_controller.views.OCRModule")
+    @patch("apis.controller.process_controller.views.TTSModule")
+    def test_07_upload_multipart(self, mock_tts_class, mock_ocr_class):
+        """Test upload with multipart/form-data image file"""
+        mock_ocr_instance = self._mock_pipeline(mock_tts_class, mock_ocr_class)
+        image = SimpleUploadedFile(
+            "page.jpg", base64.b64decode(self.test_image_base64), "image/jpeg"
+        )
+        data = {"session_id": str(self.test_session.id), "lang": "en", "image": image}
+
+        response = self.client.post("/process/upload/", data, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self._assert_saved_image(mock_ocr_instance)
+
+    @patch("apis.controller.process_controller.views.OCRModule")
+    @patch("apis.controller.process_controller.views.TTSModule")
+    def test_08_upload_raw_binary(self, mock_tts_class, mock_ocr_class):
+        """Test upload with raw image body and query parameters"""
+        mock_ocr_instance = self._mock_pipeline(mock_tts_class, mock_ocr_class)
+        query = f"?session_id={self.test_session.id}&lang=en"
+
+        response = self.client.generic(
+            "POST",
+            "/process/upload/" + query,
+            base64.b64decode(self.test_image_base64),
+            content_type="image/jpeg",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self._assert_saved_image(mock_ocr_instance)
+
+    @patch("apis.controller.process_controller.views.OCRModule")
+    @patch("apis.controller.process_controller.views.TTSModule")
+    def test_09_upload_wrapped_base64(self, mock_tts_class, mock_ocr_class):
+        """Test line-wrapped base64 (Android Base64.DEFAULT) is decoded"""
+        mock_ocr_instance = self._mock_pipeline(mock_tts_class, mock_ocr_class)
+        wrapped = "\n".join(
+            self.test_image_base64[i : i + 76]
+            for i in range(0, len(self.test_image_base64), 76)
+        )
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": wrapped,
+        }
+
+        response = self.client.post("/process/upload/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self._assert_saved_image(mock_ocr_instance)
+
+    def test_10_upload_raw_binary_missing_lang(self):
+        """Test raw image upload without lang query parameter"""
+        response = self.client.generic(
+            "POST",
+            f"/process/upload/?session_id={self.test_session.id}",
+            base64.b64decode(self.test_image_base64),
+            content_type="image/jpeg",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(UPLOAD_DEADLINE_SECONDS=120, UPLOAD_TTS_RESERVE=45)
+    @patch("apis.controller.process_controller.views.background_jobs")
+    @patch("apis.controller.process_controller.views.OCRModule")
+    def test_11_upload_returns_before_processing(
+        self, mock_ocr_class, mock_background_jobs
+    ):
+        """Test upload responds once the image is stored, before OCR runs"""
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": self.test_image_base64,
+        }
+
+        response = self.client.post("/process/upload/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["page_index"], 0)
+        self.assertEqual(response.data["page_budget_seconds"], 75)
+        mock_background_jobs.start.assert_called_once()
+        mock_ocr_class.assert_not_called()
+
+        page = Page.objects.get(session=self.test_session)
+        self.assertEqual(page.status, "queued")
+        os.remove(page.img_url)
+
+        response = self.client.get(
+            f"/process/check_ocr/?session_id={self.test_session.id}&page_index=0"
+        )
+        self.assertEqual(response.data["status"], "queued")
+        self.assertEqual(response.data["progress"], 0)
+        self.assertIsNone(response.data["processed_at"])
+
+    @patch("apis.controller.process_controller.views.OCRModule")
+    @patch("apis.controller.process_controller.views.TTSModule")
+    def test_12_retake_takes_over_failed_index(self, mock_tts_class, mock_ocr_class):
+        """Test the upload retaking a failed page takes over its page index"""
+        mock_ocr_instance = self._mock_pipeline(mock_tts_class, mock_ocr_class)
+        mock_ocr_instance.process_page.side_effect = [
+            RuntimeError("OCR down"),
+            [{"text": "Test paragraph", "bbox": {}}],
+        ]
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": self.test_image_base64,
+        }
+
+        self.client.post("/process/upload/", data, format="json")
+        response = self.client.post("/process/upload/", data, format="json")
+
+        self.assertEqual(response.data["page_index"], 0)
+        page = Page.objects.get(session=self.test_session, page_index=0)
+        self.assertEqual(page.status, "ready")
+        failed = Page.objects.get(session=self.test_session, status="failed")
+        self.assertIsNone(failed.page_index)
+        os.remove(failed.img_url)
+        self._assert_saved_image(mock_ocr_instance)
+
+    def test_13_failed_page_does_not_shift_later_pages(self):
+        """Test pages uploaded after a failed one keep their page index"""
+        pages = [
+            Page.objects.create(
+                session=self.test_session, img_url="test.jpg", status="ocr"
+            )
+            for _ in range(3)
+        ]
+        # The middle page fails after the last one was uploaded
+        for page, page_status in zip(pages, ("ready", "failed", "translating")):
+            Page.objects.filter(pk=page.pk).update(status=page_status)
+
+        statuses = [
+            self.client.get(
+                "/process/check_ocr/",
+                {"session_id": str(self.test_session.id), "page_index": i},
+            ).data["status"]
+            for i in range(3)
+        ]
+
+        self.assertEqual(statuses, ["ready", "failed", "translating"])
+        self.assertEqual(self.test_session.nextPageIndex(), 3)
+
+    @patch("apis.modules.image_store.B64_CHUNK_CHARS", 8)
+    @patch("apis.controller.process_controller.views.background_jobs")
+    def test_14_upload_base64_checked_in_every_slice(self, mock_background_jobs):
+        """Test whitespace and invalid characters past the first slice"""
+        image = self.test_image_base64
+        data = {"session_id": str(self.test_session.id), "lang": "en"}
+
+        # Whitespace only after the first slice is still stripped
+        data["image_base64"] = image[:100] + "\n" + image[100:]
+        response = self.client.post("/process/upload/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        page = Page.objects.get(session=self.test_session)
+        with open(page.img_url, "rb") as f:
+            self.assertEqual(f.read(), base64.b64decode(image))
+        os.remove(page.img_url)
+
+        # A character outside the alphabet, or padding mid-payload, is rejected
+        for bad in (image[:100] + "*" + image[101:], image[:96] + "AA==" + image[100:]):
+            data["image_base64"] = bad
+            response = self.client.post("/process/upload/", data, format="json")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Page.objects.filter(session=self.test_session).count(), 1)
+        self.assertFalse(
+            [
+                name
+                for name in os.listdir("media/images")
+                if name.startswith(f"{self.test_session.id}_1_")
+            ]
+        )
+
+
+class TestPageCreationAndBackgroundTTS(APITestCase):
+    """Unit tests for bulk BB creation and background TTS writes"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.test_user = User.objects.create(
+            device_info="test-bulk-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.ocr_result = [
+            {"text": "Paragraph 1", "bbox": {"x1": 0}},
+            {"text": "Paragraph 2", "bbox": {"x1": 1}},
+            {"text": "Paragraph 3", "bbox": {"x1": 2}},
+        ]
+        self.translation_data = [
+            {"status": "ok", "sentences": [{"translation": "One"}]},
+            {"status": "failed", "sentences": []},
+            {"status": "ok", "sentences": [{"translation": "Three"}]},
+        ]
+
+    def test_01_create_page_and_bbs_bulk(self):
+        """Test BBs are bulk created in paragraph order with their ids"""
+        page, bb_ids = _create_page_and_bbs(
+            self.test_session, "test.jpg", self.ocr_result, self.translation_data
+        )
+
+        bbs = list(page.getBBs().order_by("id"))
+        self.assertEqual([bb.id for bb in bbs], bb_ids)
+        self.assertEqual([bb.translated_text for bb in bbs], ["One", "", "Three"])
+        self.assertEqual(bbs[2].coordinates, {"x1": 2})
+
+    @patch("apis.modules.background_jobs.threading.Thread", _InlineThread)
+    def test_02_background_tts_updates_by_id(self):
+        """Test background TTS writes audio and status to the right BBs"""
+        page, bb_ids = _create_page_and_bbs(
+            self.test_session, "test.jpg", self.ocr_result, self.translation_data
+        )
+        tts_module = MagicMock()
+        tts_module.run_tts_only = AsyncMock(side_effect=[["clip_1"], []])
+
+        _start_background_tts(
+            tts_module,
+            self.ocr_result,
+            self.translation_data,
+            bb_ids,
+            str(self.test_session.id),
+            0,
+            para_voice="shimmer",
+            page_id=page.id,
+        )
+
+        bbs = list(page.getBBs().order_by("id"))
+        self.assertEqual(bbs[0].audio_base64, ["clip_1"])
+        self.assertEqual(bbs[0].tts_status, "ready")
+        self.assertEqual(bbs[1].tts_status, "failed")
+        self.assertEqual(bbs[2].audio_base64, [])
+        self.assertEqual(bbs[2].tts_status, "failed")
+        self.assertEqual(tts_module.run_tts_only.await_count, 2)
+        self.assertEqual(
+            json.loads(PagePayload.objects.get(page=page).audio_results),
+            [{"bbox_index": 0, "audio_base64_list": ["clip_1"]}],
+        )
+
+    @patch("apis.controller.process_controller.views._set_page_status")
+    def test_03_translation_progress_per_paragraph(self, mock_set_status):
+        """Test page progress advances as each paragraph translation finishes"""
+
+        async def translate(page_data, deadline=None):
+            # Finish in paragraph order
+            await asyncio.sleep(0.01 * int(page_data["fileName"].split("_")[-1][0]))
+            return {"status": "ok", "sentences": []}
+
+        tts_module = MagicMock()
+        tts_module.get_translations_only = translate
+
+        results = _translate_paragraphs(
+            tts_module, self.ocr_result, "session", 0, page_id=42
+        )
+
+        self.assertEqual(len(results), 3)
+        progress = [c.kwargs["progress"] for c in mock_set_status.call_args_list]
+        self.assertEqual(len(progress), 2)
+        self.assertTrue(40 < progress[0] < progress[1] < 100)
+
+    def test_04_translation_pending_at_deadline(self):
+        """Test paragraphs still translating at the deadline come back pending"""
+
+        async def translate(page_data, deadline=None):
+            if page_data["text"] == "Paragraph 2":
+                await asyncio.sleep(5)
+            return {"status": "ok", "sentences": [{"translation": "done"}]}
+
+        tts_module = MagicMock()
+        tts_module.get_translations_only = translate
+
+        results = _translate_paragraphs(
+            tts_module, self.ocr_result, "session", 0, deadline=deadlines.Deadline(0.2)
+        )
+
+        self.assertEqual([r["status"] for r in results], ["ok", "pending", "ok"])
+
+    @patch("apis.modules.background_jobs.threading.Thread", _InlineThread)
+    def test_05_background_tts_translates_pending_paragraphs(self):
+        """Test background TTS translates pending paragraphs before synthesizing"""
+        translation_data = [
+            {"status": "ok", "sentences": [{"translation": "One"}]},
+            {"status": "pending", "sentences": []},
+            {"status": "failed", "sentences": []},
+        ]
+        page, bb_ids = _create_page_and_bbs(
+            self.test_session, "test.jpg", self.ocr_result, translation_data
+        )
+        # Stored as NULL until translated, so the page is not final yet
+        self.assertIsNone(BB.objects.get(pk=bb_ids[1]).translated_text)
+        tts_module = MagicMock()
+        tts_module.get_translations_only = AsyncMock(
+            return_value={"status": "ok", "sentences": [{"translation": "Two"}]}
+        )
+        tts_module.run_tts_only = AsyncMock(side_effect=[["clip_1"], ["clip_2"]])
+
+        _start_background_tts(
+            tts_module,
+            self.ocr_result,
+            translation_data,
+            bb_ids,
+            str(self.test_session.id),
+            0,
+            para_voice="shimmer",
+            page_id=page.id,
+            deadline=deadlines.Deadline(60),
+        )
+
+        bbs = list(page.getBBs().order_by("id"))
+        self.assertEqual(bbs[1].translated_text, "Two")
+        self.assertEqual(bbs[1].audio_base64, ["clip_2"])
+        self.assertEqual(bbs[2].tts_status, "failed")
+        tts_module.get_translations_only.assert_awaited_once()
+
+    @patch("apis.modules.background_jobs.threading.Thread", _InlineThread)
+    def test_06_background_tts_stops_at_deadline(self):
+        """Test paragraphs reached after the deadline are marked failed"""
+        page, bb_ids = _create_page_and_bbs(
+            self.test_session, "test.jpg", self.ocr_result, self.translation_data
+        )
+        tts_module = MagicMock()
+        tts_module.run_tts_only = AsyncMock()
+
+        _start_background_tts(
+            tts_module,
+            self.ocr_result,
+            self.translation_data,
+            bb_ids,
+            str(self.test_session.id),
+            0,
+            para_voice="shimmer",
+            page_id=page.id,
+            deadline=deadlines.Deadline(0),
+        )
+
+        statuses = [bb.tts_status for bb in page.getBBs().order_by("id")]
+        self.assertEqual(statuses, ["failed", "failed", "failed"])
+        tts_module.run_tts_only.assert_not_awaited()
+
+
+class TestAsyncProcessViews(APITestCase):
+    """Unit tests for the native async process endpoints"""
+
+    def setUp(self):
+        """Set up test client and test data"""
+        self.client = APIClient()
+        self.test_user = User.objects.create(
+            device_info="test-async-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.test_image_bytes = b"\xff\xd8\xff\xe0fake-jpeg\xff\xd9"
+        self.translation = {
+            "status": "ok",
+            "sentences": [{"translation": "Test translation"}],
+        }
+
+    @patch(
+        "apis.modules.background_jobs.start",
+        side_effect=lambda target, name=None: target(),
+    )
+    @patch("apis.controller.process_controller.views.TTSModule")
+    @patch("apis.controller.process_controller.views.OCRModule")
+    def test_01_async_upload_success(self, mock_ocr_class, mock_tts_class, _):
+        """Test async upload is accepted and processed like the sync upload"""
+        mock_ocr_class.return_value.process_page.return_value = [
+            {"text": "Para one", "bbox": {}},
+            {"text": "Para two", "bbox": {}},
+        ]
+        mock_tts_class.return_value.get_translations_only = AsyncMock(
+            return_value=self.translation
+        )
+        mock_tts_class.return_value.run_tts_only = AsyncMock(return_value=[])
+
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": base64.b64encode(self.test_image_bytes).decode(),
+        }
+        response = self.client.post("/process/async/upload/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        body = response.json()
+        self.assertEqual(body["page_index"], 0)
+        self.assertEqual(body["status"], "queued")
+
+        page = Page.objects.get(session=self.test_session)
+        os.remove(page.img_url)
+        self.assertEqual(page.status, "ready")
+        self.assertEqual(
+            [bb.translated_text for bb in page.getBBs().order_by("id")],
+            ["Test translation", "Test translation"],
+        )
+        # The upload deadline reaches translation, as in the sync view
+        for call in mock_tts_class.return_value.get_translations_only.await_args_list:
+            self.assertIsInstance(call.kwargs["deadline"], deadlines.Deadline)
+
+        self.test_session.refresh_from_db()
+        self.assertEqual(self.test_session.totalPages, 1)
+        self.assertEqual(self.test_session.totalWords, 4)
+
+    @patch("apis.controller.process_controller.views.background_jobs")
+    def test_02_async_upload_raw_binary(self, mock_background_jobs):
+        """Test async upload with a raw image body streams it to disk"""
+        response = self.client.post(
+            f"/process/async/upload/?session_id={self.test_session.id}&lang=en",
+            self.test_image_bytes,
+            content_type="image/jpeg",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_background_jobs.start.assert_called_once()
+        page = Page.objects.get(session=self.test_session)
+        self.assertEqual(page.status, "queued")
+        with open(page.img_url, "rb") as f:
+            self.assertEqual(f.read(), self.test_image_bytes)
+        os.remove(page.img_url)
+
+    @patch(
+        "apis.modules.background_jobs.start",
+        side_effect=lambda target, name=None: target(),
+    )
+    @patch("apis.controller.process_controller.views.OCRModule")
+    def test_03_async_upload_ocr_failure(self, mock_ocr_class, _):
+        """Test async upload marks the page failed when OCR finds no text"""
+        mock_ocr_class.return_value.process_page.return_value = []
+
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": base64.b64encode(self.test_image_bytes).decode(),
+        }
+        response = self.client.post("/process/async/upload/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        page = Page.objects.get(session=self.test_session)
+        self.assertEqual(page.status, "failed")
+        os.remove(page.img_url)
+
+    def test_04_async_upload_bad_requests(self):
+        """Test async upload validation errors"""
+        missing_lang = {
+            "session_id": str(self.test_session.id),
+            "image_base64": "aGVsbG8=",
+        }
+        response = self.client.post(
+            "/process/async/upload/", missing_lang, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        unknown_session = {
+            "session_id": "00000000-0000-0000-0000-000000000000",
+            "lang": "en",
+            "image_base64": "aGVsbG8=",
+        }
+        response = self.client.post(
+            "/process/async/upload/", unknown_session, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("apis.controller.process_controller.async_views.get_tts_module")
+    @patch("apis.controller.process_controller.async_views.OCRModule")
+    def test_05_async_upload_cover(self, mock_ocr_class, mock_get_tts):
+        """Test async cover upload sets the session title"""
+        mock_ocr_class.return_value.aprocess_cover_page = AsyncMock(return_value="제목")
+        mock_get_tts.return_value.translate_cover = AsyncMock(return_value="Title")
+
+        data = {
+            "session_id": str(self.test_session.id),
+            "lang": "en",
+            "image_base64": base64.b64encode(self.test_image_bytes).decode(),
+        }
+        response = self.client.post("/process/async/upload_cover/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["translated_title"], "Title")
+        self.test_session.refresh_from_db()
+        self.assertEqual(self.test_session.title, "제목")
+        self.assertEqual(self.test_session.totalPages, 1)
+
+    @patch("apis.controller.process_controller.async_views.get_word_picker")
+    def test_06_async_word_picker(self, mock_get_picker):
+        """Test async word picker skips the cover and awaits the picker"""
+        mock_get_picker.return_value.apick_words = AsyncMock(
+            return_value={"status": "ok", "items": [{"word": "w", "meaning_ko": "m"}]}
+        )
+        cover = Page.objects.create(session=self.test_session, img_url="c.jpg")
+        BB.objects.create(page=cover, original_text="c", translated_text="cover " * 30)
+        page = Page.objects.create(session=self.test_session, img_url="p.jpg")
+        BB.objects.create(page=page, original_text="p", translated_text="word " * 25)
+
+        response = self.client.post(
+            "/process/async/word_picker/",
+            {"session_id": str(self.test_session.id), "lang": "en"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], "ok")
+        picked_text = mock_get_picker.return_value.apick_words.await_args.args[0]
+        self.assertNotIn("cover", picked_text)
+
+    def test_07_async_word_picker_no_pages(self):
+        """Test async word picker on a session without pages"""
+        response = self.client.post(
+            "/process/async/word_picker/",
+            {"session_id": str(self.test_session.id)},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], "no_pages")
+
+
+class TestProgressStreamView(APITestCase):
+    """Unit tests for the SSE progress stream and its change notifications"""
+
+    def setUp(self):
+        """Set up a session with a cover and one page"""
+        self.test_user = User.objects.create(
+            device_info="test-stream-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        cover = Page.objects.create(session=self.test_session, img_url="cover.jpg")
+        BB.objects.create(page=cover, original_text="Title")
+        self.page = Page.objects.create(session=self.test_session, img_url="p.jpg")
+        self.bb = BB.objects.create(
+            page=self.page, original_text="Text", tts_status="processing"
+        )
+
+    async def _events(self, response):
+        """Yield (event, data) pairs from an SSE response"""
+        async for chunk in response.streaming_content:
+            chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if chunk.startswith(":"):
+                continue
+            lines = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+            yield lines["event"], json.loads(lines["data"])
+
+    async def test_01_stream_snapshot_and_done(self):
+        """Test stream starts with a snapshot and ends once audio is done"""
+        await BB.objects.filter(pk=self.bb.pk).aupdate(tts_status="ready")
+
+        response = await self.async_client.get(
+            "/process/stream/", {"session_id": str(self.test_session.id)}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = [e async for e in self._events(response)]
+        self.assertEqual([name for name, _ in events], ["snapshot", "done"])
+        pages = events[0][1]["pages"]
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(pages[1]["bbs"], ["ready"])
+
+    async def test_02_stream_bad_requests(self):
+        """Test stream validation errors"""
+        response = await self.async_client.get("/process/stream/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = await self.async_client.get(
+            "/process/stream/",
+            {"session_id": "00000000-0000-0000-0000-000000000000"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(PROGRESS_RECONCILE_SECONDS=30)
+    async def test_03_stream_pushes_bb_ready_on_publish(self):
+        """Test a published change is pushed without waiting for reconcile"""
+        response = await self.async_client.get(
+            "/process/stream/", {"session_id": str(self.test_session.id)}
+        )
+        events = self._events(response)
+
+        name, data = await anext(events)
+        self.assertEqual(name, "snapshot")
+        self.assertEqual(data["pages"][1]["bbs"], ["processing"])
+
+        async def finish_tts():
+            await asyncio.sleep(0.05)
+            await BB.objects.filter(pk=self.bb.pk).aupdate(tts_status="ready")
+            progress_events.publish(self.test_session.id)
+
+        started = time.monotonic()
+        task = asyncio.create_task(finish_tts())
+        name, data = await asyncio.wait_for(anext(events), timeout=5)
+        await task
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(name, "bb")
+        self.assertEqual(
+            data, {"page_index": 1, "bbox_index": 0, "tts_status": "ready"}
+        )
+        name, _ = await anext(events)
+        self.assertEqual(name, "done")
+
+    def test_04_wait_for_change_wakes_sync_waiters(self):
+        """Test publish from another thread wakes a blocking waiter"""
+        session_id = str(self.test_session.id)
+        since = progress_events.version(session_id)
+
+        timer = threading.Timer(0.05, progress_events.publish, args=(session_id,))
+        timer.start()
+        started = time.monotonic()
+        new_version = progress_events.wait_for_change(session_id, since, timeout=5)
+        timer.join()
+
+        self.assertEqual(new_version, since + 1)
+        self.assertLess(time.monotonic() - started, 5)
+        # Nothing new: returns the same version after the timeout
+        self.assertEqual(
+            progress_events.wait_for_change(session_id, new_version, timeout=0.01),
+            new_version,
+        )
+
+    def test_05_stream_needs_asgi(self):
+        """Test the stream answers 501 under WSGI instead of buffering"""
+        response = self.client.get(
+            "/process/stream/", {"session_id": str(self.test_session.id)}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+
 
 class TestCheckOCRStatusView(APITestCase):
     """Unit tests for Check OCR Status endpoint"""
@@ -206,6 +909,29 @@ class TestCheckOCRStatusView(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_06_check_ocr_reports_stage(self):
+        """Test OCR status reflects the persisted processing stage"""
+        self.test_page.status = "translating"
+        self.test_page.progress = 55
+        self.test_page.save()
+
+        response = self.client.get(
+            "/process/check_ocr/",
+            {"session_id": str(self.test_session.id), "page_index": 0},
+        )
+
+        self.assertEqual(response.data["status"], "translating")
+        self.assertEqual(response.data["progress"], 55)
+        self.assertIsNone(response.data["processed_at"])
+
+        # check_tts does not report "ready" before the BBs exist
+        response = self.client.get(
+            "/process/check_tts/",
+            {"session_id": str(self.test_session.id), "page_index": 0},
+        )
+        self.assertEqual(response.data["status"], "processing")
+        self.assertEqual(response.data["progress"], 0)
+
 
 class TestCheckTTSStatusView(APITestCase):
     """Unit tests for Check TTS Status endpoint"""
@@ -339,3 +1065,117 @@ class TestCheckTTSStatusView(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def _add_processing_bbs(self):
+        BB.objects.create(
+            page=self.test_page, original_text="One", audio_base64=["clip"]
+        )
+        BB.objects.create(
+            page=self.test_page, original_text="Two", tts_status="processing"
+        )
+
+    def test_09_long_poll_returns_when_progress_differs(self):
+        """Test long-poll answers at once when the client is behind"""
+        self._add_processing_bbs()
+
+        started = time.monotonic()
+        response = self.client.get(
+            "/process/check_tts/",
+            {
+                "session_id": str(self.test_session.id),
+                "page_index": 0,
+                "wait": 10,
+                "since_progress": 0,
+            },
+        )
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(response.data["status"], "processing")
+        self.assertEqual(response.data["progress"], 50)
+
+    @override_settings(PROGRESS_RECONCILE_SECONDS=30)
+    def test_10_long_poll_released_by_notification(self):
+        """Test a published change releases a waiting long-poll"""
+        self._add_processing_bbs()
+
+        def finish_tts():
+            # Only notify: the second status read below sees the change
+            progress_events.publish(self.test_session.id)
+
+        statuses = [
+            {"status": "processing", "progress": 50},
+            {"status": "ready", "progress": 100},
+        ]
+        timer = threading.Timer(0.1, finish_tts)
+        with patch(
+            "apis.controller.process_controller.views.CheckTTSStatusView._tts_status",
+            side_effect=statuses,
+        ) as mock_status:
+            timer.start()
+            started = time.monotonic()
+            response = self.client.get(
+                "/process/check_tts/",
+                {
+                    "session_id": str(self.test_session.id),
+                    "page_index": 0,
+                    "wait": 20,
+                    "since_progress": 50,
+                },
+            )
+            timer.join()
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(mock_status.call_count, 2)
+        self.assertEqual(response.data["progress"], 100)
+
+    def test_11_long_poll_times_out_unchanged(self):
+        """Test long-poll returns the unchanged status when wait expires"""
+        self._add_processing_bbs()
+
+        started = time.monotonic()
+        response = self.client.get(
+            "/process/check_tts/",
+            {
+                "session_id": str(self.test_session.id),
+                "page_index": 0,
+                "wait": 0.2,
+                "since_progress": 50,
+            },
+        )
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["progress"], 50)
+
+    def test_12_long_poll_invalid_params(self):
+        """Test non-numeric or non-finite wait / since_progress are rejected"""
+        for wait in ("soon", "abc", "nan", "inf"):
+            response = self.client.get(
+                "/process/check_tts/",
+                {
+                    "session_id": str(self.test_session.id),
+                    "page_index": 0,
+                    "wait": wait,
+                },
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, wait)
+
+    def test_13_long_poll_negative_wait_answers_at_once(self):
+        """Test a negative wait is clamped to no wait"""
+        self._add_processing_bbs()
+
+        started = time.monotonic()
+        response = self.client.get(
+            "/process/check_tts/",
+            {
+                "session_id": str(self.test_session.id),
+                "page_index": 0,
+                "wait": -1,
+                "since_progress": 50,
+            },
+        )
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["progress"], 50)
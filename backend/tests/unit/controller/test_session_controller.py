@@ -3,6 +3,8 @@ from rest_framework import status
 from django.urls import reverse
 from apis.models.user_model import User
 from apis.models.session_model import Session
+from apis.models.page_model import Page
+from apis.models.bb_model import BB
 from django.utils import timezone
 
 
@@ -242,3 +244,150 @@ class TestGetSessionStatsView(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestSessionSyncView(APITestCase):
+    """Unit tests for Session Sync endpoint"""
+
+    def setUp(self):
+        """Set up a session with two ready pages and one in progress"""
+        from django.core.cache import caches
+
+        caches["responses"].clear()
+        self.client = APIClient()
+        self.test_user = User.objects.create(
+            device_info="test-sync-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Sync Session", created_at=timezone.now()
+        )
+        self.pages = [
+            Page.objects.create(session=self.test_session, img_url=f"p{i}.jpg")
+            for i in range(2)
+        ]
+        self.bbs = [
+            BB.objects.create(
+                page=page,
+                original_text="Text",
+                translated_text="Translated",
+                audio_base64=["clip"],
+                coordinates={},
+                tts_status="ready",
+            )
+            for page in self.pages
+        ]
+        Page.objects.create(
+            session=self.test_session, img_url="p2.jpg", status="translating"
+        )
+
+    def _sync(self, since=None):
+        params = {"session_id": str(self.test_session.id)}
+        if since:
+            params["since"] = since
+        return self.client.get("/session/sync", params)
+
+    def test_01_full_manifest(self):
+        """Test first sync returns every page with content hashes"""
+        response = self._sync()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertTrue(data["full"])
+        self.assertEqual(data["total_pages"], 3)
+        self.assertEqual([p["page_index"] for p in data["pages"]], [0, 1, 2])
+        self.assertEqual(len(data["pages"][0]["ocr_hash"]), 16)
+        self.assertEqual(len(data["pages"][0]["audio_hash"]), 16)
+        self.assertEqual(data["pages"][2]["status"], "translating")
+        self.assertIsNone(data["pages"][2]["ocr_hash"])
+
+    def test_02_unchanged_since_token(self):
+        """Test syncing with the current token returns no pages"""
+        token = self._sync().json()["sync_token"]
+
+        response = self._sync(since=token)
+
+        data = response.json()
+        self.assertFalse(data["full"])
+        self.assertEqual(data["pages"], [])
+        self.assertEqual(data["sync_token"], token)
+        self.assertLess(len(response.content), 200)
+
+    def test_03_only_changed_pages(self):
+        """Test a changed page is the only one in the delta"""
+        first = self._sync().json()
+        self.bbs[1].translated_text = "Retranslated"
+        self.bbs[1].save()
+
+        data = self._sync(since=first["sync_token"]).json()
+
+        self.assertFalse(data["full"])
+        self.assertEqual([p["page_index"] for p in data["pages"]], [1])
+        self.assertEqual(data["pages"][0]["version"], 2)
+        self.assertNotEqual(data["pages"][0]["ocr_hash"], first["pages"][1]["ocr_hash"])
+        self.assertNotEqual(data["sync_token"], first["sync_token"])
+
+    def test_04_new_page_in_delta(self):
+        """Test pages added after the last sync are reported"""
+        token = self._sync().json()["sync_token"]
+        Page.objects.create(session=self.test_session, img_url="p3.jpg")
+
+        data = self._sync(since=token).json()
+
+        self.assertEqual([p["page_index"] for p in data["pages"]], [3])
+        self.assertEqual(data["total_pages"], 4)
+
+    def test_05_unknown_token_full_manifest(self):
+        """Test an unknown or malformed token falls back to a full sync"""
+        self.assertTrue(self._sync(since="0123456789abcdef").json()["full"])
+        self.assertTrue(self._sync(since="not a token").json()["full"])
+
+    def test_06_sync_is_read_only(self):
+        """Test sync does not touch the session's started_at"""
+        started_at = self.test_session.started_at
+
+        self._sync()
+
+        self.test_session.refresh_from_db()
+        self.assertEqual(self.test_session.started_at, started_at)
+
+    def test_07_sync_errors(self):
+        """Test missing and unknown session ids"""
+        self.assertEqual(
+            self.client.get("/session/sync").status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get("/session/sync", {"session_id": "bad-id"}).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(
+            self.client.get(
+                "/session/sync",
+                {"session_id": "00000000-0000-0000-0000-000000000000"},
+            ).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_08_image_url_is_endpoint(self):
+        """Test image_url points at page/get_image, not a server path"""
+        page = self._sync().json()["pages"][1]
+
+        self.assertEqual(
+            page["image_url"],
+            f"/page/get_image/?session_id={self.test_session.id}&page_index=1",
+        )
+
+    def test_09_resume_restarts_clock(self):
+        """Test resume=true touches started_at like reload_all"""
+        started_at = self.test_session.started_at
+
+        response = self.client.get(
+            "/session/sync",
+            {"session_id": str(self.test_session.id), "resume": "true"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.test_session.refresh_from_db()
+        self.assertGreater(self.test_session.started_at, started_at)
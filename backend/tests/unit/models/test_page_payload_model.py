@@ -0,0 +1,111 @@
+from django.test import TestCase
+from django.utils import timezone
+from apis.models.user_model import User
+from apis.models.session_model import Session
+from apis.models.page_model import Page
+from apis.models.bb_model import BB
+from apis.models.page_payload_model import PagePayload
+from apis.modules import page_payloads
+
+
+class TestPagePayloadModel(TestCase):
+    """Unit tests for materialized page payloads"""
+
+    def setUp(self):
+        """Set up a ready page with two BBs"""
+        self.test_user = User.objects.create(
+            device_info="test-payload-device",
+            language_preference="en",
+            created_at=timezone.now(),
+        )
+        self.test_session = Session.objects.create(
+            user=self.test_user, title="Test Session", created_at=timezone.now()
+        )
+        self.page = Page.objects.create(session=self.test_session, img_url="a.jpg")
+        self.bbs = [
+            BB.objects.create(
+                page=self.page,
+                original_text=f"Text {i}",
+                translated_text=f"Translated {i}",
+                audio_base64=[f"clip_{i}"] if i == 0 else [],
+                coordinates={"x1": i},
+                tts_status="ready",
+            )
+            for i in range(2)
+        ]
+
+    def test_01_ocr_materialized_on_first_read(self):
+        """Test a ready page's OCR results are stored on first read"""
+        results = page_payloads.ocr_results(self.page)
+
+        self.assertEqual(results[1]["translation_txt"], "Translated 1")
+        payload = PagePayload.objects.get(page=self.page)
+        self.assertIsNotNone(payload.ocr_results)
+        self.assertEqual(len(payload.ocr_hash), 16)
+
+    def test_02_reads_come_from_payload(self):
+        """Test later reads use the payload instead of the BBs"""
+        page_payloads.ocr_results(self.page)
+        BB.objects.filter(pk=self.bbs[0].pk).update(translated_text="Not seen")
+
+        results = page_payloads.ocr_results(self.page)
+
+        self.assertEqual(results[0]["translation_txt"], "Translated 0")
+
+    def test_03_bb_save_invalidates(self):
+        """Test saving a BB drops the page's payload"""
+        page_payloads.ocr_results(self.page)
+        self.bbs[0].translated_text = "Changed"
+        self.bbs[0].save()
+
+        payload = PagePayload.objects.get(page=self.page)
+        self.assertIsNone(payload.ocr_results)
+        self.assertIsNone(payload.ocr_hash)
+        self.assertEqual(payload.version, 2)
+        self.assertEqual(
+            page_payloads.ocr_results(self.page)[0]["translation_txt"], "Changed"
+        )
+
+    def test_04_audio_not_materialized_while_tts_runs(self):
+        """Test audio payload waits until every BB's TTS is final"""
+        BB.objects.filter(pk=self.bbs[1].pk).update(tts_status="processing")
+
+        results, is_final = page_payloads.audio_results(self.page)
+
+        self.assertFalse(is_final)
+        self.assertEqual(results, [{"bbox_index": 0, "audio_base64_list": ["clip_0"]}])
+        self.assertFalse(PagePayload.objects.filter(page=self.page).exists())
+
+    def test_05_audio_materialized_when_final(self):
+        """Test audio payload is stored once TTS is final"""
+        results, is_final = page_payloads.audio_results(self.page)
+
+        self.assertTrue(is_final)
+        self.assertEqual(results, [{"bbox_index": 0, "audio_base64_list": ["clip_0"]}])
+        self.assertIsNotNone(PagePayload.objects.get(page=self.page).audio_results)
+
+    def test_06_unfinished_page_not_materialized(self):
+        """Test pages still processing are built from BBs without storing"""
+        Page.objects.filter(pk=self.page.pk).update(status="translating")
+        self.page.refresh_from_db()
+
+        page_payloads.ocr_results(self.page)
+
+        self.assertFalse(PagePayload.objects.filter(page=self.page).exists())
+
+    def test_07_session_ocr_results(self):
+        """Test OCR results of several pages in one call"""
+        other = Page.objects.create(session=self.test_session, img_url="b.jpg")
+        page_payloads.materialize_ocr(self.page)
+
+        results = page_payloads.session_ocr_results([self.page, other])
+
+        self.assertEqual(len(results[self.page.id]), 2)
+        self.assertEqual(results[other.id], [])
+
+    def test_08_cascade_delete(self):
+        """Test payload is deleted with its page"""
+        page_payloads.materialize_ocr(self.page)
+        self.page.delete()
+
+        self.assertEqual(PagePayload.objects.count(), 0)
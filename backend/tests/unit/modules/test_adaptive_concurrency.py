@@ -0,0 +1,205 @@
+import asyncio
+import threading
+
+import httpx
+import openai
+from django.test import SimpleTestCase, override_settings
+from apis.modules import adaptive_concurrency, hedging
+
+
+def rate_limited():
+    request = httpx.Request("POST", "https://api.openai.com/v1/audio/speech")
+    response = httpx.Response(429, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+@override_settings(
+    AIMD_INITIAL_LIMIT=2,
+    AIMD_MIN_LIMIT=1,
+    AIMD_MAX_LIMIT=64,
+    AIMD_DECREASE_FACTOR=0.5,
+    AIMD_LATENCY_SPIKE_FACTOR=3,
+    AIMD_DECREASE_COOLDOWN=60,
+)
+class TestAdaptiveConcurrency(SimpleTestCase):
+    """Unit tests for the AIMD concurrency limiter"""
+
+    def setUp(self):
+        adaptive_concurrency.reset()
+        hedging.reset_stats()
+        self.running = 0
+        self.peak = 0
+
+    def tearDown(self):
+        adaptive_concurrency.reset()
+        hedging.reset_stats()
+
+    async def request(self, seconds=0.02, error=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(seconds)
+            if error is not None:
+                raise error
+            return "ok"
+        finally:
+            self.running -= 1
+
+    def run_many(self, count, name="tts", **kwargs):
+        async def run():
+            return await asyncio.gather(
+                *[
+                    adaptive_concurrency.call(name, lambda: self.request(**kwargs))
+                    for _ in range(count)
+                ],
+                return_exceptions=True,
+            )
+
+        return asyncio.run(run())
+
+    def test_01_limit_caps_requests_in_flight(self):
+        """Test no more than `limit` requests run at once"""
+        results = self.run_many(6)
+
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertEqual(results, ["ok"] * 6)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(stats["waited"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_02_additive_increase(self):
+        """Test healthy responses on a full window raise the limit additively"""
+        self.run_many(20)
+
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertGreater(stats["limit"], 2)
+        self.assertLess(stats["limit"], 2 + 20 / 2)
+        self.assertGreater(stats["increases"], 0)
+
+    def test_03_throttling_halves_the_limit_once_per_burst(self):
+        """Test a burst of 429s cuts the limit multiplicatively, once"""
+        slots = adaptive_concurrency.limiter("tts")
+        slots.limit = 16.0
+
+        results = self.run_many(4, error=rate_limited())
+
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertTrue(all(isinstance(r, openai.RateLimitError) for r in results))
+        self.assertEqual(stats["limit"], 8)
+        self.assertEqual(stats["throttled"], 4)
+        self.assertEqual(stats["decreases"], 1)
+
+    def test_04_latency_spike_decreases_the_limit(self):
+        """Test a response far slower than the p50 counts as congestion"""
+        slots = adaptive_concurrency.limiter("translate")
+        slots.limit = 10.0
+        for _ in range(20):
+            slots.latency.add(0.01)
+
+        self.run_many(1, name="translate", seconds=0.1)
+
+        stats = adaptive_concurrency.stats()["translate"]
+        self.assertEqual(stats["latency_spikes"], 1)
+        self.assertEqual(stats["limit"], 5)
+        # Operations are tracked separately
+        self.assertNotIn("tts", adaptive_concurrency.stats())
+
+    @override_settings(AIMD_INITIAL_LIMIT=1, AIMD_MAX_LIMIT=1)
+    def test_05_slots_are_shared_across_threads(self):
+        """Test a waiter on another thread's event loop is woken"""
+        threads = [threading.Thread(target=self.run_many, args=(2,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertEqual(self.peak, 1)
+        self.assertEqual(stats["calls"], 6)
+        self.assertEqual(stats["in_flight"], 0)
+
+    @override_settings(AIMD_INITIAL_LIMIT=1)
+    def test_06_cancelled_waiter_frees_its_place(self):
+        """Test cancelling a waiting request leaks no slot"""
+
+        async def run():
+            holder = asyncio.ensure_future(
+                adaptive_concurrency.call("tts", lambda: self.request(0.05))
+            )
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(
+                adaptive_concurrency.call("tts", lambda: self.request(0.01))
+            )
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.gather(holder, waiter, return_exceptions=True)
+            return await adaptive_concurrency.call("tts", lambda: self.request(0.01))
+
+        self.assertEqual(asyncio.run(run()), "ok")
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["waiting"], 0)
+
+    def hedged(self, *seconds):
+        """hedged_call()s starting together, the n-th request sleeping seconds[n]"""
+        window = hedging._operation("hedged")["attempt_latency"]
+        for _ in range(20):
+            window.add(0.02)
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    adaptive_concurrency.hedged_call(
+                        "tts", "hedged", lambda s=s: self.request(s)
+                    )
+                    for s in seconds
+                ]
+            )
+
+        return asyncio.run(run())
+
+    @override_settings(
+        AIMD_INITIAL_LIMIT=1,
+        AIMD_MAX_LIMIT=1,
+        HEDGING_ENABLED=True,
+        HEDGE_MIN_DELAY=0.01,
+        HEDGE_MAX_RATE=1.0,
+    )
+    def test_07_queueing_does_not_fire_hedges(self):
+        """Test the hedge timer starts once the slot is held"""
+        # The last call waits 0.03s for its slot, past the 0.02s hedge delay
+        self.assertEqual(self.hedged(0.015, 0.015, 0.015), ["ok"] * 3)
+
+        stats = hedging.stats()["hedged"]
+        self.assertEqual(stats["hedged"], 0)
+        self.assertEqual(stats["not_admitted"], 0)
+        self.assertLess(
+            hedging._operation("hedged")["attempt_latency"].percentile(100), 0.025
+        )
+        self.assertEqual(adaptive_concurrency.stats()["tts"]["waited"], 2)
+
+    @override_settings(
+        AIMD_INITIAL_LIMIT=1,
+        AIMD_MAX_LIMIT=1,
+        HEDGING_ENABLED=True,
+        HEDGE_MIN_DELAY=0.01,
+        HEDGE_MAX_RATE=1.0,
+    )
+    def test_08_saturated_limiter_gets_no_hedge(self):
+        """Test a slow call is not hedged while no slot is free"""
+        self.assertEqual(self.hedged(0.05), ["ok"])
+
+        self.assertEqual(self.peak, 1)
+        self.assertEqual(hedging.stats()["hedged"]["not_admitted"], 1)
+        self.assertEqual(adaptive_concurrency.stats()["tts"]["in_flight"], 0)
+
+    @override_settings(HEDGING_ENABLED=True, HEDGE_MIN_DELAY=0.01, HEDGE_MAX_RATE=1.0)
+    def test_09_hedge_takes_its_own_slot(self):
+        """Test a hedge runs in a free slot and every slot is given back"""
+        self.assertEqual(self.hedged(0.05), ["ok"])
+
+        stats = adaptive_concurrency.stats()["tts"]
+        self.assertEqual(hedging.stats()["hedged"]["hedged"], 1)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["in_flight"], 0)
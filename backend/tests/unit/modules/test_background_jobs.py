@@ -0,0 +1,38 @@
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from apis.modules import background_jobs
+
+
+class TestBackgroundJobs(SimpleTestCase):
+    """Unit tests for tracked background jobs"""
+
+    @patch("apis.modules.background_jobs.connections")
+    def test_01_job_closes_its_connections(self, mock_connections):
+        """Test a finished job closes the DB connections of its thread"""
+        done = threading.Event()
+
+        thread = background_jobs.start(done.set, name="test-job")
+        thread.join(timeout=5)
+
+        self.assertTrue(done.is_set())
+        mock_connections.close_all.assert_called_once()
+        self.assertTrue(background_jobs.wait_for_drain(1))
+
+    @patch("apis.modules.background_jobs.connections")
+    def test_02_job_run_inline_keeps_caller_connections(self, mock_connections):
+        """Test a job run on the caller's thread leaves its connections open"""
+
+        class InlineThread:
+            def __init__(self, target, name=None, daemon=None):
+                self.target = target
+
+            def start(self):
+                self.target()
+
+        with patch("apis.modules.background_jobs.threading.Thread", InlineThread):
+            background_jobs.start(lambda: None)
+
+        mock_connections.close_all.assert_not_called()
+        self.assertEqual(background_jobs.in_flight(), 0)
@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import openai
+from django.test import SimpleTestCase, override_settings
+from apis.modules import deadlines, hedging, retry_policy
+from apis.modules.ocr_processor import OCRModule
+
+
+def server_error():
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(503, request=request)
+    return openai.InternalServerError("server error", response=response, body=None)
+
+
+class TestDeadlines(SimpleTestCase):
+    """Unit tests for upload deadlines and the stages they bound"""
+
+    def setUp(self):
+        retry_policy.reset()
+        hedging.reset_stats()
+
+    def tearDown(self):
+        retry_policy.reset()
+        hedging.reset_stats()
+
+    @override_settings(UPLOAD_DEADLINE_SECONDS=120, UPLOAD_TTS_RESERVE=45)
+    def test_01_page_budget_reserves_time_for_tts(self):
+        """Test the page budget ends UPLOAD_TTS_RESERVE before the deadline"""
+        deadline = deadlines.for_upload()
+        page_deadline = deadline.page_budget()
+
+        self.assertAlmostEqual(
+            deadline.remaining() - page_deadline.remaining(), 45, delta=0.1
+        )
+        self.assertEqual(page_deadline.timeout(5), 5)
+        self.assertFalse(page_deadline.expired())
+
+        expired = deadlines.Deadline(0)
+        self.assertTrue(expired.expired())
+        with self.assertRaises(deadlines.DeadlineExceeded):
+            expired.check("ocr")
+
+    def test_02_bounded_stops_at_deadline(self):
+        """Test provider calls are cut off at the current deadline"""
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        async def run():
+            with deadlines.use(deadlines.Deadline(0.05)):
+                await deadlines.bounded(slow())
+
+        with self.assertRaises(deadlines.DeadlineExceeded):
+            asyncio.run(run())
+
+    @patch("apis.modules.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    @override_settings(RETRY_BASE_DELAY=4, RETRY_MAX_DELAY=8)
+    def test_03_no_retry_past_deadline(self, mock_sleep):
+        """Test a retry is given up when its backoff would pass the deadline"""
+        attempt = AsyncMock(side_effect=server_error())
+
+        async def run():
+            with deadlines.use(deadlines.Deadline(1)), patch(
+                "apis.modules.retry_policy.backoff", return_value=3
+            ):
+                await retry_policy.acall("model", attempt)
+
+        with self.assertRaises(openai.InternalServerError):
+            asyncio.run(run())
+
+        self.assertEqual(attempt.await_count, 1)
+        mock_sleep.assert_not_awaited()
+
+    @override_settings(HEDGING_ENABLED=True, HEDGE_MIN_DELAY=0.01, HEDGE_MAX_RATE=1)
+    def test_04_no_hedge_that_cannot_finish(self):
+        """Test a hedge is skipped when less than a typical attempt is left"""
+        window = hedging._operation("op")["attempt_latency"]
+        for _ in range(20):
+            window.add(0.5)
+        window.add(0.01)
+
+        async def attempt():
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        async def run():
+            with deadlines.use(deadlines.Deadline(0.2)):
+                return await hedging.call("op", attempt)
+
+        with patch.object(hedging, "hedge_delay", return_value=0.01):
+            self.assertEqual(asyncio.run(run()), "primary")
+
+        stats = hedging.stats()["op"]
+        self.assertEqual(stats["hedged"], 0)
+        self.assertEqual(stats["deadline_skipped"], 1)
+
+    @override_settings(OCR_CONNECT_TIMEOUT=5, OCR_READ_TIMEOUT=60)
+    def test_05_ocr_timeout_follows_deadline(self):
+        """Test the OCR request timeout is shortened to the time left"""
+        ocr = OCRModule()
+
+        self.assertEqual(ocr._timeout(None), (5, 60))
+        connect, read = ocr._timeout(deadlines.Deadline(10))
+        self.assertEqual(connect, 5)
+        self.assertLessEqual(read, 10)
+        with self.assertRaises(deadlines.DeadlineExceeded):
+            ocr._timeout(deadlines.Deadline(0))
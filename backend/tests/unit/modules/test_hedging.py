@@ -0,0 +1,123 @@
+import asyncio
+
+from django.test import SimpleTestCase, override_settings
+from apis.modules import hedging
+
+
+@override_settings(
+    HEDGING_ENABLED=True, HEDGE_MIN_DELAY=0.01, HEDGE_MAX_RATE=0.5, HEDGE_PERCENTILE=95
+)
+class TestHedging(SimpleTestCase):
+    """Unit tests for hedged provider calls"""
+
+    def setUp(self):
+        hedging.reset_stats()
+        self.started = []
+
+    def tearDown(self):
+        hedging.reset_stats()
+
+    def warm(self, operation="op", seconds=0.01, samples=20):
+        window = hedging._operation(operation)["attempt_latency"]
+        for _ in range(samples):
+            window.add(seconds)
+
+    def attempt(self, *outcomes):
+        """Attempt factory: the n-th attempt sleeps, then returns or raises"""
+        outcomes = list(outcomes)
+
+        async def run():
+            index = len(self.started)
+            self.started.append(index)
+            seconds, result = outcomes[index]
+            await asyncio.sleep(seconds)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return run
+
+    def call(self, attempt, operation="op"):
+        return asyncio.run(hedging.call(operation, attempt))
+
+    def test_01_no_hedge_without_latency_history(self):
+        """Test calls are not hedged until the operation's p95 is known"""
+        result = self.call(self.attempt((0.05, "primary")))
+
+        self.assertEqual(result, "primary")
+        self.assertEqual(self.started, [0])
+        self.assertIsNone(hedging.hedge_delay("op"))
+
+    def test_02_slow_call_is_hedged(self):
+        """Test a call slower than p95 is duplicated and the first success wins"""
+        self.warm()
+
+        result = self.call(self.attempt((1.0, "primary"), (0.01, "hedge")))
+
+        stats = hedging.stats()["op"]
+        self.assertEqual(result, "hedge")
+        self.assertEqual(stats["hedged"], 1)
+        self.assertEqual(stats["hedge_wins"], 1)
+        self.assertEqual(stats["cancelled"], 1)
+        self.assertLess(stats["call_latency"]["p99"], 0.5)
+
+    def test_03_fast_call_is_not_hedged(self):
+        """Test a call finishing within p95 runs once"""
+        self.warm(seconds=0.2)
+
+        self.assertEqual(self.call(self.attempt((0.01, "primary"))), "primary")
+        self.assertEqual(self.started, [0])
+
+    def test_04_failures(self):
+        """Test a failed attempt leaves the other running; both failing raises"""
+        self.warm()
+        result = self.call(
+            self.attempt((0.05, RuntimeError("primary")), (0.1, "hedge"))
+        )
+        self.assertEqual(result, "hedge")
+
+        self.started = []
+        with self.assertRaisesMessage(RuntimeError, "hedge"):
+            self.call(
+                self.attempt(
+                    (0.05, RuntimeError("primary")), (0.1, RuntimeError("hedge"))
+                )
+            )
+        self.assertEqual(hedging.stats()["op"]["failures"], 1)
+
+    @override_settings(HEDGE_MAX_RATE=0.2, HEDGE_RATE_WINDOW=10)
+    def test_05_hedge_rate_is_capped(self):
+        """Test at most HEDGE_MAX_RATE of recent calls are hedged"""
+        self.warm(samples=200)
+        for _ in range(10):
+            self.started = []
+            self.call(self.attempt((0.03, "primary"), (0.0, "hedge")))
+
+        stats = hedging.stats()["op"]
+        self.assertEqual(stats["hedged"], 2)
+        self.assertEqual(stats["rate_limited"], 8)
+        self.assertEqual(stats["hedge_rate"], 0.2)
+
+    @override_settings(HEDGING_ENABLED=False)
+    def test_06_disabled(self):
+        """Test HEDGING_ENABLED=False runs a single attempt"""
+        self.warm()
+
+        self.assertEqual(self.call(self.attempt((0.05, "primary"))), "primary")
+        self.assertEqual(self.started, [0])
+
+    def test_07_cancelled_primary_is_a_latency_sample(self):
+        """Test a losing primary is a latency sample, a losing hedge is not"""
+        self.warm()
+
+        self.call(self.attempt((1.0, "primary"), (0.01, "hedge")))
+
+        window = hedging._operation("op")["attempt_latency"]
+        self.assertEqual(len(window), 22)
+        self.assertGreaterEqual(window.percentile(100), 0.02)
+
+        self.started = []
+        self.call(self.attempt((0.05, "primary"), (1.0, "hedge")))
+
+        self.assertEqual(len(window), 23)
+        self.assertEqual(hedging.stats()["op"]["cancelled"], 2)
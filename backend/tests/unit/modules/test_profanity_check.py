@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+from apis.modules import profanity_check
+from apis.modules.profanity_check import ProfanityMatcher
+
+
+class TestProfanityMatcher(SimpleTestCase):
+    """Unit tests for the Aho-Corasick profanity matcher"""
+
+    def setUp(self):
+        """Use a small word list for English"""
+        self.saved = profanity_check.PROFANITY_DICT.get("en")
+        profanity_check.PROFANITY_DICT["en"] = ["darn", "heck", "he", "darn it"]
+
+    def tearDown(self):
+        """Restore the loaded list"""
+        profanity_check.PROFANITY_DICT["en"] = self.saved
+
+    def test_01_clean_text(self):
+        """Test text without listed words is clean"""
+        self.assertEqual(profanity_check.is_clean("A fox ran home.", "en"), (True, []))
+
+    def test_02_found_words_in_list_order(self):
+        """Test found words include substrings and follow list order"""
+        clean, found = profanity_check.is_clean("Oh HECK, darn!", "en")
+
+        self.assertFalse(clean)
+        self.assertEqual(found, ["darn", "heck", "he"])
+
+    def test_03_remove_word_bounded_only(self):
+        """Test removal keeps substrings inside other words"""
+        cleaned = profanity_check.remove_profanity("Darn  the heckler, heck.", "en")
+
+        self.assertEqual(cleaned, "the heckler, .")
+
+    def test_04_overlapping_matches(self):
+        """Test overlapping matches remove the same text as before"""
+        cleaned = profanity_check.remove_profanity("well darn it all", "en")
+
+        # "darn" is removed first, so "darn it" no longer matches
+        self.assertEqual(cleaned, "well it all")
+
+    def test_05_duplicates_and_shared_suffixes(self):
+        """Test duplicates are reported per list entry"""
+        matcher = ProfanityMatcher(["she", "he", "hers", "he"])
+
+        self.assertEqual(matcher.found_words("ushers"), ["she", "he", "hers", "he"])
+
+    def test_06_non_ascii(self):
+        """Test word boundaries with non-ASCII letters"""
+        matcher = ProfanityMatcher(["đồ ngốc"])
+
+        found, cleaned = matcher.remove("Bạn là Đồ ngốc!")
+
+        self.assertEqual(found, ["đồ ngốc"])
+        self.assertEqual(cleaned, "Bạn là !")
+
+    def test_07_unsupported_language(self):
+        """Test unsupported language codes raise ValueError"""
+        with self.assertRaises(ValueError):
+            profanity_check.is_clean("text", "fr")
+
+    def test_08_punctuation_word_joins_neighbours(self):
+        """Test removing a punctuation-only word matches sequential removal"""
+        matcher = ProfanityMatcher(["-", "foo"])
+
+        found, cleaned = matcher.remove("foo-bar")
+
+        # "-" is removed first, so "foo" is no longer a separate word
+        self.assertEqual(found, ["-", "foo"])
+        self.assertEqual(cleaned, "foobar")
@@ -0,0 +1,99 @@
+import io
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from apis.modules import profanity_check, profanity_index
+
+
+class TestProfanityIndex(SimpleTestCase):
+    """Unit tests for the compiled profanity index snapshot"""
+
+    def setUp(self):
+        """Write small lists to a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_path = os.path.join(self.tmp.name, "lists")
+        self.index_path = os.path.join(self.tmp.name, "cache", "profanity.idx")
+        os.makedirs(self.base_path)
+        self.write_list("en", "Darn\nheck\n\nhe\ndarn it\n")
+        self.write_list("zh", "笨蛋\n")
+        self.saved = (
+            dict(profanity_check.PROFANITY_DICT),
+            dict(profanity_check.PROFANITY_MATCHERS),
+        )
+
+    def tearDown(self):
+        """Restore the loaded lists"""
+        profanity_check.PROFANITY_DICT.update(self.saved[0])
+        profanity_check.PROFANITY_MATCHERS.update(self.saved[1])
+        self.tmp.cleanup()
+
+    def write_list(self, lang, content):
+        with open(os.path.join(self.base_path, f"{lang}.txt"), "w") as f:
+            f.write(content)
+
+    def test_01_snapshot_matches_compiled_lists(self):
+        """Test a mapped snapshot behaves like the compiled lists"""
+        profanity_index.build(self.base_path, self.index_path)
+        matchers = profanity_index.load(self.base_path, self.index_path)
+
+        self.assertEqual(matchers["en"].words, ["darn", "heck", "he", "darn it"])
+        self.assertEqual(matchers["vi"].words, [])
+        self.assertIsInstance(matchers["en"].tables["fail"], memoryview)
+        compiled = profanity_check.ProfanityMatcher(matchers["en"].words)
+        for text in ["Oh HECK, darn!", "well darn it all", "A fox ran home."]:
+            self.assertEqual(matchers["en"].remove(text), compiled.remove(text))
+        self.assertEqual(matchers["zh"].found_words("你是笨蛋"), ["笨蛋"])
+
+    def test_02_stale_after_lists_change(self):
+        """Test a snapshot is ignored once a source list changes"""
+        profanity_index.build(self.base_path, self.index_path)
+        self.write_list("en", "darn\n")
+
+        self.assertIsNone(profanity_index.load(self.base_path, self.index_path))
+
+    def test_03_missing_or_corrupt_snapshot(self):
+        """Test missing and corrupt snapshots are not used"""
+        self.assertIsNone(profanity_index.load(self.base_path, self.index_path))
+
+        os.makedirs(os.path.dirname(self.index_path))
+        with open(self.index_path, "wb") as f:
+            f.write(profanity_index.MAGIC + b"\xff\xff")
+        self.assertIsNone(profanity_index.load(self.base_path, self.index_path))
+
+    def test_04_load_profanity_lists_uses_snapshot(self):
+        """Test load_profanity_lists maps an up-to-date snapshot"""
+        profanity_index.build(self.base_path, self.index_path)
+
+        profanity_check.load_profanity_lists(self.base_path, self.index_path)
+
+        self.assertIsInstance(
+            profanity_check.PROFANITY_MATCHERS["en"].tables["fail"], memoryview
+        )
+        self.assertEqual(
+            profanity_check.is_clean("Oh heck", "en"), (False, ["heck", "he"])
+        )
+
+    def test_05_load_profanity_lists_falls_back(self):
+        """Test load_profanity_lists compiles the lists without a snapshot"""
+        profanity_check.load_profanity_lists(self.base_path, self.index_path)
+
+        self.assertNotIsInstance(
+            profanity_check.PROFANITY_MATCHERS["en"].tables["fail"], memoryview
+        )
+        self.assertEqual(profanity_check.remove_profanity("oh darn", "en"), "oh")
+
+    def test_06_build_command(self):
+        """Test the build_profanity_index management command"""
+        out = io.StringIO()
+
+        call_command(
+            "build_profanity_index",
+            source=self.base_path,
+            output=self.index_path,
+            stdout=out,
+        )
+
+        self.assertIn("en: 4 words", out.getvalue())
+        self.assertIsNotNone(profanity_index.load(self.base_path, self.index_path))
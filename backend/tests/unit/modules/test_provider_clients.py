@@ -0,0 +1,37 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from apis.modules import provider_clients
+
+
+class TestProviderClients(SimpleTestCase):
+    """Unit tests for the per-loop provider clients"""
+
+    def test_01_clients_shared_per_loop(self):
+        """Test one loop reuses its clients and another loop gets new ones"""
+
+        async def get():
+            first = provider_clients.get_http_client()
+            self.assertIs(provider_clients.get_http_client(), first)
+            await provider_clients.aclose_clients()
+            return first
+
+        self.assertIsNot(asyncio.run(get()), asyncio.run(get()))
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    def test_02_aclose_clients(self):
+        """Test aclose_clients closes every HTTP client of the loop"""
+
+        async def run():
+            provider_clients.get_http_client()
+            provider_clients.get_openai_client()
+            owned = list(provider_clients._loop_clients()[provider_clients._OWNED])
+            await provider_clients.aclose_clients()
+            return owned
+
+        owned = asyncio.run(run())
+
+        self.assertEqual(len(owned), 2)
+        self.assertTrue(all(client.is_closed for client in owned))
@@ -0,0 +1,223 @@
+import asyncio
+import socket
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import openai
+import requests
+from django.test import SimpleTestCase, override_settings
+from pydantic import BaseModel, ValidationError
+from apis.modules import retry_policy
+from apis.modules.ocr_processor import OCRModule
+
+
+def api_error(status, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/audio/speech")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    if status == 429:
+        return openai.RateLimitError("rate limited", response=response, body=None)
+    if status >= 500:
+        return openai.InternalServerError("server error", response=response, body=None)
+    return openai.BadRequestError("bad request", response=response, body=None)
+
+
+def validation_error():
+    class Item(BaseModel):
+        word: str
+
+    try:
+        Item()
+    except ValidationError as e:
+        return e
+
+
+@override_settings(
+    RETRY_MAX_ATTEMPTS=3,
+    RETRY_BASE_DELAY=0.5,
+    RETRY_MAX_DELAY=8,
+    BREAKER_FAILURE_THRESHOLD=3,
+    BREAKER_RESET_TIMEOUT=30,
+)
+class TestRetryPolicy(SimpleTestCase):
+    """Unit tests for provider retries and circuit breakers"""
+
+    def setUp(self):
+        retry_policy.reset()
+
+    def tearDown(self):
+        retry_policy.reset()
+
+    def acall(self, attempt, name="model"):
+        return asyncio.run(retry_policy.acall(name, attempt))
+
+    def test_01_classify(self):
+        """Test 429 / 5xx / connection errors are transient, other 4xx fatal"""
+        request = httpx.Request("POST", "https://api.openai.com/v1")
+
+        self.assertEqual(retry_policy.classify(api_error(429)), retry_policy.TRANSIENT)
+        self.assertEqual(retry_policy.classify(api_error(503)), retry_policy.TRANSIENT)
+        self.assertEqual(
+            retry_policy.classify(openai.APIConnectionError(request=request)),
+            retry_policy.TRANSIENT,
+        )
+        self.assertEqual(retry_policy.classify(api_error(400)), retry_policy.FATAL)
+        self.assertEqual(
+            retry_policy.classify(validation_error()), retry_policy.INVALID
+        )
+
+    def test_02_retry_after(self):
+        """Test Retry-After in milliseconds, seconds and as an HTTP date"""
+        self.assertEqual(
+            retry_policy.retry_after(api_error(429, {"retry-after-ms": "1500"})), 1.5
+        )
+        self.assertEqual(
+            retry_policy.retry_after(api_error(429, {"retry-after": "2"})), 2
+        )
+        date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+        self.assertAlmostEqual(
+            retry_policy.retry_after(api_error(503, {"retry-after": date})), 60, delta=2
+        )
+        self.assertIsNone(retry_policy.retry_after(api_error(503)))
+
+    @patch("apis.modules.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    def test_03_transient_errors_are_retried(self, mock_sleep):
+        """Test transient errors wait for Retry-After or a jittered backoff"""
+        attempt = AsyncMock(
+            side_effect=[api_error(429, {"retry-after": "2"}), api_error(503), "ok"]
+        )
+
+        self.assertEqual(self.acall(attempt), "ok")
+
+        self.assertEqual(attempt.await_count, 3)
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        self.assertEqual(delays[0], 2)
+        self.assertTrue(0 <= delays[1] <= 1.0)
+        self.assertEqual(retry_policy.stats()["model"]["state"], retry_policy.CLOSED)
+
+    @patch("apis.modules.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    def test_04_fatal_and_long_retry_after_give_up(self, mock_sleep):
+        """Test fatal errors and a Retry-After beyond the max delay are raised"""
+        attempt = AsyncMock(side_effect=api_error(400))
+        with self.assertRaises(openai.BadRequestError):
+            self.acall(attempt)
+        self.assertEqual(attempt.await_count, 1)
+
+        attempt = AsyncMock(side_effect=api_error(429, {"retry-after": "120"}))
+        with self.assertRaises(openai.RateLimitError):
+            self.acall(attempt)
+        self.assertEqual(attempt.await_count, 1)
+        mock_sleep.assert_not_awaited()
+
+    @patch("apis.modules.retry_policy.time.sleep")
+    def test_05_invalid_output_is_retried_at_once(self, mock_sleep):
+        """Test validation errors are retried without a delay or breaker failure"""
+        attempt = MagicMock(side_effect=[validation_error(), "ok"])
+
+        self.assertEqual(retry_policy.call("model", attempt), "ok")
+
+        mock_sleep.assert_called_once_with(0.0)
+        self.assertEqual(retry_policy.stats()["model"]["failures"], 0)
+
+    @patch("apis.modules.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    def test_06_breaker_opens_and_fails_fast(self, mock_sleep):
+        """Test consecutive transient failures open the breaker until a probe passes"""
+        attempt = AsyncMock(side_effect=api_error(500))
+        with self.assertRaises(openai.InternalServerError):
+            self.acall(attempt)
+        self.assertEqual(attempt.await_count, 3)
+
+        with self.assertRaises(retry_policy.CircuitOpenError):
+            self.acall(attempt)
+        self.assertEqual(attempt.await_count, 3)
+        stats = retry_policy.stats()["model"]
+        self.assertEqual(stats["state"], retry_policy.OPEN)
+        self.assertEqual(stats["rejected"], 1)
+
+        # Other models are unaffected
+        self.assertEqual(self.acall(AsyncMock(return_value="ok"), name="other"), "ok")
+
+        with override_settings(BREAKER_RESET_TIMEOUT=0):
+            self.assertEqual(self.acall(AsyncMock(return_value="ok")), "ok")
+        self.assertEqual(retry_policy.stats()["model"]["state"], retry_policy.CLOSED)
+
+    def test_07_half_open_probe_failure_reopens(self):
+        """Test a failed probe reopens the breaker"""
+        breaker = retry_policy.breaker("model")
+        for _ in range(3):
+            breaker.record_failure()
+
+        with override_settings(BREAKER_RESET_TIMEOUT=0):
+            breaker.allow()
+            self.assertEqual(breaker.state, retry_policy.HALF_OPEN)
+            with self.assertRaises(retry_policy.CircuitOpenError):
+                breaker.allow()
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, retry_policy.OPEN)
+        with self.assertRaises(retry_policy.CircuitOpenError):
+            breaker.allow()
+
+    def test_08_classify_network_errors_and_local_bugs(self):
+        """Test network errors and timeouts are transient, unknown errors fatal"""
+        request = httpx.Request("POST", "https://api.openai.com/v1")
+
+        for exc in (
+            openai.APITimeoutError(request=request),
+            httpx.ConnectError("refused", request=request),
+            httpx.ReadTimeout("timed out", request=request),
+            asyncio.TimeoutError(),
+            ConnectionResetError(),
+            socket.gaierror(),
+        ):
+            self.assertEqual(retry_policy.classify(exc), retry_policy.TRANSIENT, exc)
+        for exc in (KeyError("audio"), TypeError(), FileNotFoundError()):
+            self.assertEqual(retry_policy.classify(exc), retry_policy.FATAL, exc)
+
+    def test_09_local_error_is_not_retried(self):
+        """Test a local bug is raised at once and leaves the breaker alone"""
+        attempt = MagicMock(side_effect=KeyError("audio"))
+
+        with self.assertRaises(KeyError):
+            retry_policy.call("model", attempt)
+
+        self.assertEqual(attempt.call_count, 1)
+        self.assertEqual(retry_policy.stats()["model"]["failures"], 0)
+
+    def test_10_classify_requests_errors(self):
+        """Test requests' timeouts and HTTP errors are classified like httpx's"""
+        response = requests.Response()
+        response.status_code = 503
+
+        for exc in (
+            requests.ReadTimeout(),
+            requests.ConnectTimeout(),
+            requests.ConnectionError(),
+            requests.HTTPError(response=response),
+        ):
+            self.assertEqual(retry_policy.classify(exc), retry_policy.TRANSIENT, exc)
+        response.status_code = 401
+        self.assertEqual(
+            retry_policy.classify(requests.HTTPError(response=response)),
+            retry_policy.FATAL,
+        )
+
+    @patch("apis.modules.retry_policy.time.sleep")
+    @patch("apis.modules.ocr_processor.requests.post")
+    def test_11_ocr_request_is_retried(self, mock_post, mock_sleep):
+        """Test a Clova request goes through the "ocr" retry policy"""
+        failed = requests.Response()
+        failed.status_code = 503
+        ok = requests.Response()
+        ok.status_code = 200
+        ok._content = b'{"images": []}'
+        mock_post.side_effect = [requests.ReadTimeout(), failed, ok]
+        ocr = OCRModule()
+
+        with patch.object(ocr, "_parse_infer_text", return_value=[]) as parse:
+            self.assertEqual(ocr.process_page(__file__), [])
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        parse.assert_called_once_with({"images": []})
+        self.assertEqual(retry_policy.stats()["ocr"]["failures"], 2)
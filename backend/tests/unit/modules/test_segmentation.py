@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+import kss
+from django.test import SimpleTestCase, override_settings
+from apis.modules import segmentation
+
+
+class TestSegmentation(SimpleTestCase):
+    """Unit tests for the memoized sentence segmentation layer"""
+
+    def setUp(self):
+        """Start every test with an empty cache"""
+        segmentation.clear_cache()
+
+    def tearDown(self):
+        """Leave no cached paragraphs behind"""
+        segmentation.clear_cache()
+
+    def test_01_rule_based_agrees_with_kss(self):
+        """Test paragraphs accepted by the rules split exactly like kss"""
+        paragraphs = [
+            "옛날 옛적에 작은 여우가 살았어요",
+            "여우가 뛰었어요. 토끼가 웃었어요!",
+            "숲속 친구들이 모두 모였어요? 정말 멋진 하루였어.",
+        ]
+        for text in paragraphs:
+            self.assertEqual(
+                segmentation.split_rule_based(text), kss.split_sentences(text)
+            )
+
+        # Inner nominal endings (final ㅁ) end a sentence for kss
+        for text in [
+            "날씨 맑음 바람 없음.",
+            "오늘 맑음 내일 비.",
+            "정답임 다음 문제로.",
+            "배가 고픔 밥을 먹음.",
+        ]:
+            self.assertIsNone(segmentation.split_rule_based(text))
+            self.assertEqual(
+                segmentation.split_sentences(text), kss.split_sentences(text)
+            )
+
+    def test_02_rule_based_declines_ambiguous_text(self):
+        """Test quotes, inner punctuation, run-on and unclear endings go to kss"""
+        for text in [
+            '여우가 말했어요. "안녕?" 토끼가 웃었어요.',
+            "Mr. 김이 왔어요.",
+            "정말요?! 네...그래요",
+            "배고파요 밥 주세요",
+            "모두 함께. 잠을 잤어요.",
+            "그래서. 엄마가 웃었어요!",
+        ]:
+            self.assertIsNone(segmentation.split_rule_based(text))
+
+        with override_settings(SEGMENTATION_RULE_MAX_CHARS=5):
+            self.assertIsNone(
+                segmentation.split_rule_based("옛날 옛적에 여우가 살았어요")
+            )
+
+    def test_03_memoized_per_normalized_paragraph(self):
+        """Test repeated paragraphs are served from the cache"""
+        text = "여우가 뛰었다 토끼가 웃었다"
+        expected = kss.split_sentences(text)
+
+        with patch.object(
+            segmentation, "_kss_split", wraps=segmentation._kss_split
+        ) as mock_split:
+            first = segmentation.split_sentences(text)
+            second = segmentation.split_sentences(f"  {text}\r\n")
+
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        mock_split.assert_called_once()
+        info = segmentation.cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 1, 1))
+
+    def test_04_batch_uses_one_kss_call(self):
+        """Test a page is segmented with a single kss call"""
+        paragraphs = ["배고파요 밥 주세요", "", "안녕!", "여우가 뛰었다 토끼가 웃었다"]
+
+        with patch.object(
+            segmentation, "_kss_split", wraps=segmentation._kss_split
+        ) as mock_split:
+            results = segmentation.split_paragraphs(paragraphs)
+
+        mock_split.assert_called_once_with(
+            ["배고파요 밥 주세요", "여우가 뛰었다 토끼가 웃었다"]
+        )
+        self.assertEqual(results, [kss.split_sentences(p) for p in paragraphs])
+        self.assertEqual(segmentation.cache_info()["rule_based"], 1)
+
+    @override_settings(SEGMENTATION_CACHE_SIZE=2)
+    def test_05_cache_is_bounded(self):
+        """Test the least recently used paragraph is evicted"""
+        segmentation.split_paragraphs(["하나.", "둘.", "셋."])
+
+        self.assertEqual(segmentation.cache_info()["size"], 2)
+        self.assertNotIn("하나.", segmentation._cache)
@@ -0,0 +1,85 @@
+import io
+import sys
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+from apis.modules import startup
+
+
+class TestStartup(SimpleTestCase):
+    """Unit tests for lazy imports and the import profile"""
+
+    def profile(self, seconds=0.2, loaded=()):
+        return {
+            "seconds": seconds,
+            "loaded": list(loaded),
+            "imports": [("apis", 900, 5000), ("django.urls", 300, 1200)],
+        }
+
+    def test_01_boot_keeps_heavy_modules_lazy(self):
+        """Test booting and importing the URLconf loads no lazy module"""
+        result = startup.profile_imports("app.urls")
+
+        self.assertEqual(result["loaded"], [])
+        self.assertGreater(result["seconds"], 0)
+        names = [name for name, _, _ in result["imports"]]
+        self.assertIn("apis.controller.process_controller.views", names)
+
+    def test_02_preload_imports_lazy_modules(self):
+        """Test preload imports every lazy module"""
+        timings = startup.preload()
+
+        self.assertEqual(list(timings), list(startup.LAZY_MODULES))
+        for name in startup.LAZY_MODULES:
+            self.assertIn(name, sys.modules)
+
+    @patch("apis.modules.startup.profile_imports")
+    def test_03_command_reports_heaviest_imports(self, mock_profile):
+        """Test the command lists imports by cumulative time"""
+        mock_profile.return_value = self.profile()
+        out = io.StringIO()
+
+        call_command("profile_imports", budget_ms=1000, stdout=out)
+
+        report = out.getvalue()
+        self.assertLess(report.index("apis"), report.index("django.urls"))
+        self.assertIn("Within budget", report)
+
+    @patch("apis.modules.startup.profile_imports")
+    def test_04_command_fails_over_budget(self, mock_profile):
+        """Test the command fails on a slow boot or an eager heavy import"""
+        mock_profile.return_value = self.profile(seconds=2.0)
+        with self.assertRaises(CommandError):
+            call_command("profile_imports", budget_ms=1000, stdout=io.StringIO())
+
+        mock_profile.return_value = self.profile(loaded=["sklearn.cluster"])
+        with self.assertRaisesMessage(CommandError, "sklearn.cluster"):
+            call_command("profile_imports", budget_ms=1000, stdout=io.StringIO())
+
+    def test_05_warmup_command(self):
+        """Test the warmup command runs every step but the skipped ones"""
+        calls = []
+        steps = tuple(
+            (name, lambda name=name: calls.append(name))
+            for name in ("imports", "chains", "connections")
+        )
+        out = io.StringIO()
+
+        with patch.object(startup, "WARM_UP_STEPS", steps):
+            call_command("warmup", skip=["connections"], stdout=out)
+
+        self.assertEqual(calls, ["imports", "chains"])
+        self.assertIn("Warm", out.getvalue())
+        self.assertTrue(startup.is_ready())
+
+    def test_06_warmup_command_fails_on_step_error(self):
+        """Test the warmup command fails when a step raises"""
+
+        def fail():
+            raise RuntimeError("no api key")
+
+        with patch.object(startup, "WARM_UP_STEPS", (("chains", fail),)):
+            with self.assertRaisesMessage(CommandError, "chains"):
+                call_command("warmup", stdout=io.StringIO())
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase
+from apis.modules import tts_routing
+from apis.modules.tts_processor import TTSModule
+
+
+class TestTTSRouting(SimpleTestCase):
+    """Unit tests for TTS model tiering"""
+
+    LONG = "The little fox walked slowly through the quiet forest at night."
+
+    def setUp(self):
+        tts_routing.reset_stats()
+
+    def tearDown(self):
+        tts_routing.reset_stats()
+
+    def test_01_lite_candidates(self):
+        """Test short lines, refrains and interjections are lite candidates"""
+        refrain = "Run, run, as fast as you can!"
+        routing = tts_routing.PageRouting([self.LONG, refrain, refrain], "en")
+
+        self.assertTrue(routing.is_lite_candidate("Yes."))
+        self.assertTrue(routing.is_lite_candidate(refrain))
+        self.assertTrue(routing.is_lite_candidate("Oh, wow... hooray!"))
+        self.assertFalse(routing.is_lite_candidate(self.LONG))
+
+    def test_02_policies(self):
+        """Test the full and lite policies"""
+        full = tts_routing.PageRouting([], "en", policy=tts_routing.FULL)
+        lite = tts_routing.PageRouting([], "en", policy=tts_routing.LITE)
+
+        self.assertEqual(full.choose("Wow!"), tts_routing.FULL)
+        self.assertEqual(lite.choose("Wow!"), tts_routing.LITE)
+        self.assertEqual(lite.choose(self.LONG), tts_routing.FULL)
+
+    def test_03_adaptive_policy_follows_budget(self):
+        """Test adaptive routing keeps the full model while the budget allows"""
+        routing = tts_routing.PageRouting(
+            [], "en", paragraphs=3, policy="adaptive", budget=10
+        )
+
+        with patch.object(tts_routing, "expected_latency", return_value=3.0):
+            self.assertEqual(routing.choose("Wow!"), tts_routing.FULL)
+        with patch.object(tts_routing, "expected_latency", return_value=4.0):
+            self.assertEqual(routing.choose("Wow!"), tts_routing.LITE)
+            routing.paragraph_done()
+            self.assertEqual(routing.choose("Wow!"), tts_routing.FULL)
+            self.assertEqual(routing.choose(self.LONG), tts_routing.FULL)
+
+        self.assertEqual(routing.tiers, {tts_routing.FULL: 3, tts_routing.LITE: 1})
+
+    def test_04_stats(self):
+        """Test calls are recorded per tier with latency and cost"""
+        tts_routing.record(tts_routing.FULL, 2.0, 1000, True)
+        tts_routing.record(tts_routing.FULL, -1.0, 1000, False)
+        tts_routing.record(tts_routing.LITE, 1.0, 1000, True)
+        tts_routing.record(tts_routing.LITE, 0.0, 4, True, reused=True)
+
+        stats = tts_routing.stats()
+        self.assertEqual(stats["full"]["calls"], 2)
+        self.assertEqual(stats["full"]["failures"], 1)
+        self.assertEqual(stats["full"]["chars"], 1000)
+        self.assertEqual(stats["full"]["cost_usd"], 0.017)
+        self.assertEqual(stats["lite"]["cost_usd"], 0.015)
+        self.assertEqual(stats["full"]["latency"]["count"], 1)
+        self.assertEqual(stats["lite"]["reused"], 1)
+        self.assertEqual(stats["lite"]["calls"], 1)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+    def test_05_run_tts_only_routes_sentences(self):
+        """Test run_tts_only sends candidates to the lite model and reuses refrains"""
+        client = MagicMock()
+        client.audio.speech.create = AsyncMock(
+            side_effect=lambda model, **kwargs: MagicMock(content=model.encode())
+        )
+        sentences = [
+            {"translation": text, "tone": "calm", "pacing": "slow", "emotion": "joy"}
+            for text in (self.LONG, "Wow!", "Wow!")
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tts = TTSModule(
+                out_dir=os.path.join(tmp, "audio"),
+                log_dir=os.path.join(tmp, "log"),
+                client=client,
+            )
+            routing = tts_routing.PageRouting(
+                [s["translation"] for s in sentences], "en", policy=tts_routing.LITE
+            )
+            clips = asyncio.run(
+                tts.run_tts_only(
+                    {"sentences": sentences}, "session", 0, 0, "alloy", routing=routing
+                )
+            )
+
+        self.assertEqual(len(clips), 3)
+        self.assertEqual(
+            sorted(
+                c.kwargs["model"] for c in client.audio.speech.create.call_args_list
+            ),
+            ["gpt-4o-mini-tts", "tts-1"],
+        )
+        self.assertEqual(tts_routing.stats()["lite"]["reused"], 1)
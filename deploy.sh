@@ -38,27 +38,54 @@ echo "--- DB Migration 시작 ---"
 
 echo "--- DB Migration 완료 ---"
 
+# --- [3-1] 욕설 필터 인덱스 빌드 ---
+# worker 들은 시작 시 이 스냅샷을 mmap 으로 공유한다 (목록이 바뀌면 다시 빌드)
+"$PYTHON_EXECUTABLE" "$BACKEND_DIR/manage.py" build_profanity_index
+
+
+
+# --- [4] 서버 실행 / 무중단 재시작 (gunicorn) ---
+# 실행 중인 gunicorn 이 있으면 HUP 으로 graceful reload:
+# 새 worker 가 새 코드를 띄우고, 기존 worker 는 진행 중인 업로드와
+# TTS 작업을 마친 뒤 종료된다.
+echo "--- 서버 실행 (gunicorn) ---"
+export GUNICORN="./backend/venv/bin/gunicorn"
+export SERVER_LOG
+
+# 이 시각 이후에 부팅한 worker 만 새 세대로 본다
+RELOAD_AT=$(date +%s)
+
+if ./scripts/serve.sh status > /dev/null; then
+    ./scripts/serve.sh reload
+else
+    # 이전 runserver 프로세스가 포트를 점유하고 있으면 종료
+    lsof -t -i:$DJANGO_PORT | while read PID; do
+        echo "DEBUG: 기존 PID $PID 종료 시도 중..."
+        kill -TERM $PID
+    done
+    sleep 2
+    GUNICORN_BIND="0.0.0.0:$DJANGO_PORT" ./scripts/serve.sh start
+fi
 
-
-# --- [4] 기존 서버 프로세스 종료 ---
-echo "--- 기존 서버 프로세스 종료 ---"
-lsof -t -i:$DJANGO_PORT | while read PID; do
-    echo "DEBUG: 기존 PID $PID 종료 시도 중..."
-    kill -9 $PID
-    if [ $? -eq 0 ]; then
-        echo "PID $PID (포트 $DJANGO_PORT) 종료됨"
-    else
-        echo "WARNING: PID $PID 종료 실패."
+# 새 worker 가 warm-up 을 마칠 때까지 대기 (최대 60초)
+# HUP reload 직후에는 기존 worker 도 ready 를 응답하므로, 응답한 worker 의
+# booted_at 이 reload 시각 이후인지까지 확인한다
+READY=0
+for i in $(seq 1 60); do
+    BODY=$(curl -s "http://127.0.0.1:$DJANGO_PORT/healthz/ready")
+    if echo "$BODY" | "$PYTHON_EXECUTABLE" -c '
+import json, sys
+state = json.load(sys.stdin)
+sys.exit(0 if state["status"] == "ready" and state["booted_at"] >= float(sys.argv[1]) else 1)
+' "$RELOAD_AT" 2> /dev/null; then
+        READY=1
+        echo "--- warm-up 완료 (/healthz/ready) ---"
+        break
     fi
+    sleep 1
 done
-sleep 2 
-
-
-# --- [5] 새 서버 실행 ---
-echo "--- 새 서버 프로세스 실행 ---"
-rm -f "$SERVER_LOG"
-nohup "$PYTHON_EXECUTABLE" "$BACKEND_DIR/manage.py" runserver 0.0.0.0:$DJANGO_PORT > "$SERVER_LOG" 2>&1 &
-
-sleep 5 
+if [ $READY -ne 1 ]; then
+    echo "::warning::새 worker 가 60초 안에 ready 가 되지 않음: $BODY"
+fi
 echo "--- 서버 재시작 완료 ---"
 echo "--- 배포 종료: $(date) ---"
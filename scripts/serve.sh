@@ -0,0 +1,81 @@
+#!/bin/bash
+# Production launcher for the Django backend (gunicorn).
+#
+# Usage: scripts/serve.sh {start|reload|stop|status}
+#   start   start gunicorn in the background (no-op if already running)
+#   reload  graceful reload: new workers pick up new code, old workers
+#           finish in-flight uploads and drain TTS jobs before exiting
+#   stop    graceful shutdown (same draining as reload)
+#
+# Environment:
+#   GUNICORN_WORKER_CLASS  gthread (default, WSGI) or
+#                          uvicorn.workers.UvicornWorker (ASGI)
+#   GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_BIND, GUNICORN_TIMEOUT,
+#   GUNICORN_GRACEFUL_TIMEOUT  see backend/gunicorn.conf.py
+
+REPO_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+BACKEND_DIR="$REPO_DIR/backend"
+GUNICORN="${GUNICORN:-$BACKEND_DIR/venv/bin/gunicorn}"
+PID_FILE="${PID_FILE:-/tmp/storybridge-gunicorn.pid}"
+SERVER_LOG="${SERVER_LOG:-$BACKEND_DIR/server.log}"
+
+if [[ "$GUNICORN_WORKER_CLASS" == uvicorn* ]]; then
+    APP="app.asgi:application"
+else
+    APP="app.wsgi:application"
+fi
+
+is_running() {
+    [ -f "$PID_FILE" ] && kill -0 "$(cat "$PID_FILE")" 2>/dev/null
+}
+
+# Same working directory as the old runserver so media/ paths stay valid
+cd "$REPO_DIR" || exit 1
+
+case "$1" in
+    start)
+        if is_running; then
+            echo "gunicorn already running (PID $(cat "$PID_FILE"))"
+            exit 0
+        fi
+        "$GUNICORN" -c "$BACKEND_DIR/gunicorn.conf.py" "$APP" \
+            --pid "$PID_FILE" --daemon \
+            --access-logfile "$SERVER_LOG" --error-logfile "$SERVER_LOG"
+        sleep 2
+        if is_running; then
+            echo "gunicorn started (PID $(cat "$PID_FILE"), $APP)"
+        else
+            echo "::error::gunicorn failed to start, see $SERVER_LOG"
+            exit 1
+        fi
+        ;;
+    reload)
+        if is_running; then
+            kill -HUP "$(cat "$PID_FILE")"
+            echo "gunicorn graceful reload requested (PID $(cat "$PID_FILE"))"
+        else
+            exec "$0" start
+        fi
+        ;;
+    stop)
+        if is_running; then
+            PID="$(cat "$PID_FILE")"
+            kill -TERM "$PID"
+            # Wait for workers to drain in-flight requests and TTS jobs
+            while kill -0 "$PID" 2>/dev/null; do sleep 1; done
+            echo "gunicorn stopped"
+        fi
+        ;;
+    status)
+        if is_running; then
+            echo "running (PID $(cat "$PID_FILE"))"
+        else
+            echo "stopped"
+            exit 1
+        fi
+        ;;
+    *)
+        echo "Usage: $0 {start|reload|stop|status}"
+        exit 2
+        ;;
+esac